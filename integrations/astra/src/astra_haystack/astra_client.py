@@ -1,12 +1,50 @@
 import json
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
+import httpx
 import requests
 from pydantic.dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Responses with these status codes are retried with an exponential backoff
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def _json_default(value: Any) -> Any:
+    # NumPy arrays and scalars, such as the embeddings of embedders with an embedding_dtype
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def _dumps(payload: Any) -> Union[str, bytes]:
+    """
+    Serializes a request body, using orjson when it's installed.
+    """
+    if orjson is not None:
+        # orjson falls back to the default for the arrays it can't serialize natively
+        return orjson.dumps(payload, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, default=_json_default)
+
+
+def _loads(content: Union[str, bytes]) -> Any:
+    """
+    Parses a response body, using orjson when it's installed.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 @dataclass
 class Response:
@@ -39,7 +77,17 @@ class AstraClient:
         collection_name: str,
         embedding_dim: int,
         similarity_function: str,
+        pool_maxsize: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
     ):
+        """
+        :param pool_maxsize: Maximum number of connections kept open to the Astra JSON API.
+            Should be at least the number of threads using this client concurrently.
+        :param max_retries: How many times a request is retried after a connection error
+            or a 429/5xx response.
+        :param backoff_factor: Factor of the exponential backoff between retries, in seconds.
+        """
         self.astra_id = astra_id
         self.astra_application_token = astra_application_token
         self.astra_region = astra_region
@@ -56,6 +104,20 @@ class AstraClient:
         self.create_url = (
             f"https://{self.astra_id}-{self.astra_region}.apps.astra.datastax.com/api/json/v1/{self.keyspace_name}"
         )
+        # All the requests go through a single session, so connections are kept alive and reused
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["POST"]),
+            raise_on_status=False,
+        )
+        self._session = requests.Session()
+        self._session.headers.update(self.request_header)
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry))
+        self._session.mount("http://", HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry))
+        # The async client is created on first use, so that it's bound to the running event loop
+        self._async_client: Optional[httpx.AsyncClient] = None
 
         index_exists = self.find_index()
         if not index_exists:
@@ -63,9 +125,7 @@ class AstraClient:
 
     def find_index(self):
         find_query = {"findCollections": {"options": {"explain": True}}}
-        response = requests.request("POST", self.create_url, headers=self.request_header, data=json.dumps(find_query))
-        response.raise_for_status()
-        response_dict = json.loads(response.text)
+        response_dict = self._post(self.create_url, find_query)
 
         if "status" in response_dict:
             collection_name_matches = list(
@@ -87,7 +147,7 @@ class AstraClient:
                 raise Exception(msg)
 
         else:
-            msg = f"status not in response: {response.text}"
+            msg = f"status not in response: {response_dict}"
             raise Exception(msg)
 
         return True
@@ -99,12 +159,10 @@ class AstraClient:
                 "options": {"vector": {"dimension": self.embedding_dim, "metric": self.similarity_function}},
             }
         }
-        response = requests.request("POST", self.create_url, headers=self.request_header, data=json.dumps(create_query))
-        response.raise_for_status()
-        response_dict = json.loads(response.text)
+        response_dict = self._post(self.create_url, create_query)
         if "errors" in response_dict:
             raise Exception(response_dict["errors"])
-        logger.info(f"Collection {self.collection_name} created: {response.text}")
+        logger.info(f"Collection {self.collection_name} created: {response_dict}")
 
     def query(
         self,
@@ -145,9 +203,33 @@ class AstraClient:
 
         return formatted_response
 
+    async def query_async(
+        self,
+        vector: Optional[List[float]] = None,
+        query_filter: Optional[Dict[str, Union[str, float, int, bool, List, dict]]] = None,
+        top_k: Optional[int] = None,
+        include_metadata: Optional[bool] = None,
+        include_values: Optional[bool] = None,
+    ) -> QueryResponse:
+        """
+        Async version of `query`, see its documentation for the arguments.
+        """
+        responses = await self.find_documents_async(self._find_query(vector, top_k, query_filter))
+
+        return self._format_query_response(responses, include_metadata, include_values)
+
     def _query_without_vector(self, top_k, filters=None):
-        query = {"filter": filters, "options": {"limit": top_k}}
-        return self.find_documents(query)
+        return self.find_documents(self._find_query(None, top_k, filters))
+
+    @staticmethod
+    def _find_query(vector, top_k, filters=None):
+        # Shared by the sync and async queries, so they always send the same request
+        if vector is None:
+            return {"filter": filters, "options": {"limit": top_k}}
+        query = {"sort": {"$vector": vector}, "options": {"limit": top_k, "includeSimilarity": True}}
+        if filters is not None:
+            query["filter"] = filters
+        return query
 
     @staticmethod
     def _format_query_response(responses, include_metadata, include_values):
@@ -165,22 +247,20 @@ class AstraClient:
         return QueryResponse(final_res)
 
     def _query(self, vector, top_k, filters=None):
-        query = {"sort": {"$vector": vector}, "options": {"limit": top_k, "includeSimilarity": True}}
-        if filters is not None:
-            query["filter"] = filters
-        result = self.find_documents(query)
+        result = self.find_documents(self._find_query(vector, top_k, filters))
         return result
 
     def find_documents(self, find_query):
-        query = json.dumps({"find": find_query})
-        response = requests.request(
-            "POST",
-            self.request_url,
-            headers=self.request_header,
-            data=query,
-        )
-        response.raise_for_status()
-        response_dict = json.loads(response.text)
+        response_dict = self._post(self.request_url, {"find": find_query})
+        if "errors" in response_dict:
+            raise Exception(response_dict["errors"])
+        if "data" in response_dict and "documents" in response_dict["data"]:
+            return response_dict["data"]["documents"]
+        else:
+            logger.warning(f"No documents found: {response_dict}")
+
+    async def find_documents_async(self, find_query):
+        response_dict = await self._post_async({"find": find_query})
         if "errors" in response_dict:
             raise Exception(response_dict["errors"])
         if "data" in response_dict and "documents" in response_dict["data"]:
@@ -188,6 +268,32 @@ class AstraClient:
         else:
             logger.warning(f"No documents found: {response_dict}")
 
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Returns the `httpx.AsyncClient` shared by all the async methods, creating it on first use.
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(headers=self.request_header)
+        return self._async_client
+
+    async def close_async(self):
+        """
+        Closes the connections of the async client, if it has been created.
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def _post(self, url: str, payload: Dict) -> Dict:
+        response = self._session.post(url, data=_dumps(payload))
+        response.raise_for_status()
+        return _loads(response.content)
+
+    async def _post_async(self, payload: Dict) -> Dict:
+        response = await self._get_async_client().post(self.request_url, content=_dumps(payload))
+        response.raise_for_status()
+        return _loads(response.content)
+
     def get_documents(self, ids: List[str], batch_size: int = 20) -> QueryResponse:
         document_batch = []
 
@@ -203,15 +309,9 @@ class AstraClient:
         return formatted_docs
 
     def insert(self, documents: List[Dict]):
-        query = json.dumps({"insertMany": {"options": {"ordered": False}, "documents": documents}})
-        response = requests.request(
-            "POST",
-            self.request_url,
-            headers=self.request_header,
-            data=query,
+        response_dict = self._post(
+            self.request_url, {"insertMany": {"options": {"ordered": False}, "documents": documents}}
         )
-        response.raise_for_status()
-        response_dict = json.loads(response.text)
 
         inserted_ids = (
             response_dict["status"]["insertedIds"]
@@ -224,30 +324,23 @@ class AstraClient:
 
     def update_document(self, document: Dict, id_key: str):
         document_id = document.pop(id_key)
-        query = json.dumps(
+        response_dict = self._post(
+            self.request_url,
             {
                 "findOneAndUpdate": {
                     "filter": {id_key: document_id},
                     "update": {"$set": document},
                     "options": {"returnDocument": "after"},
                 }
-            }
+            },
         )
-        response = requests.request(
-            "POST",
-            self.request_url,
-            headers=self.request_header,
-            data=query,
-        )
-        response.raise_for_status()
-        response_dict = json.loads(response.text)
         document[id_key] = document_id
 
         if "status" in response_dict and "errors" not in response_dict:
             if "matchedCount" in response_dict["status"] and "modifiedCount" in response_dict["status"]:
                 if response_dict["status"]["matchedCount"] == 1 and response_dict["status"]["modifiedCount"] == 1:
                     return True
-        logger.warning(f"Documents {document_id} not updated in Astra {response.text}")
+        logger.warning(f"Documents {document_id} not updated in Astra {response_dict}")
         return False
 
     def delete(
@@ -266,14 +359,7 @@ class AstraClient:
         deletion_counter = 0
         moredata = True
         while moredata:
-            response = requests.request(
-                "POST",
-                self.request_url,
-                headers=self.request_header,
-                data=json.dumps(query),
-            )
-            response.raise_for_status()
-            response_dict = response.json()
+            response_dict = self._post(self.request_url, query)
             if "errors" in response_dict:
                 raise Exception(response_dict["errors"])
             if "moreData" not in response_dict.get("status", {}):
@@ -286,13 +372,16 @@ class AstraClient:
         """
         Returns how many documents are present in the document store.
         """
-        response = requests.request(
-            "POST",
-            self.request_url,
-            headers=self.request_header,
-            data=json.dumps({"countDocuments": {}}),
-        )
-        response.raise_for_status()
-        if "errors" in response.json():
-            raise Exception(response.json()["errors"])
-        return response.json()["status"]["count"]
+        response_dict = self._post(self.request_url, {"countDocuments": {}})
+        if "errors" in response_dict:
+            raise Exception(response_dict["errors"])
+        return response_dict["status"]["count"]
+
+    async def count_documents_async(self) -> int:
+        """
+        Asynchronously returns how many documents are present in the document store.
+        """
+        response_dict = await self._post_async({"countDocuments": {}})
+        if "errors" in response_dict:
+            raise Exception(response_dict["errors"])
+        return response_dict["status"]["count"]
@@ -3,8 +3,9 @@
 # SPDX-License-Identifier: Apache-2.0
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Union
 
 import pandas as pd
 from haystack import default_from_dict, default_to_dict
@@ -46,6 +47,9 @@ class AstraDocumentStore:
         embedding_dim: Optional[int] = 768,
         duplicates_policy: DuplicatePolicy = DuplicatePolicy.NONE,
         similarity: str = "cosine",
+        write_concurrency: int = 1,
+        pool_maxsize: int = 10,
+        max_retries: int = 3,
     ):
         """
         The connection to Astra DB is established and managed through the JSON API.
@@ -67,7 +71,14 @@ class AstraDocumentStore:
               - `DuplicatePolicy.SKIP`: If a Document with the same id already exists, it is skipped and not written.
               - `DuplicatePolicy.OVERWRITE`: If a Document with the same id already exists, it is overwritten.
               - `DuplicatePolicy.FAIL`: If a Document with the same id already exists, an error is raised.
+        :param write_concurrency: Number of `insertMany` requests sent in parallel by `write_documents`.
+            The default of 1 sends the batches one after the other.
+        :param pool_maxsize: Maximum number of connections kept open to the Astra JSON API.
+        :param max_retries: How many times a request is retried after a connection error or a 429/5xx response.
         """
+        if write_concurrency < 1:
+            msg = f"write_concurrency must be at least 1, got {write_concurrency}"
+            raise ValueError(msg)
 
         self.duplicates_policy = duplicates_policy
         self.astra_id = astra_id
@@ -77,6 +88,9 @@ class AstraDocumentStore:
         self.astra_collection = astra_collection
         self.embedding_dim = embedding_dim
         self.similarity = similarity
+        self.write_concurrency = write_concurrency
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
 
         self.index = AstraClient(
             astra_id=self.astra_id,
@@ -86,6 +100,8 @@ class AstraDocumentStore:
             collection_name=self.astra_collection,
             embedding_dim=self.embedding_dim,
             similarity_function=self.similarity,
+            pool_maxsize=max(self.pool_maxsize, self.write_concurrency),
+            max_retries=self.max_retries,
         )
 
     @classmethod
@@ -102,6 +118,9 @@ class AstraDocumentStore:
             astra_collection=self.astra_collection,
             embedding_dim=self.embedding_dim,
             similarity=self.similarity,
+            write_concurrency=self.write_concurrency,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
         )
 
     def write_documents(
@@ -180,68 +199,105 @@ class AstraDocumentStore:
 
         documents_to_write = [_convert_input_document(doc) for doc in documents]
 
+        existing_ids = self._find_existing_ids([doc["_id"] for doc in documents_to_write if "_id" in doc])
         duplicate_documents = []
         new_documents = []
-        i = 0
-        while i < len(documents_to_write):
-            doc = documents_to_write[i]
-            response = self.index.find_documents({"filter": {"_id": doc["_id"]}})
-            if response:
+        for doc in documents_to_write:
+            if doc.get("_id") in existing_ids:
                 if policy == DuplicatePolicy.FAIL:
                     msg = f"ID '{doc['_id']}' already exists."
                     raise DuplicateDocumentError(msg)
                 duplicate_documents.append(doc)
             else:
                 new_documents.append(doc)
-            i = i + 1
 
         insertion_counter = 0
         if policy == DuplicatePolicy.SKIP:
             if len(new_documents) > 0:
-                for batch in _batches(new_documents, batch_size):
-                    inserted_ids = index.insert(batch)  # type: ignore
-                    insertion_counter += len(inserted_ids)
-                    logger.info(f"write_documents inserted documents with id {inserted_ids}")
+                insertion_counter += self._insert_batches(index, new_documents, batch_size)
             else:
                 logger.warning("No documents written. Argument policy set to SKIP")
 
         elif policy == DuplicatePolicy.OVERWRITE:
             if len(new_documents) > 0:
-                for batch in _batches(new_documents, batch_size):
-                    inserted_ids = index.insert(batch)  # type: ignore
-                    insertion_counter += len(inserted_ids)
-                    logger.info(f"write_documents inserted documents with id {inserted_ids}")
+                insertion_counter += self._insert_batches(index, new_documents, batch_size)
             else:
                 logger.warning("No documents written. Argument policy set to OVERWRITE")
 
             if len(duplicate_documents) > 0:
-                updated_ids = []
-                for duplicate_doc in duplicate_documents:
-                    updated = index.update_document(duplicate_doc, "_id")  # type: ignore
-                    if updated:
-                        updated_ids.append(duplicate_doc["_id"])
-                insertion_counter = insertion_counter + len(updated_ids)
-                logger.info(f"write_documents updated documents with id {updated_ids}")
+                insertion_counter += self._update_documents(index, duplicate_documents)
             else:
                 logger.info("No documents updated. Argument policy set to OVERWRITE")
 
         elif policy == DuplicatePolicy.FAIL:
             if len(new_documents) > 0:
-                for batch in _batches(new_documents, batch_size):
-                    inserted_ids = index.insert(batch)  # type: ignore
-                    insertion_counter = insertion_counter + len(inserted_ids)
-                    logger.info(f"write_documents inserted documents with id {inserted_ids}")
+                insertion_counter += self._insert_batches(index, new_documents, batch_size)
             else:
                 logger.warning("No documents written. Argument policy set to FAIL")
 
         return insertion_counter
 
+    def _map_batches(self, function: Callable[[List], Any], items: List, batch_size: int) -> List[Any]:
+        """
+        Calls `function` on each batch of `items`, running up to `write_concurrency` calls at the same time.
+        Results are returned in the order of the batches.
+        """
+        batches = _batches(items, batch_size)
+        if self.write_concurrency == 1:
+            return [function(batch) for batch in batches]
+        with ThreadPoolExecutor(max_workers=self.write_concurrency) as executor:
+            return list(executor.map(function, batches))
+
+    def _find_existing_ids(self, ids: List[str]) -> Set[str]:
+        """
+        Returns the subset of `ids` already stored, looking them up with one `_id $in` query per batch.
+        """
+
+        def _find(batch: List[str]) -> List[str]:
+            found = self.index.find_documents({"filter": {"_id": {"$in": batch}}, "projection": {"_id": 1}})
+            return [doc["_id"] for doc in found or []]
+
+        # A page of results holds at most MAX_BATCH_SIZE documents, so larger batches would need pagination
+        return {_id for found in self._map_batches(_find, list(set(ids)), MAX_BATCH_SIZE) for _id in found}
+
+    def _insert_batches(self, index: AstraClient, documents: List[Dict], batch_size: int) -> int:
+        """
+        Inserts the documents with one `insertMany` request per batch, sending up to
+        `write_concurrency` requests at the same time. Returns the number of inserted documents.
+        """
+
+        def _insert(batch: List[Dict]) -> int:
+            inserted_ids = index.insert(batch)
+            logger.info(f"write_documents inserted documents with id {inserted_ids}")
+            return len(inserted_ids)
+
+        return sum(self._map_batches(_insert, documents, batch_size))
+
+    def _update_documents(self, index: AstraClient, documents: List[Dict]) -> int:
+        """
+        Updates the fields of already stored documents, one `findOneAndUpdate` per document, sending up to
+        `write_concurrency` requests at the same time. Returns the number of updated documents.
+        """
+
+        def _update(batch: List[Dict]) -> List[str]:
+            return [doc["_id"] for doc in batch if index.update_document(doc, "_id")]
+
+        updated_ids = [_id for updated in self._map_batches(_update, documents, 1) for _id in updated]
+        logger.info(f"write_documents updated documents with id {updated_ids}")
+        return len(updated_ids)
+
     def count_documents(self) -> int:
         """
         Returns how many documents are present in the document store.
         """
         return self.index.count_documents()
 
+    async def count_documents_async(self) -> int:
+        """
+        Asynchronously returns how many documents are present in the document store.
+        """
+        return await self.index.count_documents_async()
+
     def filter_documents(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """Returns at most 1000 documents that match the filter
 
@@ -358,6 +414,31 @@ class AstraDocumentStore:
 
         return result
 
+    async def search_async(
+        self, query_embedding: List[float], top_k: int, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Asynchronously perform a search for a query embedding, see `search`.
+
+        Args:
+            query_embedding (List[float]): A list of query embeddings.
+            top_k (int): The number of results to return.
+            filters (Optional[Dict[str, Any]], optional): Filters to apply during search. Defaults to None.
+
+        Returns:
+            List[Document]: A list of matching documents.
+        """
+        converted_filters = _convert_filters(filters)
+
+        return self._get_result_to_documents(
+            await self.index.query_async(
+                vector=query_embedding,
+                top_k=top_k,
+                query_filter=converted_filters,
+                include_metadata=True,
+                include_values=True,
+            )
+        )
+
     def delete_documents(self, document_ids: Optional[List[str]] = None, delete_all: Optional[bool] = None) -> None:
         """
         Deletes all documents with a matching document_ids from the document store.
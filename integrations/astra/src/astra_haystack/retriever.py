@@ -50,6 +50,26 @@ class AstraRetriever:
 
         return {"documents": self.document_store.search(query_embedding, top_k, filters=filters)}
 
+    async def run_async(
+        self, query_embedding: List[float], filters: Optional[Dict[str, Any]] = None, top_k: Optional[int] = None
+    ):
+        """Asynchronously run the retriever on the given query embedding.
+
+        Args:
+            query_embedding (List[str]): An input list of queries
+            filters (Optional[Dict[str, Any]], optional): A dictionary with filters to narrow down the search space.
+                Defaults to None.
+            top_k (Optional[int], optional): The maximum number of documents to retrieve. Defaults to None.
+        """
+
+        if not top_k:
+            top_k = self.top_k
+
+        if not filters:
+            filters = self.filters
+
+        return {"documents": await self.document_store.search_async(query_embedding, top_k, filters=filters)}
+
     def to_dict(self) -> Dict[str, Any]:
         return default_to_dict(
             self,
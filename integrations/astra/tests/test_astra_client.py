@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2023-present Anant Corporation <support@anant.us>
+#
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+import requests
+
+from astra_haystack import astra_client
+from astra_haystack.astra_client import RETRY_STATUS_CODES, AstraClient
+
+
+@pytest.fixture
+def client():
+    with patch.object(AstraClient, "find_index", return_value=True):
+        return AstraClient(
+            astra_id="id",
+            astra_region="region",
+            astra_application_token="token",
+            keyspace_name="keyspace",
+            collection_name="collection",
+            embedding_dim=3,
+            similarity_function="cosine",
+            pool_maxsize=8,
+            max_retries=2,
+        )
+
+
+def mock_post_response(payload):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+def test_session_pools_connections_and_retries(client):
+    adapter = client._session.get_adapter(client.request_url)
+
+    assert adapter._pool_maxsize == 8
+    assert adapter.max_retries.total == 2
+    assert set(adapter.max_retries.status_forcelist) == set(RETRY_STATUS_CODES)
+    assert "POST" in adapter.max_retries.allowed_methods
+    assert client._session.headers["x-cassandra-token"] == "token"
+
+
+def test_insert(client):
+    response = mock_post_response({"status": {"insertedIds": ["1", "2"]}})
+    with patch.object(client._session, "post", return_value=response) as mock_post:
+        inserted_ids = client.insert([{"_id": "1", "content": "a"}, {"_id": "2", "content": "b"}])
+
+    assert inserted_ids == ["1", "2"]
+    mock_post.assert_called_once()
+    assert mock_post.call_args.args[0] == client.request_url
+    assert json.loads(mock_post.call_args.kwargs["data"]) == {
+        "insertMany": {
+            "options": {"ordered": False},
+            "documents": [{"_id": "1", "content": "a"}, {"_id": "2", "content": "b"}],
+        }
+    }
+
+
+@pytest.mark.parametrize("vector", [None, [0.1, 0.2, 0.3]])
+def test_query_async_sends_the_same_query_as_query(client, vector):
+    query_filter = {"meta.name": {"$eq": "a"}}
+    with patch.object(client, "find_documents", return_value=[]) as mock_find:
+        client.query(vector=vector, query_filter=query_filter, top_k=5)
+    with patch.object(client, "find_documents_async", new=AsyncMock(return_value=[])) as mock_find_async:
+        asyncio.run(client.query_async(vector=vector, query_filter=query_filter, top_k=5))
+
+    mock_find_async.assert_awaited_once_with(mock_find.call_args.args[0])
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_insert_numpy_embeddings(client, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(astra_client, "orjson", None)
+    # embedders with an embedding_dtype set the rows of a NumPy matrix as embeddings
+    embeddings = np.array([[0.5, 1.0, 0.0], [1.0, 0.5, 0.0]], dtype=np.float16)
+    response = mock_post_response({"status": {"insertedIds": ["1", "2"]}})
+    with patch.object(client._session, "post", return_value=response) as mock_post:
+        client.insert([{"_id": str(i), "$vector": embedding} for i, embedding in enumerate(embeddings, 1)])
+
+    documents = json.loads(mock_post.call_args.kwargs["data"])["insertMany"]["documents"]
+    assert [document["$vector"] for document in documents] == [[0.5, 1.0, 0.0], [1.0, 0.5, 0.0]]
@@ -3,12 +3,14 @@
 # SPDX-License-Identifier: Apache-2.0
 import os
 from typing import List
+from unittest.mock import MagicMock, patch
 
 import pytest
 from haystack import Document
-from haystack.document_stores import DuplicatePolicy, MissingDocumentError
+from haystack.document_stores import DuplicateDocumentError, DuplicatePolicy, MissingDocumentError
 from haystack.testing.document_store import DocumentStoreBaseTests
 
+from astra_haystack.astra_client import AstraClient
 from astra_haystack.document_store import AstraDocumentStore
 
 
@@ -243,3 +245,63 @@ class TestDocumentStore(DocumentStoreBaseTests):
     @pytest.mark.skip(reason="Unsupported filter operator $lt.")
     def test_comparison_less_than(self, document_store, filterable_docs):
         pass
+
+
+@pytest.fixture
+def mocked_document_store() -> AstraDocumentStore:
+    """
+    A store whose client is a mock, which knows the documents with ids "0" to "29".
+    """
+    with patch("astra_haystack.astra_client.AstraClient.find_index", return_value=True):
+        store = AstraDocumentStore(
+            astra_id="id",
+            astra_region="region",
+            astra_application_token="token",
+            astra_keyspace="keyspace",
+            astra_collection="collection",
+            embedding_dim=3,
+            write_concurrency=4,
+        )
+    stored_ids = {str(i) for i in range(30)}
+    store.index = MagicMock(spec=AstraClient)
+    store.index.find_documents.side_effect = lambda query: [
+        {"_id": _id} for _id in query["filter"]["_id"]["$in"] if _id in stored_ids
+    ]
+    store.index.insert.side_effect = lambda batch: [doc["_id"] for doc in batch]
+    store.index.update_document.return_value = True
+    return store
+
+
+def test_write_documents_looks_up_duplicates_in_batches(mocked_document_store):
+    documents = [Document(id=str(i), content=f"doc {i}") for i in range(100)]
+
+    assert mocked_document_store.write_documents(documents) == 70
+
+    # One `_id $in` lookup per 20 documents instead of one request per document
+    assert mocked_document_store.index.find_documents.call_count == 5
+    assert mocked_document_store.index.insert.call_count == 4
+    inserted = [doc["_id"] for call in mocked_document_store.index.insert.call_args_list for doc in call.args[0]]
+    assert sorted(inserted, key=int) == [str(i) for i in range(30, 100)]
+
+
+def test_write_documents_overwrite_updates_existing_documents(mocked_document_store):
+    written = mocked_document_store.write_documents(
+        [Document(id=str(i), content="new") for i in range(20, 40)], policy=DuplicatePolicy.OVERWRITE
+    )
+
+    assert written == 20
+    # The stored documents are updated in place, the new ones inserted, and nothing is deleted
+    updated = [call.args[0]["_id"] for call in mocked_document_store.index.update_document.call_args_list]
+    assert sorted(updated, key=int) == [str(i) for i in range(20, 30)]
+    inserted = [doc["_id"] for call in mocked_document_store.index.insert.call_args_list for doc in call.args[0]]
+    assert sorted(inserted, key=int) == [str(i) for i in range(30, 40)]
+    mocked_document_store.index.delete.assert_not_called()
+
+
+def test_write_documents_fail_on_duplicate(mocked_document_store):
+    with pytest.raises(DuplicateDocumentError):
+        mocked_document_store.write_documents(
+            [Document(id="40", content="doc"), Document(id="1", content="doc")], policy=DuplicatePolicy.FAIL
+        )
+
+    mocked_document_store.index.insert.assert_not_called()
@@ -1,10 +1,14 @@
 # SPDX-FileCopyrightText: 2023-present Anant Corporation <support@anant.us>
 #
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 import os
+from unittest.mock import Mock
 
 import pytest
+from haystack import Document
 
+from astra_haystack.document_store import AstraDocumentStore
 from astra_haystack.retriever import AstraRetriever
 
 
@@ -29,6 +33,9 @@ def test_retriever_to_json(document_store):
                     "duplicates_policy": "OVERWRITE",
                     "embedding_dim": 768,
                     "similarity": "cosine",
+                    "write_concurrency": 1,
+                    "pool_maxsize": 10,
+                    "max_retries": 3,
                 },
                 "type": "astra_haystack.document_store.AstraDocumentStore",
             },
@@ -65,3 +72,14 @@ def test_retriever_from_json():
     retriever = AstraRetriever.from_dict(data)
     assert retriever.top_k == 42
     assert retriever.filters == {"bar": "baz"}
+
+
+def test_retriever_run_async():
+    mock_store = Mock(spec=AstraDocumentStore)
+    mock_store.search_async.return_value = [Document(content="Test doc", embedding=[0.1, 0.2])]
+    retriever = AstraRetriever(mock_store, filters={"foo": "bar"}, top_k=3)
+
+    res = asyncio.run(retriever.run_async(query_embedding=[0.5, 0.7]))
+
+    mock_store.search_async.assert_awaited_once_with([0.5, 0.7], 3, filters={"foo": "bar"})
+    assert res["documents"][0].content == "Test doc"
@@ -3,12 +3,14 @@
 # SPDX-License-Identifier: Apache-2.0
 import logging
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import chromadb
 import numpy as np
 from chromadb.api.types import GetResult, QueryResult, validate_where, validate_where_document
 from haystack.dataclasses import Document
+from haystack.document_stores.errors import DuplicateDocumentError
 from haystack.document_stores.protocol import DuplicatePolicy
 
 from chroma_haystack.errors import ChromaDocumentStoreFilterError
@@ -16,6 +18,18 @@ from chroma_haystack.utils import get_embedding_function
 
 logger = logging.getLogger(__name__)
 
+# What `search` and `search_embeddings` fetch by default
+DEFAULT_QUERY_INCLUDE = ["embeddings", "documents", "metadatas", "distances"]
+
+
+def _batched(documents: Iterable[Document], batch_size: int) -> Iterator[List[Document]]:
+    """
+    Yields lists of at most `batch_size` documents, consuming the iterable lazily.
+    """
+    iterator = iter(documents)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
 
 class ChromaDocumentStore:
     """
@@ -24,7 +38,18 @@ class ChromaDocumentStore:
     """
 
     def __init__(
-        self, collection_name: str = "documents", embedding_function: str = "default", **embedding_function_params
+        self,
+        collection_name: str = "documents",
+        embedding_function: str = "default",
+        persist_path: Optional[str] = None,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        hnsw_space: Optional[str] = None,
+        hnsw_construction_ef: Optional[int] = None,
+        hnsw_search_ef: Optional[int] = None,
+        hnsw_m: Optional[int] = None,
+        numpy_embeddings: bool = False,  # noqa: FBT001, FBT002
+        **embedding_function_params,
     ):
         """
         Initializes the store. The __init__ constructor is not part of the Store Protocol
@@ -34,16 +59,51 @@ class ChromaDocumentStore:
         Note: for the component to be part of a serializable pipelie, the __init__
         parameters must be serializable, reason why we use a registry to configure the
         embedding function passing a string.
+
+        By default the documents are kept in memory. Pass `persist_path` to store them on disk,
+        so that they are loaded back instead of being written again when the process restarts,
+        or `host` (and optionally `port`) to connect to a Chroma server.
+
+        The `hnsw_*` parameters configure the index of a new collection, they're ignored when
+        the collection already exists:
+        - `hnsw_space`: the distance function, one of "l2", "ip" or "cosine".
+        - `hnsw_construction_ef`: size of the candidate list used while building the index.
+        - `hnsw_search_ef`: size of the candidate list used while searching, higher is more accurate but slower.
+        - `hnsw_m`: maximum number of neighbours of each node in the graph.
+        Chroma defaults are used for the parameters left to None.
+
+        With `numpy_embeddings=True` the embeddings of the returned Documents are rows of a single
+        float32 NumPy matrix per result, instead of lists of Python floats.
         """
+        if persist_path is not None and host is not None:
+            msg = "Only one of 'persist_path' and 'host' can be set"
+            raise ValueError(msg)
+
         # Store the params for marshalling
         self._collection_name = collection_name
         self._embedding_function = embedding_function
         self._embedding_function_params = embedding_function_params
+        self._persist_path = persist_path
+        self._host = host
+        self._port = port
+        self._numpy_embeddings = numpy_embeddings
+        self._hnsw_params = {
+            "hnsw:space": hnsw_space,
+            "hnsw:construction_ef": hnsw_construction_ef,
+            "hnsw:search_ef": hnsw_search_ef,
+            "hnsw:M": hnsw_m,
+        }
         # Create the client instance
-        self._chroma_client = chromadb.Client()
+        if persist_path is not None:
+            self._chroma_client = chromadb.PersistentClient(path=persist_path)
+        elif host is not None:
+            self._chroma_client = chromadb.HttpClient(host=host, port=str(port or 8000))
+        else:
+            self._chroma_client = chromadb.Client()
         self._collection = self._chroma_client.get_or_create_collection(
             name=collection_name,
             embedding_function=get_embedding_function(embedding_function, **embedding_function_params),
+            metadata={key: value for key, value in self._hnsw_params.items() if value is not None} or None,
         )
 
     def count_documents(self) -> int:
@@ -52,7 +112,9 @@ class ChromaDocumentStore:
         """
         return self._collection.count()
 
-    def filter_documents(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def filter_documents(
+        self, filters: Optional[Dict[str, Any]] = None, include: Optional[List[str]] = None
+    ) -> List[Document]:
         """
         Returns the documents that match the filters provided.
 
@@ -121,32 +183,60 @@ class ChromaDocumentStore:
         ```
 
         :param filters: the filters to apply to the document list.
+        :param include: the fields fetched from Chroma, among "documents", "metadatas" and "embeddings".
+            Defaults to documents and metadatas, embeddings are only returned when requested.
         :return: a list of Documents that match the given filters.
         """
+        kwargs: Dict[str, Any] = {}
+        if include is not None:
+            kwargs["include"] = include
         if filters:
             ids, where, where_document = self._normalize_filters(filters)
-            kwargs: Dict[str, Any] = {"where": where}
+            kwargs["where"] = where
 
             if ids:
                 kwargs["ids"] = ids
             if where_document:
                 kwargs["where_document"] = where_document
 
-            result = self._collection.get(**kwargs)
-        else:
-            result = self._collection.get()
+        result = self._collection.get(**kwargs)
 
         return self._get_result_to_documents(result)
 
-    def write_documents(self, documents: List[Document], policy: DuplicatePolicy = DuplicatePolicy.FAIL) -> None:
+    def write_documents(
+        self,
+        documents: Iterable[Document],
+        policy: DuplicatePolicy = DuplicatePolicy.FAIL,
+        batch_size: Optional[int] = None,
+    ) -> int:
         """
         Writes (or overwrites) documents into the store.
 
-        :param documents: a list of documents.
-        :param policy: not supported at the moment
+        Documents are written in batches, with a single `add` (or `upsert`) call per batch. Any iterable
+        is accepted, so a generator can be consumed without materializing all the documents in memory.
+
+        :param documents: an iterable of documents.
+        :param policy: how to handle documents whose id is already in the store.
+            `DuplicatePolicy.OVERWRITE` upserts them, `DuplicatePolicy.SKIP` ignores them and
+            `DuplicatePolicy.FAIL` (or `DuplicatePolicy.NONE`) raises an error.
+        :param batch_size: number of documents written per call, capped to the maximum batch size
+            supported by the Chroma client. Defaults to that maximum.
         :raises DuplicateDocumentError: Exception trigger on duplicate document if `policy=DuplicatePolicy.FAIL`
-        :return: None
+        :return: the number of documents written.
+        """
+        max_batch_size = self._chroma_client.max_batch_size
+        batch_size = min(batch_size, max_batch_size) if batch_size else max_batch_size
+
+        written = 0
+        for batch in _batched(documents, batch_size):
+            written += self._write_batch(batch, policy)
+        return written
+
+    def _write_batch(self, documents: List[Document], policy: DuplicatePolicy) -> int:
+        """
+        Writes a batch of documents, that must fit in a single Chroma call.
         """
+        unique_documents: Dict[str, Document] = {}
         for doc in documents:
             if not isinstance(doc, Document):
                 msg = "param 'documents' must contain a list of objects of type Document"
@@ -157,15 +247,42 @@ class ChromaDocumentStore:
                     "ChromaDocumentStore can only store the text field of Documents: "
                     "'array', 'dataframe' and 'blob' will be dropped."
                 )
-            data = {"ids": [doc.id], "documents": [doc.content]}
-
-            if doc.meta:
-                data["metadatas"] = [doc.meta]
-
-            if doc.embedding is not None:
-                data["embeddings"] = [doc.embedding]
+            if doc.id in unique_documents and policy != DuplicatePolicy.OVERWRITE:
+                if policy == DuplicatePolicy.SKIP:
+                    continue
+                msg = f"ID '{doc.id}' is duplicated in the documents to write."
+                raise DuplicateDocumentError(msg)
+            unique_documents[doc.id] = doc
+
+        if policy != DuplicatePolicy.OVERWRITE:
+            existing_ids = self._collection.get(ids=list(unique_documents), include=[])["ids"]
+            if existing_ids and policy != DuplicatePolicy.SKIP:
+                msg = f"IDs {existing_ids} already exist in the document store."
+                raise DuplicateDocumentError(msg)
+            for document_id in existing_ids:
+                del unique_documents[document_id]
+
+        # Chroma computes the embeddings of a call either for all or for none of its
+        # documents, so the documents coming with an embedding are written separately
+        with_embedding = [doc for doc in unique_documents.values() if doc.embedding is not None]
+        without_embedding = [doc for doc in unique_documents.values() if doc.embedding is None]
+        write = self._collection.upsert if policy == DuplicatePolicy.OVERWRITE else self._collection.add
+        for group in (with_embedding, without_embedding):
+            if not group:
+                continue
+            data: Dict[str, Any] = {
+                "ids": [doc.id for doc in group],
+                "documents": [doc.content for doc in group],
+                "metadatas": [doc.meta or None for doc in group],
+            }
+            if group is with_embedding:
+                # embedders may return NumPy rows, while Chroma only accepts lists of floats
+                data["embeddings"] = [
+                    doc.embedding.tolist() if isinstance(doc.embedding, np.ndarray) else doc.embedding for doc in group
+                ]
+            write(**data)
 
-            self._collection.add(**data)
+        return len(unique_documents)
 
     def delete_documents(self, document_ids: List[str]) -> None:
         """
@@ -176,24 +293,30 @@ class ChromaDocumentStore:
         """
         self._collection.delete(ids=document_ids)
 
-    def search(self, queries: List[str], top_k: int) -> List[List[Document]]:
+    def search(self, queries: List[str], top_k: int, include: Optional[List[str]] = None) -> List[List[Document]]:
         """
         Perform vector search on the stored documents
+
+        :param include: the fields fetched from Chroma, defaults to embeddings, documents, metadatas and distances.
+            Leave "embeddings" out when the embeddings of the Documents are not needed.
         """
-        results = self._collection.query(
-            query_texts=queries, n_results=top_k, include=["embeddings", "documents", "metadatas", "distances"]
-        )
+        results = self._collection.query(query_texts=queries, n_results=top_k, include=include or DEFAULT_QUERY_INCLUDE)
         return self._query_result_to_documents(results)
 
-    def search_embeddings(self, query_embeddings: List[List[float]], top_k: int) -> List[List[Document]]:
+    def search_embeddings(
+        self, query_embeddings: List[List[float]], top_k: int, include: Optional[List[str]] = None
+    ) -> List[List[Document]]:
         """
         Perform vector search on the stored document, pass the embeddings of the queries
         instead of their text
+
+        :param include: the fields fetched from Chroma, defaults to embeddings, documents, metadatas and distances.
+            Leave "embeddings" out when the embeddings of the Documents are not needed.
         """
         results = self._collection.query(
             query_embeddings=query_embeddings,
             n_results=top_k,
-            include=["embeddings", "documents", "metadatas", "distances"],
+            include=include or DEFAULT_QUERY_INCLUDE,
         )
         return self._query_result_to_documents(results)
 
@@ -205,6 +328,14 @@ class ChromaDocumentStore:
         return {
             "collection_name": self._collection_name,
             "embedding_function": self._embedding_function,
+            "persist_path": self._persist_path,
+            "host": self._host,
+            "port": self._port,
+            "hnsw_space": self._hnsw_params["hnsw:space"],
+            "hnsw_construction_ef": self._hnsw_params["hnsw:construction_ef"],
+            "hnsw_search_ef": self._hnsw_params["hnsw:search_ef"],
+            "hnsw_m": self._hnsw_params["hnsw:M"],
+            "numpy_embeddings": self._numpy_embeddings,
             **self._embedding_function_params,
         }
 
@@ -262,28 +393,38 @@ class ChromaDocumentStore:
 
         return ids, final_where, where_document
 
+    def _convert_embeddings(self, embeddings: Optional[List[List[float]]]) -> Optional[Sequence]:
+        """
+        Returns the embeddings as they should be set on the Documents: either the lists returned
+        by Chroma, or the rows of a single float32 matrix, that share its memory.
+        """
+        if not embeddings or not self._numpy_embeddings:
+            return embeddings
+        return np.asarray(embeddings, dtype=np.float32)
+
     def _get_result_to_documents(self, result: GetResult) -> List[Document]:
         """
         Helper function to convert Chroma results into Haystack Documents
         """
         retval = []
-        for i in range(len(result.get("documents", []))):
-            document_dict: Dict[str, Any] = {"id": result["ids"][i]}
+        result_documents = result.get("documents")
+        result_metadata = result.get("metadatas")
+        result_embeddings = self._convert_embeddings(result.get("embeddings"))
+        for i, document_id in enumerate(result["ids"]):
+            document_dict: Dict[str, Any] = {"id": document_id}
 
-            result_documents = result.get("documents")
             if result_documents:
                 document_dict["content"] = result_documents[i]
 
-            result_metadata = result.get("metadatas")
             # Ensure metadata[i] is not None or don't add it to the document dict
             if result_metadata and result_metadata[i]:
                 document_dict["meta"] = result_metadata[i]
 
-            result_embeddings = result.get("embeddings")
-            if result_embeddings:
-                document_dict["embedding"] = list(result_embeddings[i])
-
-            retval.append(Document.from_dict(document_dict))
+            document = Document.from_dict(document_dict)
+            if result_embeddings is not None:
+                # Set after creation, Document would convert a NumPy row into a list
+                document.embedding = result_embeddings[i]
+            retval.append(document)
 
         return retval
 
@@ -296,25 +437,29 @@ class ChromaDocumentStore:
         if documents is None:
             return retval
 
+        metadatas = result.get("metadatas")
+        embeddings = result.get("embeddings")
+        distances = result.get("distances")
         for i, answers in enumerate(documents):
+            answer_embeddings = self._convert_embeddings(embeddings[i]) if embeddings else None
             converted_answers = []
-            for j in range(len(answers)):
+            for j, content in enumerate(answers):
                 document_dict: Dict[str, Any] = {
                     "id": result["ids"][i][j],
-                    "content": documents[i][j],
+                    "content": content,
                 }
 
                 # prepare metadata
-                if metadatas := result.get("metadatas"):
-                    document_dict["meta"] = dict(metadatas[i][j])
-
-                if embeddings := result.get("embeddings"):
-                    document_dict["embedding"] = np.array(embeddings[i][j])
+                if metadatas:
+                    document_dict["meta"] = dict(metadatas[i][j] or {})
 
-                if distances := result.get("distances"):
+                if distances:
                     document_dict["score"] = distances[i][j]
 
-                converted_answers.append(Document.from_dict(document_dict))
+                document = Document.from_dict(document_dict)
+                if answer_embeddings is not None:
+                    document.embedding = answer_embeddings[j]
+                converted_answers.append(document)
             retval.append(converted_answers)
 
         return retval
@@ -9,10 +9,12 @@ import numpy as np
 import pytest
 from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
 from haystack import Document
+from haystack.document_stores import DuplicatePolicy
 from haystack.testing.document_store import (
     CountDocumentsTest,
     DeleteDocumentsTest,
     LegacyFilterDocumentsTest,
+    WriteDocumentsTest,
 )
 
 from chroma_haystack.document_store import ChromaDocumentStore
@@ -27,10 +29,10 @@ class _TestEmbeddingFunction(EmbeddingFunction):
 
     def __call__(self, input: Documents) -> Embeddings:  # noqa - chroma will inspect the signature, it must match
         # embed the documents somehow
-        return [np.random.default_rng().uniform(-1, 1, 768).tolist()]
+        return [np.random.default_rng().uniform(-1, 1, 768).tolist() for _ in input]
 
 
-class TestDocumentStore(CountDocumentsTest, DeleteDocumentsTest, LegacyFilterDocumentsTest):
+class TestDocumentStore(CountDocumentsTest, DeleteDocumentsTest, LegacyFilterDocumentsTest, WriteDocumentsTest):
     """
     Common test cases will be provided by `DocumentStoreBaseTests` but
     you can add more to this class.
@@ -98,6 +100,14 @@ class TestDocumentStore(CountDocumentsTest, DeleteDocumentsTest, LegacyFilterDoc
         assert ds_dict == {
             "collection_name": request.node.name,
             "embedding_function": "HuggingFaceEmbeddingFunction",
+            "persist_path": None,
+            "host": None,
+            "port": None,
+            "hnsw_space": None,
+            "hnsw_construction_ef": None,
+            "hnsw_search_ef": None,
+            "hnsw_m": None,
+            "numpy_embeddings": False,
             "api_key": "1234567890",
         }
 
@@ -112,6 +122,67 @@ class TestDocumentStore(CountDocumentsTest, DeleteDocumentsTest, LegacyFilterDoc
         assert ds._embedding_function == function_name
         assert ds._embedding_function_params == {"api_key": "1234567890"}
 
+    @pytest.mark.unit
+    def test_persist_path(self, tmp_path):
+        ChromaDocumentStore(collection_name="persisted", persist_path=str(tmp_path)).write_documents(
+            [Document(id="1", content="persisted doc", embedding=[0.1] * 768)]
+        )
+
+        ds = ChromaDocumentStore(collection_name="persisted", persist_path=str(tmp_path))
+        assert ds.filter_documents() == [Document(id="1", content="persisted doc")]
+
+    @pytest.mark.unit
+    def test_persist_path_and_host(self, tmp_path):
+        with pytest.raises(ValueError):
+            ChromaDocumentStore(persist_path=str(tmp_path), host="localhost")
+
+    @pytest.mark.unit
+    def test_hnsw_params(self, request):
+        ds = ChromaDocumentStore(
+            collection_name=request.node.name, hnsw_space="cosine", hnsw_construction_ef=200, hnsw_m=32
+        )
+
+        assert ds._collection.metadata == {"hnsw:space": "cosine", "hnsw:construction_ef": 200, "hnsw:M": 32}
+        assert ds.to_dict()["hnsw_space"] == "cosine"
+        assert ds.to_dict()["hnsw_search_ef"] is None
+
+    @pytest.mark.unit
+    def test_include_selects_fetched_fields(self, document_store: ChromaDocumentStore):
+        document_store.write_documents([Document(id="1", content="doc", embedding=[0.5] * 768)])
+
+        assert document_store.filter_documents()[0].embedding is None
+        assert document_store.filter_documents(include=["embeddings"])[0].embedding == [0.5] * 768
+        assert document_store.search_embeddings([[0.5] * 768], top_k=1)[0][0].embedding == [0.5] * 768
+        result = document_store.search_embeddings([[0.5] * 768], top_k=1, include=["documents", "distances"])
+        assert result[0][0].embedding is None
+
+    @pytest.mark.unit
+    def test_numpy_embeddings(self, request):
+        ds = ChromaDocumentStore(collection_name=request.node.name, numpy_embeddings=True)
+        ds.write_documents([Document(id=str(i), content=f"doc {i}", embedding=[float(i)] * 4) for i in range(3)])
+
+        documents = ds.filter_documents(include=["documents", "embeddings"])
+        matrix = documents[0].embedding.base
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (3, 4)
+        assert all(doc.embedding.base is matrix for doc in documents)
+
+        results = ds.search_embeddings([[1.0] * 4], top_k=2, include=["documents", "embeddings", "distances"])
+        assert results[0][0].embedding.tolist() == [1.0] * 4
+        assert results[0][0].embedding.dtype == np.float32
+
+    @pytest.mark.unit
+    def test_write_documents_with_numpy_embeddings(self, document_store: ChromaDocumentStore):
+        # embedders with an embedding_dtype set the rows of a NumPy matrix as embeddings
+        embeddings = np.array([[1.0] * 4, [2.0] * 4], dtype=np.float16)
+        docs = [Document(id=str(i), content=f"doc {i}") for i in range(2)]
+        for doc, embedding in zip(docs, embeddings):
+            doc.embedding = embedding
+
+        assert document_store.write_documents(docs) == 2
+        documents = document_store.filter_documents(filters={"id": "1"}, include=["documents", "embeddings"])
+        assert documents[0].embedding == [2.0] * 4
+
     @pytest.mark.integration
     def test_same_collection_name_reinitialization(self):
         ChromaDocumentStore("test_name")
@@ -245,17 +316,40 @@ class TestDocumentStore(CountDocumentsTest, DeleteDocumentsTest, LegacyFilterDoc
     ):
         pass
 
-    @pytest.mark.skip(reason="Duplicate policy not supported.")
     @pytest.mark.unit
-    def test_write_duplicate_fail(self, document_store: ChromaDocumentStore):
-        pass
+    def test_write_documents(self, document_store: ChromaDocumentStore):
+        doc = Document(content="test doc")
+        assert document_store.write_documents([doc]) == 1
+        assert document_store.filter_documents(filters={"id": doc.id}) == [doc]
 
-    @pytest.mark.skip(reason="Duplicate policy not supported.")
     @pytest.mark.unit
-    def test_write_duplicate_skip(self, document_store: ChromaDocumentStore):
-        pass
+    def test_write_documents_generator_in_batches(self, document_store: ChromaDocumentStore):
+        docs = (Document(id=str(i), content=f"doc {i}", meta={"i": i}) for i in range(25))
+
+        collection_class = type(document_store._collection)
+        with mock.patch.object(collection_class, "add", autospec=True, side_effect=collection_class.add) as add:
+            assert document_store.write_documents(docs, batch_size=10) == 25
+
+        assert [len(call.kwargs["ids"]) for call in add.call_args_list] == [10, 10, 5]
+        assert document_store.count_documents() == 25
 
-    @pytest.mark.skip(reason="Duplicate policy not supported.")
     @pytest.mark.unit
-    def test_write_duplicate_overwrite(self, document_store: ChromaDocumentStore):
-        pass
+    def test_write_documents_with_and_without_embeddings(self, document_store: ChromaDocumentStore):
+        docs = [
+            Document(id="1", content="with embedding", embedding=[0.5] * 768),
+            Document(id="2", content="without embedding"),
+        ]
+
+        assert document_store.write_documents(docs) == 2
+        assert document_store._collection.get(ids=["1"], include=["embeddings"])["embeddings"] == [[0.5] * 768]
+
+    @pytest.mark.unit
+    def test_write_documents_skip_partial_batch(self, document_store: ChromaDocumentStore):
+        document_store.write_documents([Document(id="1", content="old")])
+
+        written = document_store.write_documents(
+            [Document(id="1", content="new"), Document(id="2", content="new")], policy=DuplicatePolicy.SKIP
+        )
+
+        assert written == 1
+        assert document_store.filter_documents(filters={"id": "1"})[0].content == "old"
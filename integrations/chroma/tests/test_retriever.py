@@ -21,6 +21,14 @@ def test_retriever_to_json(request):
             "document_store": {
                 "collection_name": request.node.name,
                 "embedding_function": "HuggingFaceEmbeddingFunction",
+                "persist_path": None,
+                "host": None,
+                "port": None,
+                "hnsw_space": None,
+                "hnsw_construction_ef": None,
+                "hnsw_search_ef": None,
+                "hnsw_m": None,
+                "numpy_embeddings": False,
                 "api_key": "1234567890",
             },
         },
@@ -37,6 +45,14 @@ def test_retriever_from_json(request):
             "document_store": {
                 "collection_name": request.node.name,
                 "embedding_function": "HuggingFaceEmbeddingFunction",
+                "persist_path": None,
+                "host": None,
+                "port": None,
+                "hnsw_space": None,
+                "hnsw_construction_ef": None,
+                "hnsw_search_ef": None,
+                "hnsw_m": None,
+                "numpy_embeddings": False,
                 "api_key": "1234567890",
             },
         },
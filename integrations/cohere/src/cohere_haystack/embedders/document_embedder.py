@@ -3,13 +3,17 @@
 # SPDX-License-Identifier: Apache-2.0
 import asyncio
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from cohere import COHERE_API_URL, AsyncClient, Client
-from haystack import Document, component, default_to_dict
+from haystack import Document, component, default_from_dict, default_to_dict
+from haystack.lazy_imports import LazyImport
 
 from cohere_haystack.embedders.utils import get_async_response, get_response
 
+with LazyImport(message="Run 'pip install \"cohere-haystack[embedding-cache]\"'") as embedding_cache_import:
+    from embedding_cache_haystack import EmbeddingCache, deserialize_embedding_cache
+
 
 @component
 class CohereDocumentEmbedder:
@@ -47,6 +51,9 @@ class CohereDocumentEmbedder:
         progress_bar: bool = True,
         meta_fields_to_embed: Optional[List[str]] = None,
         embedding_separator: str = "\n",
+        max_concurrency: int = 1,
+        batch_retries: int = 0,
+        embedding_cache: Optional["EmbeddingCache"] = None,
     ):
         """
         Create a CohereDocumentEmbedder component.
@@ -76,6 +83,15 @@ class CohereDocumentEmbedder:
                              to keep the logs clean.
         :param meta_fields_to_embed: List of meta fields that should be embedded along with the Document text.
         :param embedding_separator: Separator used to concatenate the meta fields to the Document text.
+        :param max_concurrency: Maximum number of batches sent to Cohere at the same time, defaults to `1`.
+            The async client runs them on the event loop, the sync client from threads.
+        :param batch_retries: Number of times a batch is sent again when it fails with a connection error or a
+            status code indicating a temporary failure, once the client gave up on its own `max_retries`.
+            Defaults to `0`.
+        :param embedding_cache: Cache of the embeddings, for example an `InMemoryEmbeddingCache` or a
+            `SQLiteEmbeddingCache` from the `embedding_cache_haystack` package.
+            Only the texts whose embedding is not cached for the same model, input type and
+            truncation are sent to Cohere. Defaults to `None`, meaning no cache.
         """
 
         api_key = api_key or os.environ.get("COHERE_API_KEY")
@@ -99,6 +115,9 @@ class CohereDocumentEmbedder:
         self.progress_bar = progress_bar
         self.meta_fields_to_embed = meta_fields_to_embed or []
         self.embedding_separator = embedding_separator
+        self.max_concurrency = max_concurrency
+        self.batch_retries = batch_retries
+        self.embedding_cache = embedding_cache
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -117,8 +136,22 @@ class CohereDocumentEmbedder:
             progress_bar=self.progress_bar,
             meta_fields_to_embed=self.meta_fields_to_embed,
             embedding_separator=self.embedding_separator,
+            max_concurrency=self.max_concurrency,
+            batch_retries=self.batch_retries,
+            embedding_cache=self.embedding_cache.to_dict() if self.embedding_cache is not None else None,
         )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CohereDocumentEmbedder":
+        """
+        Deserialize this component from a dictionary.
+        """
+        init_params = data.get("init_parameters", {})
+        if init_params.get("embedding_cache") is not None:
+            embedding_cache_import.check()
+            init_params["embedding_cache"] = deserialize_embedding_cache(init_params["embedding_cache"])
+        return default_from_dict(cls, data)
+
     def _prepare_texts_to_embed(self, documents: List[Document]) -> List[str]:
         """
         Prepare the texts to embed by concatenating the Document text with the metadata fields to embed.
@@ -133,6 +166,44 @@ class CohereDocumentEmbedder:
             texts_to_embed.append(text_to_embed)
         return texts_to_embed
 
+    async def _embed_async(self, cohere_client: AsyncClient, texts_to_embed: List[str]):
+        try:
+            return await get_async_response(
+                cohere_client,
+                texts_to_embed,
+                self.model_name,
+                self.input_type,
+                self.truncate,
+                self.batch_size,
+                self.progress_bar,
+                max_concurrency=self.max_concurrency,
+                batch_retries=self.batch_retries,
+            )
+        finally:
+            await cohere_client.close()
+
+    def _embed(self, texts_to_embed: List[str]) -> Tuple[List[List[float]], Dict[str, Any]]:
+        if self.use_async_client:
+            cohere_client = AsyncClient(
+                self.api_key, api_url=self.api_base_url, max_retries=self.max_retries, timeout=self.timeout
+            )
+            return asyncio.run(self._embed_async(cohere_client, texts_to_embed))
+
+        cohere_client = Client(
+            self.api_key, api_url=self.api_base_url, max_retries=self.max_retries, timeout=self.timeout
+        )
+        return get_response(
+            cohere_client,
+            texts_to_embed,
+            self.model_name,
+            self.input_type,
+            self.truncate,
+            self.batch_size,
+            self.progress_bar,
+            max_concurrency=self.max_concurrency,
+            batch_retries=self.batch_retries,
+        )
+
     @component.output_types(documents=List[Document], meta=Dict[str, Any])
     def run(self, documents: List[Document]):
         """
@@ -155,26 +226,21 @@ class CohereDocumentEmbedder:
 
         texts_to_embed = self._prepare_texts_to_embed(documents)
 
-        if self.use_async_client:
-            cohere_client = AsyncClient(
-                self.api_key, api_url=self.api_base_url, max_retries=self.max_retries, timeout=self.timeout
-            )
-            all_embeddings, metadata = asyncio.run(
-                get_async_response(cohere_client, texts_to_embed, self.model_name, self.input_type, self.truncate)
-            )
+        if self.embedding_cache is None:
+            all_embeddings, metadata = self._embed(texts_to_embed)
         else:
-            cohere_client = Client(
-                self.api_key, api_url=self.api_base_url, max_retries=self.max_retries, timeout=self.timeout
-            )
-            all_embeddings, metadata = get_response(
-                cohere_client,
-                texts_to_embed,
-                self.model_name,
-                self.input_type,
-                self.truncate,
-                self.batch_size,
-                self.progress_bar,
-            )
+            metadata = {}
+
+            def embed(texts: List[str]) -> List[List[float]]:
+                nonlocal metadata
+                embeddings, metadata = self._embed(texts)
+                return embeddings
+
+            keys = [
+                self.embedding_cache.key(self.model_name, self.input_type, self.truncate, text)
+                for text in texts_to_embed
+            ]
+            all_embeddings = self.embedding_cache.get_or_embed(keys, texts_to_embed, embed)
 
         for doc, embeddings in zip(documents, all_embeddings):
             doc.embedding = embeddings
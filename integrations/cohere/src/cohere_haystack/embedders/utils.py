@@ -1,57 +1,118 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
-from typing import Any, Dict, List, Tuple
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
-from cohere import AsyncClient, Client, CohereError
+from cohere import RETRY_STATUS_CODES, AsyncClient, Client, CohereAPIError, CohereConnectionError, CohereError
 from tqdm import tqdm
 
+# Retries of a failed batch wait RETRY_BACKOFF_FACTOR * 2 ** retry seconds
+RETRY_BACKOFF_FACTOR = 1.0
+
+
+def _is_retryable(error: CohereError) -> bool:
+    if isinstance(error, CohereAPIError):
+        return error.http_status in RETRY_STATUS_CODES
+    return isinstance(error, CohereConnectionError)
+
+
+def _batches(texts: List[str], batch_size: Optional[int]) -> List[List[str]]:
+    if not batch_size:
+        return [texts]
+    return [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+
+
+async def get_async_response(
+    cohere_async_client: AsyncClient,
+    texts: List[str],
+    model_name,
+    input_type,
+    truncate,
+    batch_size: Optional[int] = None,
+    progress_bar=False,
+    max_concurrency: int = 1,
+    batch_retries: int = 0,
+):
+    """
+    Embeds the texts `batch_size` at a time, with up to `max_concurrency` batches in flight.
+    A batch failing with a connection error or a retryable status code is retried `batch_retries` times.
+    The embeddings are returned in the order of `texts`, with the metadata of the last batch.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    with tqdm(total=len(texts), disable=not progress_bar, desc="Calculating embeddings") as progress:
+
+        async def embed_batch(batch: List[str]):
+            async with semaphore:
+                for retry in range(batch_retries + 1):
+                    try:
+                        response = await cohere_async_client.embed(
+                            texts=batch, model=model_name, input_type=input_type, truncate=truncate
+                        )
+                        break
+                    except CohereError as error_response:
+                        if retry == batch_retries or not _is_retryable(error_response):
+                            msg = error_response.message
+                            raise ValueError(msg) from error_response
+                    await asyncio.sleep(RETRY_BACKOFF_FACTOR * 2**retry)
+            progress.update(len(batch))
+            return response
+
+        responses = await asyncio.gather(*(embed_batch(batch) for batch in _batches(texts, batch_size)))
 
-async def get_async_response(cohere_async_client: AsyncClient, texts: List[str], model_name, input_type, truncate):
     all_embeddings: List[List[float]] = []
     metadata: Dict[str, Any] = {}
-    try:
-        response = await cohere_async_client.embed(
-            texts=texts, model=model_name, input_type=input_type, truncate=truncate
-        )
+    for response in responses:
+        all_embeddings.extend(response.embeddings)
         if response.meta is not None:
             metadata = response.meta
-        for emb in response.embeddings:
-            all_embeddings.append(emb)
-
-        return all_embeddings, metadata
 
-    except CohereError as error_response:
-        msg = error_response.message
-        raise ValueError(msg) from error_response
+    return all_embeddings, metadata
 
 
 def get_response(
-    cohere_client: Client, texts: List[str], model_name, input_type, truncate, batch_size=32, progress_bar=False
+    cohere_client: Client,
+    texts: List[str],
+    model_name,
+    input_type,
+    truncate,
+    batch_size=32,
+    progress_bar=False,
+    max_concurrency: int = 1,
+    batch_retries: int = 0,
 ) -> Tuple[List[List[float]], Dict[str, Any]]:
     """
-    We support batching with the sync client.
+    We support batching with the sync client, with up to `max_concurrency` batches sent from threads.
     """
+
+    def embed_batch(batch: List[str]):
+        for retry in range(batch_retries + 1):
+            try:
+                return cohere_client.embed(batch, model=model_name, input_type=input_type, truncate=truncate)
+            except CohereError as error_response:
+                if retry == batch_retries or not _is_retryable(error_response):
+                    msg = error_response.message
+                    raise ValueError(msg) from error_response
+            time.sleep(RETRY_BACKOFF_FACTOR * 2**retry)
+
     all_embeddings: List[List[float]] = []
     metadata: Dict[str, Any] = {}
 
-    try:
-        for i in tqdm(
-            range(0, len(texts), batch_size),
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        # map yields the responses in the order of the batches
+        responses = executor.map(embed_batch, _batches(texts, batch_size))
+        for response in tqdm(
+            responses,
+            total=len(range(0, len(texts), batch_size)),
             disable=not progress_bar,
             desc="Calculating embeddings",
         ):
-            batch = texts[i : i + batch_size]
-            response = cohere_client.embed(batch, model=model_name, input_type=input_type, truncate=truncate)
-            for emb in response.embeddings:
-                all_embeddings.append(emb)
             embeddings = [list(map(float, emb)) for emb in response.embeddings]
             all_embeddings.extend(embeddings)
             if response.meta is not None:
                 metadata = response.meta
 
-        return all_embeddings, metadata
-
-    except CohereError as error_response:
-        msg = error_response.message
-        raise ValueError(msg) from error_response
+    return all_embeddings, metadata
@@ -1,17 +1,60 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 import os
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
-from cohere import COHERE_API_URL
+from cohere import COHERE_API_URL, CohereAPIError
+from embedding_cache_haystack import InMemoryEmbeddingCache
 from haystack import Document
 
+from cohere_haystack.embedders import utils
 from cohere_haystack.embedders.document_embedder import CohereDocumentEmbedder
 
 pytestmark = pytest.mark.embedders
 
 
+class StubAsyncClient:
+    """
+    Embeds each text as [len(text), index of the batch], failing the first `failures` calls with a 503.
+    """
+
+    def __init__(self, *_args, failures=0, **_kwargs):
+        self.failures = failures
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    async def embed(self, texts, **_kwargs):
+        if self.failures > 0:
+            self.failures -= 1
+            raise CohereAPIError(message="unavailable", http_status=503)
+        self.batches.append(texts)
+        index = len(self.batches)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Let later batches overtake the first ones
+        await asyncio.sleep(0.01 / index)
+        self.in_flight -= 1
+        return SimpleNamespace(embeddings=[[float(len(text)), float(index)] for text in texts], meta={"batch": index})
+
+    async def close(self):
+        self.closed = True
+
+
+class StubClient:
+    def __init__(self, *_args, **_kwargs):
+        self.batches = []
+
+    def embed(self, texts, **_kwargs):
+        self.batches.append(texts)
+        return SimpleNamespace(embeddings=[[len(text), 0] for text in texts], meta=None)
+
+
 class TestCohereDocumentEmbedder:
     def test_init_default(self):
         embedder = CohereDocumentEmbedder(api_key="test-api-key")
@@ -73,6 +116,9 @@ class TestCohereDocumentEmbedder:
                 "progress_bar": True,
                 "meta_fields_to_embed": [],
                 "embedding_separator": "\n",
+                "max_concurrency": 1,
+                "batch_retries": 0,
+                "embedding_cache": None,
             },
         }
 
@@ -106,6 +152,9 @@ class TestCohereDocumentEmbedder:
                 "progress_bar": False,
                 "meta_fields_to_embed": ["text_field"],
                 "embedding_separator": "-",
+                "max_concurrency": 1,
+                "batch_retries": 0,
+                "embedding_cache": None,
             },
         }
 
@@ -140,3 +189,75 @@ class TestCohereDocumentEmbedder:
             embedder.run(documents=[1, 2, 3])
 
         assert embedder.run(documents=[]) == {"documents": [], "meta": {}}
+
+    def test_run_sync_client_batches(self):
+        client = StubClient()
+        embedder = CohereDocumentEmbedder(api_key="test-api-key", batch_size=2, max_concurrency=2, progress_bar=False)
+        docs = [Document(content="a" * i) for i in range(1, 6)]
+
+        with patch("cohere_haystack.embedders.document_embedder.Client", return_value=client):
+            result = embedder.run(docs)
+
+        assert [len(batch) for batch in client.batches] == [2, 2, 1]
+        assert [doc.embedding for doc in result["documents"]] == [[float(i), 0.0] for i in range(1, 6)]
+
+    def test_run_async_client_batches_concurrently(self):
+        client = StubAsyncClient()
+        embedder = CohereDocumentEmbedder(
+            api_key="test-api-key", use_async_client=True, batch_size=2, max_concurrency=3, progress_bar=False
+        )
+        docs = [Document(content="a" * i) for i in range(1, 10)]
+
+        with patch("cohere_haystack.embedders.document_embedder.AsyncClient", return_value=client):
+            result = embedder.run(docs)
+
+        assert [len(batch) for batch in client.batches] == [2, 2, 2, 2, 1]
+        assert client.max_in_flight == 3
+        assert client.closed
+        # The embeddings keep the order of the Documents, whichever batch finished first
+        assert [doc.embedding[0] for doc in result["documents"]] == [float(i) for i in range(1, 10)]
+
+    def test_run_async_client_retries_batches(self, monkeypatch):
+        monkeypatch.setattr(utils, "RETRY_BACKOFF_FACTOR", 0)
+        client = StubAsyncClient(failures=2)
+        embedder = CohereDocumentEmbedder(
+            api_key="test-api-key", use_async_client=True, batch_size=2, batch_retries=2, progress_bar=False
+        )
+
+        with patch("cohere_haystack.embedders.document_embedder.AsyncClient", return_value=client):
+            result = embedder.run([Document(content="a"), Document(content="bb")])
+
+        assert [doc.embedding[0] for doc in result["documents"]] == [1.0, 2.0]
+
+        client = StubAsyncClient(failures=3)
+        with patch("cohere_haystack.embedders.document_embedder.AsyncClient", return_value=client):
+            with pytest.raises(ValueError, match="unavailable"):
+                embedder.run([Document(content="a")])
+
+    def test_run_with_embedding_cache(self):
+        cache = InMemoryEmbeddingCache()
+        embedder = CohereDocumentEmbedder(api_key="test-api-key", embedding_cache=cache, progress_bar=False)
+        client = StubClient()
+
+        with patch("cohere_haystack.embedders.document_embedder.Client", return_value=client):
+            embedder.run([Document(content="a"), Document(content="bb")])
+            result = embedder.run([Document(content="bb"), Document(content="ccc"), Document(content="a")])
+
+        assert client.batches == [["a", "bb"], ["ccc"]]
+        assert [doc.embedding for doc in result["documents"]] == [[2.0, 0.0], [3.0, 0.0], [1.0, 0.0]]
+        assert (cache.hits, cache.misses) == (2, 3)
+
+    def test_embedding_cache_serialization(self, monkeypatch):
+        monkeypatch.setenv("COHERE_API_KEY", "test-api-key")
+        embedder = CohereDocumentEmbedder(
+            api_key="test-api-key", embedding_cache=InMemoryEmbeddingCache(max_entries=10)
+        )
+        data = embedder.to_dict()
+
+        assert data["init_parameters"]["embedding_cache"] == {
+            "type": "embedding_cache_haystack.embedding_cache.InMemoryEmbeddingCache",
+            "init_parameters": {"max_entries": 10},
+        }
+        embedder = CohereDocumentEmbedder.from_dict(data)
+        assert isinstance(embedder.embedding_cache, InMemoryEmbeddingCache)
+        assert embedder.embedding_cache.max_entries == 10
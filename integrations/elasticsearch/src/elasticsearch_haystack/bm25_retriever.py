@@ -106,3 +106,49 @@ class ElasticsearchBM25Retriever:
             scale_score=self._scale_score,
         )
         return {"documents": docs}
+
+    async def run_async(self, query: str, top_k: Optional[int] = None):
+        """
+        Asynchronously retrieve documents using the BM25 keyword-based algorithm.
+
+        :param query: String to search in Documents' text.
+        :param top_k: Maximum number of Documents to return.
+        :return: List of Documents that match the query.
+        """
+        docs = await self._document_store._bm25_retrieval_async(
+            query=query,
+            filters=self._filters,
+            fuzziness=self._fuzziness,
+            top_k=top_k or self._top_k,
+            scale_score=self._scale_score,
+        )
+        return {"documents": docs}
+
+    def run_batch(
+        self,
+        queries: List[str],
+        top_k: Optional[int] = None,
+        batch_size: int = 100,
+        max_concurrency: int = 1,
+    ) -> Dict[str, List[List[Document]]]:
+        """
+        Retrieve documents for many queries at once using the BM25 keyword-based algorithm.
+
+        The searches are packed into `_msearch` requests, saving one round trip per query.
+
+        :param queries: Strings to search in Documents' text.
+        :param top_k: Maximum number of Documents to return for each query.
+        :param batch_size: Maximum number of queries sent in a single request, defaults to 100.
+        :param max_concurrency: Maximum number of requests in flight, defaults to 1.
+        :return: One list of Documents for each query, in the same order as `queries`.
+        """
+        docs = self._document_store._bm25_retrieval_batch(
+            queries=queries,
+            filters=self._filters,
+            fuzziness=self._fuzziness,
+            top_k=top_k or self._top_k,
+            scale_score=self._scale_score,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+        )
+        return {"documents": docs}
@@ -2,13 +2,16 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import logging
-from typing import Any, Dict, List, Literal, Mapping, Optional, Union
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Generator, List, Literal, Mapping, Optional, Union
 
 import numpy as np
 
 # There are no import stubs for elastic_transport and elasticsearch so mypy fails
 from elastic_transport import NodeConfig  # type: ignore[import-not-found]
-from elasticsearch import Elasticsearch, helpers  # type: ignore[import-not-found]
+from elasticsearch import AsyncElasticsearch, Elasticsearch, helpers  # type: ignore[import-not-found]
 from haystack import default_from_dict, default_to_dict
 from haystack.dataclasses import Document
 from haystack.document_stores import DocumentStoreError, DuplicateDocumentError, DuplicatePolicy
@@ -92,6 +95,8 @@ class ElasticsearchDocumentStore:
         self._index = index
         self._embedding_similarity_function = embedding_similarity_function
         self._kwargs = kwargs
+        # The async client is created on first use, so that it's bound to the running event loop
+        self._async_client: Optional[AsyncElasticsearch] = None
 
         # Check client connection, this will raise if not connected
         self._client.info()
@@ -129,41 +134,219 @@ class ElasticsearchDocumentStore:
         """
         return self._client.count(index=self._index)["count"]
 
+    async def count_documents_async(self) -> int:
+        """
+        Asynchronously returns how many documents are present in the document store.
+        """
+        return (await self._get_async_client().count(index=self._index))["count"]
+
+    def _get_async_client(self) -> AsyncElasticsearch:
+        """
+        Returns the `AsyncElasticsearch` client shared by all the async methods, creating it on first use.
+        """
+        if self._async_client is None:
+            self._async_client = AsyncElasticsearch(self._hosts, **self._kwargs)
+        return self._async_client
+
+    async def close_async(self) -> None:
+        """
+        Closes the connections of the async client, if it has been created.
+        """
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
     def _search_documents(self, **kwargs) -> List[Document]:
         """
         Calls the Elasticsearch client's search method and handles pagination.
         """
+        top_k = self._search_top_k(kwargs)
+        documents: List[Document] = []
+        # Handle pagination
+        while True:
+            res = self._client.search(index=self._index, from_=len(documents), **kwargs)
+            documents.extend(self._deserialize_search_response(res))
+            if self._is_last_page(res, len(documents), top_k):
+                return documents
 
-        top_k = kwargs.get("size")
-        if top_k is None and "knn" in kwargs and "k" in kwargs["knn"]:
-            top_k = kwargs["knn"]["k"]
-
+    async def _search_documents_async(self, **kwargs) -> List[Document]:
+        """
+        Calls the async Elasticsearch client's search method and handles pagination.
+        """
+        top_k = self._search_top_k(kwargs)
         documents: List[Document] = []
-        from_ = 0
         # Handle pagination
         while True:
-            res = self._client.search(
-                index=self._index,
-                from_=from_,
-                **kwargs,
-            )
+            res = await self._get_async_client().search(index=self._index, from_=len(documents), **kwargs)
+            documents.extend(self._deserialize_search_response(res))
+            if self._is_last_page(res, len(documents), top_k):
+                return documents
 
-            documents.extend(self._deserialize_document(hit) for hit in res["hits"]["hits"])
-            from_ = len(documents)
+    @staticmethod
+    def _search_top_k(search_kwargs: Dict[str, Any]) -> Optional[int]:
+        """
+        Returns the maximum number of Documents a search returns, or None if it returns all the matching ones.
+        """
+        top_k = search_kwargs.get("size")
+        if top_k is None and "knn" in search_kwargs and "k" in search_kwargs["knn"]:
+            top_k = search_kwargs["knn"]["k"]
+        return top_k
 
-            if top_k is not None and from_ >= top_k:
-                break
-            if from_ >= res["hits"]["total"]["value"]:
-                break
-        return documents
+    @staticmethod
+    def _is_last_page(res: Dict[str, Any], fetched: int, top_k: Optional[int]) -> bool:
+        """
+        Tells if the pagination of a search stops after `res`, once `fetched` Documents have been retrieved.
+        """
+        return (top_k is not None and fetched >= top_k) or fetched >= res["hits"]["total"]["value"]
+
+    def _deserialize_search_response(self, res: Dict[str, Any]) -> List[Document]:
+        """
+        Creates the Documents of the hits of a search response.
+        """
+        return [self._deserialize_document(hit) for hit in res["hits"]["hits"]]
 
     def filter_documents(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        return list(self.iter_documents(filters))
+
+    def iter_documents(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        *,
+        batch_size: int = 1000,
+        slices: int = 1,
+        keep_alive: str = "1m",
+    ) -> Generator[Document, None, None]:
+        """
+        Iterates over all the Documents matching `filters` without loading them all in memory.
+
+        Pages are fetched with a point in time and `search_after`, so the cost of each page doesn't grow
+        with its depth and the `index.max_result_window` limit doesn't apply. The point in time is closed
+        once the generator is exhausted or closed.
+
+        :param filters: Filters applied to the Documents, see `filter_documents`. Defaults to None.
+        :param batch_size: Number of Documents fetched with each request. Defaults to 1000.
+        :param slices: Number of slices fetched in parallel, each one in its own thread.
+            Documents are not returned in a deterministic order when this is greater than 1. Defaults to 1.
+        :param keep_alive: How long Elasticsearch keeps the point in time alive between two requests.
+            Defaults to "1m".
+        :raises ValueError: If `batch_size` or `slices` is not a positive integer.
+        :return: A generator of Documents.
+        """
+        if batch_size < 1 or slices < 1:
+            msg = "batch_size and slices must be positive integers"
+            raise ValueError(msg)
+
         if filters and "operator" not in filters and "conditions" not in filters:
             filters = convert(filters)
-
         query = {"bool": {"filter": _normalize_filters(filters)}} if filters else None
-        documents = self._search_documents(query=query)
-        return documents
+
+        # Holds the latest point in time id, which the searches may refresh and which must be the one closed
+        pit = {"id": self._client.open_point_in_time(index=self._index, keep_alive=keep_alive)["id"]}
+        try:
+            if slices == 1:
+                pages = self._iter_pit_pages(pit, query=query, batch_size=batch_size, keep_alive=keep_alive)
+            else:
+                pages = self._iter_sliced_pit_pages(
+                    pit, query=query, batch_size=batch_size, keep_alive=keep_alive, slices=slices
+                )
+            for hits in pages:
+                yield from (self._deserialize_document(hit) for hit in hits)
+        finally:
+            self._client.close_point_in_time(id=pit["id"])
+
+    def _iter_pit_pages(
+        self,
+        pit: Dict[str, str],
+        *,
+        query: Optional[Dict[str, Any]],
+        batch_size: int,
+        keep_alive: str,
+        slice_: Optional[Dict[str, int]] = None,
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Yields the hits of a point in time search one page at a time, following `search_after`.
+        `pit["id"]` is updated with the id returned by each response.
+        """
+        search_after = None
+        while True:
+            kwargs: Dict[str, Any] = {}
+            if slice_ is not None:
+                kwargs["slice"] = slice_
+            if search_after is not None:
+                kwargs["search_after"] = search_after
+            res = self._client.search(
+                pit={"id": pit["id"], "keep_alive": keep_alive},
+                query=query,
+                size=batch_size,
+                sort=["_shard_doc"],
+                **kwargs,
+            )
+            # The point in time id can change between requests, the latest one must always be used
+            pit["id"] = res.get("pit_id", pit["id"])
+            hits = res["hits"]["hits"]
+            if hits:
+                yield hits
+            if len(hits) < batch_size:
+                return
+            search_after = hits[-1]["sort"]
+
+    def _iter_sliced_pit_pages(
+        self,
+        pit: Dict[str, str],
+        *,
+        query: Optional[Dict[str, Any]],
+        batch_size: int,
+        keep_alive: str,
+        slices: int,
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Fetches each slice of a point in time search in its own thread and yields the pages as they arrive.
+
+        At most `slices` pages wait to be consumed at any time, the threads block until the caller catches up.
+        """
+        pages: "queue.Queue[Any]" = queue.Queue(maxsize=slices)  # noqa: UP037
+        stop = threading.Event()
+        slice_done = object()
+
+        def put(item: Any):
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def fetch_slice(slice_id: int):
+            try:
+                for hits in self._iter_pit_pages(
+                    pit,
+                    query=query,
+                    batch_size=batch_size,
+                    keep_alive=keep_alive,
+                    slice_={"id": slice_id, "max": slices},
+                ):
+                    if stop.is_set():
+                        return
+                    put(hits)
+                put(slice_done)
+            except Exception as e:
+                put(e)
+
+        with ThreadPoolExecutor(max_workers=slices) as executor:
+            for slice_id in range(slices):
+                executor.submit(fetch_slice, slice_id)
+            try:
+                finished = 0
+                while finished < slices:
+                    item = pages.get()
+                    if item is slice_done:
+                        finished += 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                stop.set()
 
     def write_documents(self, documents: List[Document], policy: DuplicatePolicy = DuplicatePolicy.NONE) -> int:
         """
@@ -279,6 +462,74 @@ class ElasticsearchDocumentStore:
         :return: List of Document that match `query`
         """
 
+        body = self._bm25_query_body(query, filters=filters, fuzziness=fuzziness, top_k=top_k)
+        documents = self._search_documents(**body)
+
+        if scale_score:
+            self._scale_bm25_scores(documents)
+
+        return documents
+
+    async def _bm25_retrieval_async(
+        self,
+        query: str,
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        fuzziness: str = "AUTO",
+        top_k: int = 10,
+        scale_score: bool = False,
+    ) -> List[Document]:
+        """
+        Async version of `_bm25_retrieval`, used by `ElasticsearchBM25Retriever.run_async`.
+        """
+        body = self._bm25_query_body(query, filters=filters, fuzziness=fuzziness, top_k=top_k)
+        documents = await self._search_documents_async(**body)
+
+        if scale_score:
+            self._scale_bm25_scores(documents)
+
+        return documents
+
+    def _bm25_retrieval_batch(
+        self,
+        queries: List[str],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        fuzziness: str = "AUTO",
+        top_k: int = 10,
+        scale_score: bool = False,
+        batch_size: int = 100,
+        max_concurrency: int = 1,
+    ) -> List[List[Document]]:
+        """
+        Runs `_bm25_retrieval` for many queries, packing them into `_msearch` requests.
+
+        This method is not mean to be part of the public interface of
+        `ElasticsearchDocumentStore` nor called directly.
+        `ElasticsearchBM25Retriever.run_batch` uses this method directly and is the public interface for it.
+
+        :param queries: Strings to search in saved Documents' text.
+        :param filters: Filters applied to the retrieved Documents of every query, defaults to None
+        :param fuzziness: Fuzziness parameter passed to Elasticsearch, defaults to "AUTO".
+        :param top_k: Maximum number of Documents to return for each query, defaults to 10
+        :param scale_score: If `True` scales the Document`s scores between 0 and 1, defaults to False
+        :param batch_size: Maximum number of queries sent in a single `_msearch` request, defaults to 100
+        :param max_concurrency: Maximum number of `_msearch` requests in flight, defaults to 1
+        :raises ValueError: If any of `queries` is an empty string
+        :return: One list of Documents for each query, in the same order as `queries`
+        """
+        bodies = [self._bm25_query_body(query, filters=filters, fuzziness=fuzziness, top_k=top_k) for query in queries]
+        results = self._msearch_documents(bodies, batch_size=batch_size, max_concurrency=max_concurrency)
+
+        if scale_score:
+            for documents in results:
+                self._scale_bm25_scores(documents)
+
+        return results
+
+    def _bm25_query_body(
+        self, query: str, *, filters: Optional[Dict[str, Any]], fuzziness: str, top_k: int
+    ) -> Dict[str, Any]:
         if not query:
             msg = "query must be a non empty string"
             raise ValueError(msg)
@@ -304,13 +555,11 @@ class ElasticsearchDocumentStore:
         if filters:
             body["query"]["bool"]["filter"] = _normalize_filters(filters)
 
-        documents = self._search_documents(**body)
-
-        if scale_score:
-            for doc in documents:
-                doc.score = float(1 / (1 + np.exp(-np.asarray(doc.score / BM25_SCALING_FACTOR))))
+        return body
 
-        return documents
+    def _scale_bm25_scores(self, documents: List[Document]):
+        for doc in documents:
+            doc.score = float(1 / (1 + np.exp(-np.asarray(doc.score / BM25_SCALING_FACTOR))))
 
     def _embedding_retrieval(
         self,
@@ -340,6 +589,64 @@ class ElasticsearchDocumentStore:
         :return: List of Document that are most similar to `query_embedding`
         """
 
+        body = self._embedding_query_body(query_embedding, filters=filters, top_k=top_k, num_candidates=num_candidates)
+        docs = self._search_documents(**body)
+        return docs
+
+    async def _embedding_retrieval_async(
+        self,
+        query_embedding: List[float],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        num_candidates: Optional[int] = None,
+    ) -> List[Document]:
+        """
+        Async version of `_embedding_retrieval`, used by `ElasticsearchEmbeddingRetriever.run_async`.
+        """
+        body = self._embedding_query_body(query_embedding, filters=filters, top_k=top_k, num_candidates=num_candidates)
+        return await self._search_documents_async(**body)
+
+    def _embedding_retrieval_batch(
+        self,
+        query_embeddings: List[List[float]],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        num_candidates: Optional[int] = None,
+        batch_size: int = 100,
+        max_concurrency: int = 1,
+    ) -> List[List[Document]]:
+        """
+        Runs `_embedding_retrieval` for many query embeddings, packing them into `_msearch` requests.
+
+        This method is not mean to be part of the public interface of
+        `ElasticsearchDocumentStore` nor called directly.
+        `ElasticsearchEmbeddingRetriever.run_batch` uses this method directly and is the public interface for it.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param filters: Filters applied to the retrieved Documents of every query. Defaults to None.
+        :param top_k: Maximum number of Documents to return for each query, defaults to 10
+        :param num_candidates: Number of approximate nearest neighbor candidates on each shard. Defaults to top_k * 10.
+        :param batch_size: Maximum number of queries sent in a single `_msearch` request, defaults to 100
+        :param max_concurrency: Maximum number of `_msearch` requests in flight, defaults to 1
+        :raises ValueError: If any of `query_embeddings` is an empty list
+        :return: One list of Documents for each query embedding, in the same order as `query_embeddings`
+        """
+        bodies = [
+            self._embedding_query_body(query_embedding, filters=filters, top_k=top_k, num_candidates=num_candidates)
+            for query_embedding in query_embeddings
+        ]
+        return self._msearch_documents(bodies, batch_size=batch_size, max_concurrency=max_concurrency)
+
+    def _embedding_query_body(
+        self,
+        query_embedding: List[float],
+        *,
+        filters: Optional[Dict[str, Any]],
+        top_k: int,
+        num_candidates: Optional[int],
+    ) -> Dict[str, Any]:
         if not query_embedding:
             msg = "query_embedding must be a non-empty list of floats"
             raise ValueError(msg)
@@ -354,10 +661,47 @@ class ElasticsearchDocumentStore:
                 "k": top_k,
                 "num_candidates": num_candidates,
             },
+            "size": top_k,
         }
 
         if filters:
             body["knn"]["filter"] = _normalize_filters(filters)
 
-        docs = self._search_documents(**body)
-        return docs
+        return body
+
+    def _msearch_documents(
+        self, bodies: List[Dict[str, Any]], *, batch_size: int, max_concurrency: int
+    ) -> List[List[Document]]:
+        """
+        Sends the search `bodies` through `_msearch`, `batch_size` of them per request
+        and with up to `max_concurrency` requests in flight.
+
+        :raises DocumentStoreError: If any of the searches failed.
+        :return: The Documents found by each search, in the same order as `bodies`.
+        """
+        if batch_size < 1 or max_concurrency < 1:
+            msg = "batch_size and max_concurrency must be positive integers"
+            raise ValueError(msg)
+
+        def msearch(chunk: List[Dict[str, Any]]) -> List[List[Document]]:
+            searches: List[Dict[str, Any]] = []
+            for body in chunk:
+                searches.extend(({}, body))
+            res = self._client.msearch(index=self._index, searches=searches)
+
+            results = []
+            for response in res["responses"]:
+                if "error" in response:
+                    msg = f"Failed to search documents in Elasticsearch. Error:\n{response['error']}"
+                    raise DocumentStoreError(msg)
+                results.append(self._deserialize_search_response(response))
+            return results
+
+        chunks = [bodies[i : i + batch_size] for i in range(0, len(bodies), batch_size)]
+        if max_concurrency == 1 or len(chunks) <= 1:
+            chunk_results = [msearch(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                chunk_results = list(executor.map(msearch, chunks))
+
+        return [documents for chunk_result in chunk_results for documents in chunk_result]
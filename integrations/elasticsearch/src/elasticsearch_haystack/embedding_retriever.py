@@ -79,3 +79,47 @@ class ElasticsearchEmbeddingRetriever:
             num_candidates=self._num_candidates,
         )
         return {"documents": docs}
+
+    async def run_async(self, query_embedding: List[float], top_k: Optional[int] = None):
+        """
+        Asynchronously retrieve documents using a vector similarity metric.
+
+        :param query_embedding: Embedding of the query.
+        :param top_k: Maximum number of Documents to return.
+        :return: List of Documents similar to `query_embedding`.
+        """
+        docs = await self._document_store._embedding_retrieval_async(
+            query_embedding=query_embedding,
+            filters=self._filters,
+            top_k=top_k or self._top_k,
+            num_candidates=self._num_candidates,
+        )
+        return {"documents": docs}
+
+    def run_batch(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: Optional[int] = None,
+        batch_size: int = 100,
+        max_concurrency: int = 1,
+    ) -> Dict[str, List[List[Document]]]:
+        """
+        Retrieve documents for many query embeddings at once.
+
+        The searches are packed into `_msearch` requests, saving one round trip per query.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param top_k: Maximum number of Documents to return for each query.
+        :param batch_size: Maximum number of queries sent in a single request, defaults to 100.
+        :param max_concurrency: Maximum number of requests in flight, defaults to 1.
+        :return: One list of Documents for each query embedding, in the same order as `query_embeddings`.
+        """
+        docs = self._document_store._embedding_retrieval_batch(
+            query_embeddings=query_embeddings,
+            filters=self._filters,
+            top_k=top_k or self._top_k,
+            num_candidates=self._num_candidates,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+        )
+        return {"documents": docs}
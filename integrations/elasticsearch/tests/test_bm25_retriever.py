@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 from unittest.mock import Mock, patch
 
 from haystack.dataclasses import Document
@@ -80,3 +81,38 @@ def test_run():
     assert len(res) == 1
     assert len(res["documents"]) == 1
     assert res["documents"][0].content == "Test doc"
+
+
+def test_run_batch():
+    mock_store = Mock(spec=ElasticsearchDocumentStore)
+    mock_store._bm25_retrieval_batch.return_value = [[Document(content="Test doc")], []]
+    retriever = ElasticsearchBM25Retriever(document_store=mock_store)
+    res = retriever.run_batch(queries=["some query", "another query"], batch_size=50)
+    mock_store._bm25_retrieval_batch.assert_called_once_with(
+        queries=["some query", "another query"],
+        filters={},
+        fuzziness="AUTO",
+        top_k=10,
+        scale_score=False,
+        batch_size=50,
+        max_concurrency=1,
+    )
+    assert len(res["documents"]) == 2
+    assert res["documents"][0][0].content == "Test doc"
+    assert res["documents"][1] == []
+
+
+def test_run_async():
+    mock_store = Mock(spec=ElasticsearchDocumentStore)
+    mock_store._bm25_retrieval_async.return_value = [Document(content="Test doc")]
+    retriever = ElasticsearchBM25Retriever(document_store=mock_store)
+    res = asyncio.run(retriever.run_async(query="some query"))
+    mock_store._bm25_retrieval_async.assert_awaited_once_with(
+        query="some query",
+        filters={},
+        fuzziness="AUTO",
+        top_k=10,
+        scale_score=False,
+    )
+    assert len(res["documents"]) == 1
+    assert res["documents"][0].content == "Test doc"
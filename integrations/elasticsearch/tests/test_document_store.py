@@ -2,10 +2,12 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 import random
 from typing import List
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 from elasticsearch.exceptions import BadRequestError  # type: ignore[import-not-found]
 from haystack.dataclasses.document import Document
@@ -95,6 +97,54 @@ class TestDocumentStore(DocumentStoreBaseTests):
         assert document_store._index == "default"
         assert document_store._embedding_similarity_function == "cosine"
 
+    @patch("elasticsearch_haystack.document_store.Elasticsearch")
+    def test_iter_documents_follows_search_after(self, mock_elasticsearch_client):
+        client = mock_elasticsearch_client.return_value
+        client.open_point_in_time.return_value = {"id": "pit-1"}
+        hits = [{"_source": {"id": str(i), "content": f"doc {i}"}, "_score": None, "sort": [i]} for i in range(5)]
+        client.search.side_effect = [
+            {"pit_id": "pit-2", "hits": {"hits": hits[:2]}},
+            {"pit_id": "pit-2", "hits": {"hits": hits[2:4]}},
+            {"pit_id": "pit-2", "hits": {"hits": hits[4:]}},
+        ]
+        document_store = ElasticsearchDocumentStore(hosts="some hosts")
+
+        docs = list(document_store.iter_documents(batch_size=2))
+
+        assert [doc.id for doc in docs] == ["0", "1", "2", "3", "4"]
+        assert client.search.call_count == 3
+        second_call = client.search.call_args_list[1].kwargs
+        assert second_call["pit"] == {"id": "pit-2", "keep_alive": "1m"}
+        assert second_call["search_after"] == [1]
+        assert "index" not in second_call
+        # the id refreshed by the searches is the one closed
+        client.close_point_in_time.assert_called_once_with(id="pit-2")
+
+    @patch("elasticsearch_haystack.document_store.Elasticsearch")
+    def test_iter_documents_closes_point_in_time_on_early_exit(self, mock_elasticsearch_client):
+        client = mock_elasticsearch_client.return_value
+        client.open_point_in_time.return_value = {"id": "pit-1"}
+        client.search.return_value = {
+            "hits": {"hits": [{"_source": {"id": "1", "content": "doc"}, "_score": None, "sort": [1]}]}
+        }
+        document_store = ElasticsearchDocumentStore(hosts="some hosts")
+
+        documents = document_store.iter_documents(batch_size=1)
+        next(documents)
+        documents.close()
+
+        client.close_point_in_time.assert_called_once_with(id="pit-1")
+
+    def test_iter_documents(self, document_store: ElasticsearchDocumentStore):
+        docs = [Document(content=f"Document {i}", meta={"number": i % 2}) for i in range(25)]
+        document_store.write_documents(docs)
+
+        assert len(list(document_store.iter_documents(batch_size=10))) == 25
+
+        filters = {"field": "meta.number", "operator": "==", "value": 1}
+        result = list(document_store.iter_documents(filters, batch_size=5, slices=2))
+        assert sorted(doc.content for doc in result) == sorted(doc.content for doc in docs if doc.meta["number"] == 1)
+
     def test_write_documents(self, document_store: ElasticsearchDocumentStore):
         docs = [Document(id="1")]
         assert document_store.write_documents(docs) == 1
@@ -221,6 +271,28 @@ class TestDocumentStore(DocumentStoreBaseTests):
         assert results[0].content == "Most similar document"
         assert results[1].content == "2nd best document"
 
+    def test_embedding_retrieval_async(self, document_store: ElasticsearchDocumentStore):
+        docs = [
+            Document(content="Most similar document", embedding=[1.0, 1.0, 1.0, 1.0]),
+            Document(content="2nd best document", embedding=[0.8, 0.8, 0.8, 1.0]),
+            Document(content="Not very similar document", embedding=[0.0, 0.8, 0.3, 0.9]),
+        ]
+        document_store.write_documents(docs)
+
+        async def retrieve():
+            try:
+                return await asyncio.gather(
+                    *(
+                        document_store._embedding_retrieval_async(query_embedding=[0.1, 0.1, 0.1, 0.1], top_k=2)
+                        for _ in range(3)
+                    )
+                )
+            finally:
+                await document_store.close_async()
+
+        for results in asyncio.run(retrieve()):
+            assert [doc.content for doc in results] == ["Most similar document", "2nd best document"]
+
     def test_embedding_retrieval_with_filters(self, document_store: ElasticsearchDocumentStore):
         docs = [
             Document(content="Most similar document", embedding=[1.0, 1.0, 1.0, 1.0]),
@@ -252,6 +324,86 @@ class TestDocumentStore(DocumentStoreBaseTests):
         results = document_store._embedding_retrieval(query_embedding=[0.1, 0.1, 0.1, 0.1], top_k=11, filters={})
         assert len(results) == 11
 
+    @pytest.mark.parametrize(
+        "search_kwargs, expected_pages",
+        [({"size": 3}, [0, 2]), ({"knn": {"k": 3}}, [0, 2]), ({}, [0, 2, 4])],
+    )
+    @patch("elasticsearch_haystack.document_store.AsyncElasticsearch")
+    @patch("elasticsearch_haystack.document_store.Elasticsearch")
+    def test_search_documents_paginates_the_same_sync_and_async(
+        self, mock_elasticsearch_client, mock_async_elasticsearch_client, search_kwargs, expected_pages
+    ):
+        def search(index, from_, **kwargs):  # noqa: ARG001
+            # pages of 2 hits out of 6 matching Documents
+            hits = [{"_source": {"id": str(i), "content": f"doc {i}"}, "_score": 1.0} for i in range(6)]
+            return {"hits": {"hits": hits[from_ : from_ + 2], "total": {"value": 6}}}
+
+        async def async_search(**kwargs):
+            return search(**kwargs)
+
+        client = mock_elasticsearch_client.return_value
+        client.search.side_effect = search
+        async_client = mock_async_elasticsearch_client.return_value
+        async_client.search.side_effect = async_search
+        document_store = ElasticsearchDocumentStore(hosts="some hosts")
+
+        documents = document_store._search_documents(**search_kwargs)
+        async_documents = asyncio.run(document_store._search_documents_async(**search_kwargs))
+
+        assert [doc.id for doc in documents] == [doc.id for doc in async_documents]
+        assert [call.kwargs["from_"] for call in client.search.call_args_list] == expected_pages
+        assert [call.kwargs["from_"] for call in async_client.search.call_args_list] == expected_pages
+
+    @patch("elasticsearch_haystack.document_store.Elasticsearch")
+    def test_embedding_retrieval_batch_uses_msearch(self, mock_elasticsearch_client):
+        client = mock_elasticsearch_client.return_value
+
+        def msearch(searches, **_kwargs):
+            bodies = searches[1::2]
+            return {
+                "responses": [
+                    {"hits": {"hits": [{"_source": {"content": str(body["knn"]["query_vector"])}, "_score": 1.0}]}}
+                    for body in bodies
+                ]
+            }
+
+        client.msearch.side_effect = msearch
+        document_store = ElasticsearchDocumentStore(hosts="some hosts")
+        query_embeddings = [[float(i), 0.0] for i in range(5)]
+
+        results = document_store._embedding_retrieval_batch(query_embeddings, top_k=3, batch_size=2, max_concurrency=2)
+
+        assert client.msearch.call_count == 3
+        assert [docs[0].content for docs in results] == [str(embedding) for embedding in query_embeddings]
+        first_search = client.msearch.call_args_list[0].kwargs["searches"][1]
+        assert first_search["size"] == 3
+        assert first_search["knn"]["k"] == 3
+
+    @patch("elasticsearch_haystack.document_store.Elasticsearch")
+    def test_bm25_retrieval_batch_raises_on_failed_search(self, mock_elasticsearch_client):
+        client = mock_elasticsearch_client.return_value
+        client.msearch.return_value = {"responses": [{"hits": {"hits": []}}, {"error": {"type": "some_error"}}]}
+        document_store = ElasticsearchDocumentStore(hosts="some hosts")
+
+        with pytest.raises(DocumentStoreError):
+            document_store._bm25_retrieval_batch(["first query", "second query"])
+
+    def test_embedding_retrieval_batch(self, document_store: ElasticsearchDocumentStore):
+        docs = [
+            Document(content="Most similar document", embedding=[1.0, 1.0, 1.0, 1.0]),
+            Document(content="2nd best document", embedding=[0.8, 0.8, 0.8, 1.0]),
+            Document(content="Not very similar document", embedding=[0.0, 0.8, 0.3, 0.9]),
+        ]
+        document_store.write_documents(docs)
+        results = document_store._embedding_retrieval_batch(
+            query_embeddings=[[0.1, 0.1, 0.1, 0.1], [0.2, 0.2, 0.2, 0.2], [0.3, 0.3, 0.3, 0.3]],
+            top_k=2,
+            batch_size=2,
+        )
+        assert len(results) == 3
+        for documents in results:
+            assert [doc.content for doc in documents] == ["Most similar document", "2nd best document"]
+
     def test_embedding_retrieval_query_documents_different_embedding_sizes(
         self, document_store: ElasticsearchDocumentStore
     ):
@@ -275,3 +427,16 @@ class TestDocumentStore(DocumentStoreBaseTests):
 
         with pytest.raises(DocumentStoreError):
             document_store.write_documents(docs)
+
+    def test_write_documents_with_numpy_embeddings(self, document_store: ElasticsearchDocumentStore):
+        """
+        Test that the rows of a NumPy matrix, as set by embedders with an embedding_dtype, are written as embeddings.
+        """
+        embeddings = np.array([[0.5, 1.0, 0.0, 0.0], [1.0, 0.5, 0.0, 0.0]], dtype=np.float16)
+        docs = [Document(id=str(i), content=f"doc {i}") for i in range(2)]
+        for doc, embedding in zip(docs, embeddings):
+            doc.embedding = embedding
+
+        assert document_store.write_documents(docs) == 2
+        documents = sorted(document_store.filter_documents(), key=lambda doc: doc.id)
+        assert [doc.embedding for doc in documents] == [[0.5, 1.0, 0.0, 0.0], [1.0, 0.5, 0.0, 0.0]]
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 from unittest.mock import Mock, patch
 
 from haystack.dataclasses import Document
@@ -77,3 +78,36 @@ def test_run():
     assert len(res["documents"]) == 1
     assert res["documents"][0].content == "Test doc"
     assert res["documents"][0].embedding == [0.1, 0.2]
+
+
+def test_run_batch():
+    mock_store = Mock(spec=ElasticsearchDocumentStore)
+    mock_store._embedding_retrieval_batch.return_value = [[Document(content="Test doc", embedding=[0.1, 0.2])], []]
+    retriever = ElasticsearchEmbeddingRetriever(document_store=mock_store)
+    res = retriever.run_batch(query_embeddings=[[0.5, 0.7], [0.1, 0.3]], max_concurrency=4)
+    mock_store._embedding_retrieval_batch.assert_called_once_with(
+        query_embeddings=[[0.5, 0.7], [0.1, 0.3]],
+        filters={},
+        top_k=10,
+        num_candidates=None,
+        batch_size=100,
+        max_concurrency=4,
+    )
+    assert len(res["documents"]) == 2
+    assert res["documents"][0][0].content == "Test doc"
+    assert res["documents"][1] == []
+
+
+def test_run_async():
+    mock_store = Mock(spec=ElasticsearchDocumentStore)
+    mock_store._embedding_retrieval_async.return_value = [Document(content="Test doc", embedding=[0.1, 0.2])]
+    retriever = ElasticsearchEmbeddingRetriever(document_store=mock_store)
+    res = asyncio.run(retriever.run_async(query_embedding=[0.5, 0.7]))
+    mock_store._embedding_retrieval_async.assert_awaited_once_with(
+        query_embedding=[0.5, 0.7],
+        filters={},
+        top_k=10,
+        num_candidates=None,
+    )
+    assert len(res["documents"]) == 1
+    assert res["documents"][0].content == "Test doc"
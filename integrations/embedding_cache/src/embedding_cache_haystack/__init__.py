@@ -0,0 +1,11 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+from embedding_cache_haystack.embedding_cache import (
+    EmbeddingCache,
+    InMemoryEmbeddingCache,
+    SQLiteEmbeddingCache,
+    deserialize_embedding_cache,
+)
+
+__all__ = ["EmbeddingCache", "InMemoryEmbeddingCache", "SQLiteEmbeddingCache", "deserialize_embedding_cache"]
@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+import hashlib
+import importlib
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from haystack import DeserializationError, default_from_dict, default_to_dict
+
+T = TypeVar("T")
+
+
+class EmbeddingCache(ABC):
+    """
+    Stores embeddings by key, so that embedders only compute the embeddings of texts they haven't seen yet.
+
+    Keys are built with `EmbeddingCache.key` from everything the embedding depends on: the model,
+    its settings and the prepared text. `hits` and `misses` count the lookups since the cache was created.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """
+        Hashes the parts of a key, such as the model name, the input type and the text to embed.
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get_many(self, keys: List[str]) -> List[Optional[List[float]]]:
+        """
+        Looks up the embeddings of `keys`, `None` for the ones that are not cached.
+        """
+        embeddings = self._get_many(keys)
+        hits = sum(embedding is not None for embedding in embeddings)
+        self.hits += hits
+        self.misses += len(keys) - hits
+        return embeddings
+
+    def get_or_embed(
+        self, keys: List[str], inputs: Sequence[T], embed: Callable[[List[T]], List[List[float]]]
+    ) -> List[List[float]]:
+        """
+        Returns the embeddings of `inputs`, calling `embed` only with the inputs whose key is not cached
+        and caching the embeddings it returns.
+        """
+        embeddings = self.get_many(keys)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            new_embeddings = embed([inputs[i] for i in missing])
+            for i, embedding in zip(missing, new_embeddings):
+                embeddings[i] = embedding
+            self.put_many({keys[i]: embedding for i, embedding in zip(missing, new_embeddings)})
+        return embeddings  # type: ignore[return-value]
+
+    @abstractmethod
+    def _get_many(self, keys: List[str]) -> List[Optional[List[float]]]:
+        pass
+
+    @abstractmethod
+    def put_many(self, embeddings: Dict[str, List[float]]):
+        """
+        Stores embeddings by key, evicting the least recently used ones if the cache is full.
+        """
+
+    def to_dict(self) -> Dict[str, Any]:
+        return default_to_dict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EmbeddingCache":
+        return default_from_dict(cls, data)
+
+
+class InMemoryEmbeddingCache(EmbeddingCache):
+    """
+    Keeps up to `max_entries` embeddings in memory, dropping the least recently used ones first.
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        super().__init__()
+        self.max_entries = max_entries
+        self._embeddings: OrderedDict[str, List[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._embeddings)
+
+    def _get_many(self, keys: List[str]) -> List[Optional[List[float]]]:
+        embeddings: List[Optional[List[float]]] = []
+        with self._lock:
+            for key in keys:
+                embedding = self._embeddings.get(key)
+                if embedding is not None:
+                    self._embeddings.move_to_end(key)
+                embeddings.append(embedding)
+        return embeddings
+
+    def put_many(self, embeddings: Dict[str, List[float]]):
+        with self._lock:
+            self._embeddings.update(embeddings)
+            for key in embeddings:
+                self._embeddings.move_to_end(key)
+            while len(self._embeddings) > self.max_entries:
+                self._embeddings.popitem(last=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return default_to_dict(self, max_entries=self.max_entries)
+
+
+class SQLiteEmbeddingCache(EmbeddingCache):
+    """
+    Keeps up to `max_entries` embeddings in a SQLite database, dropping the least recently used ones first.
+
+    The embeddings are stored as arrays of doubles, so they are returned exactly as they were computed.
+    """
+
+    def __init__(self, path: str, max_entries: int = 1_000_000):
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, embedding BLOB, last_used REAL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def _get_many(self, keys: List[str]) -> List[Optional[List[float]]]:
+        found: Dict[str, List[float]] = {}
+        with self._lock, self._connection:
+            # SQLite limits the number of variables of a statement
+            for i in range(0, len(keys), 500):
+                batch = keys[i : i + 500]
+                rows = self._connection.execute(
+                    f"SELECT key, embedding FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",  # noqa: S608
+                    batch,
+                )
+                for key, blob in rows:
+                    found[key] = array("d", blob).tolist()
+            now = time.time()
+            self._connection.executemany(
+                "UPDATE embeddings SET last_used = ? WHERE key = ?", [(now, key) for key in found]
+            )
+        return [found.get(key) for key in keys]
+
+    def put_many(self, embeddings: Dict[str, List[float]]):
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, embedding, last_used) VALUES (?, ?, ?)",
+                [(key, array("d", embedding).tobytes(), now) for key, embedding in embeddings.items()],
+            )
+            excess = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self._connection.execute(
+                    "DELETE FROM embeddings WHERE key IN (SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+                    (excess,),
+                )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return default_to_dict(self, path=self.path, max_entries=self.max_entries)
+
+
+def deserialize_embedding_cache(data: Optional[Dict[str, Any]]) -> Optional[EmbeddingCache]:
+    """
+    Deserializes an embedding cache serialized with `EmbeddingCache.to_dict`.
+
+    The class named by `data["type"]` is imported, so subclasses of `EmbeddingCache` defined outside of
+    this package are deserialized too, as long as their module can be imported.
+    """
+    if data is None:
+        return None
+    cache_type = data.get("type", "")
+    module_name, _, class_name = cache_type.rpartition(".")
+    try:
+        cache_class = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError, ValueError) as error:
+        msg = f"Unknown embedding cache type '{cache_type}'"
+        raise DeserializationError(msg) from error
+    if not (isinstance(cache_class, type) and issubclass(cache_class, EmbeddingCache)):
+        msg = f"'{cache_type}' is not a subclass of EmbeddingCache"
+        raise DeserializationError(msg)
+    return cache_class.from_dict(data)
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+from typing import Any, Dict, List, Optional
+
+import pytest
+from haystack import DeserializationError, default_to_dict
+
+from embedding_cache_haystack import (
+    EmbeddingCache,
+    InMemoryEmbeddingCache,
+    SQLiteEmbeddingCache,
+    deserialize_embedding_cache,
+)
+
+
+class DictEmbeddingCache(EmbeddingCache):
+    """
+    A custom cache, to check that caches defined outside of the package can be deserialized.
+    """
+
+    def __init__(self, namespace: str = "default"):
+        super().__init__()
+        self.namespace = namespace
+        self._embeddings: Dict[str, List[float]] = {}
+
+    def _get_many(self, keys: List[str]) -> List[Optional[List[float]]]:
+        return [self._embeddings.get(key) for key in keys]
+
+    def put_many(self, embeddings: Dict[str, List[float]]):
+        self._embeddings.update(embeddings)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return default_to_dict(self, namespace=self.namespace)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    def make_cache(max_entries):
+        if request.param == "memory":
+            return InMemoryEmbeddingCache(max_entries=max_entries)
+        return SQLiteEmbeddingCache(str(tmp_path / "embeddings.db"), max_entries=max_entries)
+
+    return make_cache
+
+
+class TestEmbeddingCache:
+    def test_key(self):
+        key = InMemoryEmbeddingCache.key("model", "document", "text")
+        assert key == InMemoryEmbeddingCache.key("model", "document", "text")
+        assert key != InMemoryEmbeddingCache.key("model", "query", "text")
+        assert InMemoryEmbeddingCache.key("a", "bc") != InMemoryEmbeddingCache.key("ab", "c")
+
+    def test_get_and_put(self, make_cache):
+        cache = make_cache(max_entries=10)
+        cache.put_many({"a": [0.1, 0.2], "b": [0.3, 0.4]})
+
+        assert cache.get_many(["b", "c", "a"]) == [[0.3, 0.4], None, [0.1, 0.2]]
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_eviction(self, make_cache):
+        cache = make_cache(max_entries=2)
+        cache.put_many({"a": [1.0]})
+        cache.put_many({"b": [2.0]})
+        # "a" becomes the most recently used
+        cache.get_many(["a"])
+        cache.put_many({"c": [3.0]})
+
+        assert len(cache) == 2
+        assert cache.get_many(["a", "b", "c"]) == [[1.0], None, [3.0]]
+
+    def test_get_or_embed(self, make_cache):
+        cache = make_cache(max_entries=10)
+        cache.put_many({"a": [1.0]})
+        calls = []
+
+        def embed(texts):
+            calls.append(texts)
+            return [[float(len(text))] for text in texts]
+
+        assert cache.get_or_embed(["a", "b", "c"], ["x", "yy", "zzz"], embed) == [[1.0], [2.0], [3.0]]
+        assert cache.get_or_embed(["b", "c"], ["yy", "zzz"], embed) == [[2.0], [3.0]]
+        assert calls == [["yy", "zzz"]]
+
+    def test_sqlite_cache_persists(self, tmp_path):
+        path = str(tmp_path / "embeddings.db")
+        SQLiteEmbeddingCache(path).put_many({"a": [0.1, 1e-300]})
+
+        assert SQLiteEmbeddingCache(path).get_many(["a"]) == [[0.1, 1e-300]]
+
+    def test_serialization(self, tmp_path):
+        cache = SQLiteEmbeddingCache(str(tmp_path / "embeddings.db"), max_entries=5)
+        cache = deserialize_embedding_cache(cache.to_dict())
+
+        assert isinstance(cache, SQLiteEmbeddingCache)
+        assert cache.max_entries == 5
+        assert deserialize_embedding_cache(None) is None
+
+    def test_serialization_of_custom_cache(self):
+        cache = deserialize_embedding_cache(DictEmbeddingCache(namespace="jina").to_dict())
+
+        assert isinstance(cache, DictEmbeddingCache)
+        assert cache.namespace == "jina"
+
+    @pytest.mark.parametrize(
+        "cache_type", ["", "no_such_module.Cache", "collections.NoSuchCache", "collections.Counter"]
+    )
+    def test_deserialization_of_unknown_type(self, cache_type):
+        with pytest.raises(DeserializationError):
+            deserialize_embedding_cache({"type": cache_type, "init_parameters": {}})
@@ -2,7 +2,11 @@ import logging
 from typing import Any, Dict, List, Optional
 
 from gradientai import Gradient
-from haystack import Document, component, default_to_dict
+from haystack import Document, component, default_from_dict, default_to_dict
+from haystack.lazy_imports import LazyImport
+
+with LazyImport(message="Run 'pip install \"gradient-haystack[embedding-cache]\"'") as embedding_cache_import:
+    from embedding_cache_haystack import EmbeddingCache, deserialize_embedding_cache
 
 tqdm_imported: bool = True
 try:
@@ -47,6 +51,7 @@ class GradientDocumentEmbedder:
         workspace_id: Optional[str] = None,
         host: Optional[str] = None,
         progress_bar: bool = True,
+        embedding_cache: Optional["EmbeddingCache"] = None,
     ) -> None:
         """
         Create a GradientDocumentEmbedder component.
@@ -59,11 +64,16 @@ class GradientDocumentEmbedder:
                              variable GRADIENT_WORKSPACE_ID.
         :param host: The Gradient host. By default it uses https://api.gradient.ai/.
         :param progress_bar: Whether to show a progress bar while embedding the documents.
+        :param embedding_cache: Cache of the embeddings, for example an `InMemoryEmbeddingCache` or a
+            `SQLiteEmbeddingCache` from the `embedding_cache_haystack` package.
+            Only the documents whose content has no cached embedding for the same model
+            are sent to Gradient. Defaults to no cache.
         """
         self._batch_size = batch_size
         self._host = host
         self._model_name = model_name
         self._progress_bar = progress_bar
+        self._embedding_cache = embedding_cache
 
         self._gradient = Gradient(access_token=access_token, host=host, workspace_id=workspace_id)
 
@@ -77,7 +87,23 @@ class GradientDocumentEmbedder:
         """
         Serialize the component to a Python dictionary.
         """
-        return default_to_dict(self, workspace_id=self._gradient.workspace_id, model_name=self._model_name)
+        return default_to_dict(
+            self,
+            workspace_id=self._gradient.workspace_id,
+            model_name=self._model_name,
+            embedding_cache=self._embedding_cache.to_dict() if self._embedding_cache is not None else None,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GradientDocumentEmbedder":
+        """
+        Deserialize the component from a Python dictionary.
+        """
+        init_params = data.get("init_parameters", {})
+        if init_params.get("embedding_cache") is not None:
+            embedding_cache_import.check()
+            init_params["embedding_cache"] = deserialize_embedding_cache(init_params["embedding_cache"])
+        return default_from_dict(cls, data)
 
     def warm_up(self) -> None:
         """
@@ -122,7 +148,13 @@ class GradientDocumentEmbedder:
             msg = "The embedding model has not been loaded. Please call warm_up() before running."
             raise RuntimeError(msg)
 
-        embeddings = self._generate_embeddings(documents=documents, batch_size=self._batch_size)
+        if self._embedding_cache is None:
+            embeddings = self._generate_embeddings(documents=documents, batch_size=self._batch_size)
+        else:
+            keys = [self._embedding_cache.key(self._model_name, doc.content) for doc in documents]
+            embeddings = self._embedding_cache.get_or_embed(
+                keys, documents, lambda docs: self._generate_embeddings(documents=docs, batch_size=self._batch_size)
+            )
         for doc, embedding in zip(documents, embeddings):
             doc.embedding = embedding
 
@@ -2,6 +2,7 @@ from unittest.mock import MagicMock, NonCallableMagicMock
 
 import numpy as np
 import pytest
+from embedding_cache_haystack import InMemoryEmbeddingCache
 from gradientai.openapi.client.models.generate_embedding_success import GenerateEmbeddingSuccess
 from haystack import Document
 
@@ -60,7 +61,7 @@ class TestGradientDocumentEmbedder:
         data = component.to_dict()
         assert data == {
             "type": "gradient_haystack.embedders.gradient_document_embedder.GradientDocumentEmbedder",
-            "init_parameters": {"workspace_id": workspace_id, "model_name": "bge-large"},
+            "init_parameters": {"workspace_id": workspace_id, "model_name": "bge-large", "embedding_cache": None},
         }
 
     @pytest.mark.unit
@@ -156,3 +157,29 @@ class TestGradientDocumentEmbedder:
         result = embedder.run(documents=[])
 
         assert result["documents"] == []
+
+    @pytest.mark.unit
+    def test_run_with_embedding_cache(self, monkeypatch):
+        monkeypatch.setenv("GRADIENT_ACCESS_TOKEN", access_token)
+        cache = InMemoryEmbeddingCache()
+        embedder = GradientDocumentEmbedder(
+            access_token=access_token, workspace_id=workspace_id, embedding_cache=cache, progress_bar=False
+        )
+        embedder._embedding_model = NonCallableMagicMock()
+        embedder._embedding_model.embed.side_effect = lambda inputs: GenerateEmbeddingSuccess(
+            embeddings=[{"embedding": [float(len(item["input"]))], "index": i} for i, item in enumerate(inputs)]
+        )
+
+        embedder.run(documents=[Document(content="a"), Document(content="bb")])
+        result = embedder.run(documents=[Document(content="bb"), Document(content="ccc")])
+
+        assert [call.kwargs["inputs"] for call in embedder._embedding_model.embed.call_args_list] == [
+            [{"input": "a"}, {"input": "bb"}],
+            [{"input": "ccc"}],
+        ]
+        assert [doc.embedding for doc in result["documents"]] == [[2.0], [3.0]]
+        assert (cache.hits, cache.misses) == (1, 3)
+
+        data = embedder.to_dict()
+        embedder = GradientDocumentEmbedder.from_dict(data)
+        assert isinstance(embedder._embedding_cache, InMemoryEmbeddingCache)
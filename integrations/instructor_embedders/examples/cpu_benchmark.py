@@ -0,0 +1,53 @@
+# Measures how many Documents/s InstructorDocumentEmbedder embeds on this machine, with the default settings and
+# with `max_tokens_per_batch` and `num_processes`. The gain depends on the CPU and on the lengths of the Documents,
+# so run it on the hardware and with Documents like the ones you're going to embed.
+#
+#   python examples/cpu_benchmark.py --documents 2000 --num-processes 4
+import argparse
+import random
+import time
+
+from haystack import Document
+
+from instructor_embedders_haystack import InstructorDocumentEmbedder
+
+
+def make_documents(count: int, seed: int = 42):
+    """
+    Documents of mixed lengths, from a few words to a few hundred, as chunks of real corpora usually are.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    words = ["embedding", "model", "document", "retrieval", "search", "query", "vector", "index", "text", "token"]
+    lengths = [min(int(rng.paretovariate(1.2) * 8), 400) for _ in range(count)]
+    return [Document(content=" ".join(rng.choices(words, k=length))) for length in lengths]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", default="hkunlp/instructor-base")
+    parser.add_argument("--documents", type=int, default=1000)
+    parser.add_argument("--max-tokens-per-batch", type=int, default=8192)
+    parser.add_argument("--num-processes", type=int, default=4)
+    args = parser.parse_args()
+
+    documents = make_documents(args.documents)
+    configurations = {
+        "baseline": {},
+        "max_tokens_per_batch": {"max_tokens_per_batch": args.max_tokens_per_batch},
+        "max_tokens_per_batch + num_processes": {
+            "max_tokens_per_batch": args.max_tokens_per_batch,
+            "num_processes": args.num_processes,
+        },
+    }
+    for name, params in configurations.items():
+        embedder = InstructorDocumentEmbedder(model_name_or_path=args.model, device="cpu", progress_bar=False, **params)
+        embedder.warm_up()
+        # the first run loads the model replicas of the worker processes
+        embedder.run([Document(content=doc.content) for doc in documents[:100]])
+        start = time.perf_counter()
+        embedder.run([Document(content=doc.content) for doc in documents])
+        print(f"{name}: {len(documents) / (time.perf_counter() - start):.1f} Documents/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,45 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
-from typing import ClassVar, Dict, List, Optional, Union
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, ClassVar, Dict, List, Optional, Union
 
+import numpy as np
 from InstructorEmbedding import INSTRUCTOR
+from tqdm import tqdm
+
+# The model replica of a worker process of the pool started by `_InstructorEmbeddingBackend`
+_worker_model: Optional[INSTRUCTOR] = None
+
+
+def _init_worker(
+    model_name_or_path: str, device: Optional[str], use_auth_token: Union[bool, str, None], num_threads: int
+):
+    import torch
+
+    global _worker_model  # noqa: PLW0603
+    # the workers share the cores, instead of each of them using all of them
+    torch.set_num_threads(num_threads)
+    _worker_model = INSTRUCTOR(model_name_or_path=model_name_or_path, device=device, use_auth_token=use_auth_token)
+
+
+def _encode_in_worker(data: List[List[str]], kwargs: Dict[str, Any]):
+    return _worker_model.encode(data, **kwargs)  # type: ignore[union-attr]
+
+
+def _token_lengths_in_worker(data: List[List[str]]) -> List[int]:
+    return _token_lengths(_worker_model, data)  # type: ignore[arg-type]
+
+
+def _token_lengths(model: INSTRUCTOR, data: List[List[str]]) -> List[int]:
+    # INSTRUCTOR embeds the instruction followed by the text, truncated to the maximum sequence length
+    return [
+        min(len(input_ids), model.max_seq_length)
+        for input_ids in model.tokenizer([instruction + text for instruction, text in data])["input_ids"]
+    ]
 
 
 class _InstructorEmbeddingBackendFactory:
@@ -37,8 +73,149 @@ class _InstructorEmbeddingBackend:
     def __init__(
         self, model_name_or_path: str, device: Optional[str] = None, use_auth_token: Union[bool, str, None] = None
     ):
-        self.model = INSTRUCTOR(model_name_or_path=model_name_or_path, device=device, use_auth_token=use_auth_token)
+        self.model_name_or_path = model_name_or_path
+        self.device = device
+        self.use_auth_token = use_auth_token
+        self._model: Optional[INSTRUCTOR] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_size = 0
+
+    @property
+    def model(self) -> INSTRUCTOR:
+        """
+        The model encoding in this process, loaded on first use so that it isn't loaded when a pool encodes.
+        """
+        if self._model is None:
+            self._model = INSTRUCTOR(
+                model_name_or_path=self.model_name_or_path, device=self.device, use_auth_token=self.use_auth_token
+            )
+        return self._model
+
+    def warm_up(self, num_processes: Optional[int] = None):
+        """
+        Load the model, or start the pool of worker processes if `num_processes` is greater than 1.
+        """
+        if num_processes is not None and num_processes > 1:
+            self._start_pool(num_processes)
+        else:
+            _ = self.model
+
+    def embed(
+        self,
+        data: List[List[str]],
+        max_tokens_per_batch: Optional[int] = None,
+        num_processes: Optional[int] = None,
+        dtype: Optional[str] = None,
+        **kwargs,
+    ) -> Union[List[List[float]], np.ndarray]:
+        """
+        Embed `[instruction, text]` pairs.
+
+        :param max_tokens_per_batch: If set, the pairs are sorted by token length and grouped into batches whose
+            padded size, the number of pairs times the length of the longest one, stays within this budget.
+            `batch_size` is then ignored.
+        :param num_processes: If greater than 1, the batches are encoded by a pool of this many processes,
+            each with its own replica of the model.
+        :param dtype: If set, for example to `"float32"` or `"float16"`, the embeddings are returned as the rows
+            of a NumPy matrix of this type instead of lists of Python floats.
+        """
+        if max_tokens_per_batch is None and (num_processes is None or num_processes <= 1):
+            embeddings = self.model.encode(data, **kwargs)
+            return embeddings.astype(dtype, copy=False) if dtype is not None else embeddings.tolist()
+
+        if not data:
+            return np.empty((0, 0), dtype=dtype) if dtype is not None else []
+
+        batch_size = kwargs.pop("batch_size", 32)
+        show_progress_bar = kwargs.pop("show_progress_bar", False)
+
+        if num_processes is not None and num_processes > 1:
+            pool = self._start_pool(num_processes)
+            # the workers tokenize the pairs too, so this process never loads the model
+            chunk_size = -(-len(data) // num_processes)
+            lengths = [
+                length
+                for chunk_lengths in pool.map(
+                    _token_lengths_in_worker, [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+                )
+                for length in chunk_lengths
+            ]
+            batches = self._batches(lengths, batch_size, max_tokens_per_batch)
+            batch_embeddings = pool.map(
+                _encode_in_worker,
+                [[data[i] for i in batch] for batch in batches],
+                [{**kwargs, "batch_size": len(batch), "show_progress_bar": False} for batch in batches],
+            )
+        else:
+            batches = self._batches(_token_lengths(self.model, data), batch_size, max_tokens_per_batch)
+            batch_embeddings = (
+                self.model.encode([data[i] for i in batch], batch_size=len(batch), show_progress_bar=False, **kwargs)
+                for batch in batches
+            )
+
+        # restore the order of the inputs
+        embeddings: Optional[np.ndarray] = None
+        with tqdm(total=len(data), disable=not show_progress_bar, desc="Batches") as progress:
+            for batch, batch_embedding in zip(batches, batch_embeddings):
+                if embeddings is None:
+                    embeddings = np.empty((len(data), batch_embedding.shape[1]), dtype=dtype or batch_embedding.dtype)
+                embeddings[batch] = batch_embedding
+                progress.update(len(batch))
+        return embeddings if dtype is not None else embeddings.tolist()  # type: ignore[union-attr]
+
+    @staticmethod
+    def _batches(lengths: List[int], batch_size: int, max_tokens_per_batch: Optional[int]) -> List[List[int]]:
+        """
+        Group the indices of the pairs, given their token lengths, into batches, from the longest pairs to the
+        shortest, so that the pairs of a batch need little padding.
+        """
+        order = sorted(range(len(lengths)), key=lambda i: -lengths[i])
+
+        if max_tokens_per_batch is None:
+            return [order[i : i + batch_size] for i in range(0, len(order), batch_size)]
+
+        batches: List[List[int]] = []
+        batch: List[int] = []
+        for i in order:
+            # the first pair of a batch is its longest one
+            if batch and (len(batch) + 1) * lengths[batch[0]] > max_tokens_per_batch:
+                batches.append(batch)
+                batch = []
+            batch.append(i)
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _start_pool(self, num_processes: int) -> ProcessPoolExecutor:
+        """
+        Start the pool of worker processes, or restart it if it has a different size.
+        """
+        if self._pool is not None and self._pool_size == num_processes:
+            return self._pool
+        self.stop_pool()
+        # spawned workers don't inherit the state of torch, which is not safe to fork
+        self._pool = ProcessPoolExecutor(
+            max_workers=num_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                self.model_name_or_path,
+                self.device,
+                self.use_auth_token,
+                max(1, (os.cpu_count() or 1) // num_processes),
+            ),
+        )
+        self._pool_size = num_processes
+        # the backends are cached by the factory and outlive the components, so the pool is stopped on exit
+        atexit.register(self.stop_pool)
+        return self._pool
 
-    def embed(self, data: List[List[str]], **kwargs) -> List[List[float]]:
-        embeddings = self.model.encode(data, **kwargs).tolist()
-        return embeddings
+    def stop_pool(self):
+        """
+        Stop the worker processes, if any.
+        """
+        if self._pool is not None:
+            atexit.unregister(self.stop_pool)
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_size = 0
@@ -3,10 +3,17 @@
 # SPDX-License-Identifier: Apache-2.0
 from typing import Any, Dict, List, Optional, Union
 
+import numpy as np
 from haystack import Document, component, default_from_dict, default_to_dict
+from haystack.lazy_imports import LazyImport
 
 from instructor_embedders_haystack.embedding_backend.instructor_backend import _InstructorEmbeddingBackendFactory
 
+with LazyImport(
+    message="Run 'pip install \"instructor-embedders-haystack[embedding-cache]\"'"
+) as embedding_cache_import:
+    from embedding_cache_haystack import EmbeddingCache, deserialize_embedding_cache
+
 
 @component
 class InstructorDocumentEmbedder:
@@ -69,6 +76,10 @@ class InstructorDocumentEmbedder:
         normalize_embeddings: bool = False,
         meta_fields_to_embed: Optional[List[str]] = None,
         embedding_separator: str = "\n",
+        embedding_cache: Optional["EmbeddingCache"] = None,
+        max_tokens_per_batch: Optional[int] = None,
+        num_processes: Optional[int] = None,
+        embedding_dtype: Optional[str] = None,
     ):
         """
         Create an InstructorDocumentEmbedder component.
@@ -93,7 +104,23 @@ class InstructorDocumentEmbedder:
         :param normalize_embeddings: If set to true, returned vectors will have the length of 1.
         :param meta_fields_to_embed: List of meta fields that should be embedded along with the Document content.
         :param embedding_separator: Separator used to concatenate the meta fields to the Document content.
+        :param embedding_cache: Cache of the embeddings, for example an `InMemoryEmbeddingCache` or a
+            `SQLiteEmbeddingCache` from the `embedding_cache_haystack` package.
+            Only the texts whose embedding is not cached for the same model, instruction
+            and normalization are encoded. Defaults to `None`, meaning no cache.
+        :param max_tokens_per_batch: If set, the Documents are sorted by token length and encoded in batches of
+            similar lengths, each holding as many Documents as fit in this many tokens including padding.
+            `batch_size` is then ignored. This avoids padding short Documents to the length of long ones.
+        :param num_processes: If greater than 1, the Documents are encoded by a pool of this many processes,
+            each loading its own copy of the model. Meant to use all the cores of a CPU.
+        :param embedding_dtype: If set to `"float32"` or `"float16"`, the embeddings of the Documents are the rows of
+            a single NumPy matrix of this type, instead of lists of Python floats, which take several times more
+            memory. The Documents should then be written to a Document Store that accepts NumPy arrays.
+            Defaults to `None`, meaning lists.
         """
+        if embedding_dtype not in (None, "float32", "float16"):
+            msg = f"embedding_dtype must be None, 'float32' or 'float16', got '{embedding_dtype}'"
+            raise ValueError(msg)
 
         self.model_name_or_path = model_name_or_path
         # TODO: remove device parameter and use Haystack's device management once migrated
@@ -105,6 +132,10 @@ class InstructorDocumentEmbedder:
         self.normalize_embeddings = normalize_embeddings
         self.meta_fields_to_embed = meta_fields_to_embed or []
         self.embedding_separator = embedding_separator
+        self.embedding_cache = embedding_cache
+        self.max_tokens_per_batch = max_tokens_per_batch
+        self.num_processes = num_processes
+        self.embedding_dtype = embedding_dtype
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -121,6 +152,10 @@ class InstructorDocumentEmbedder:
             normalize_embeddings=self.normalize_embeddings,
             meta_fields_to_embed=self.meta_fields_to_embed,
             embedding_separator=self.embedding_separator,
+            embedding_cache=self.embedding_cache.to_dict() if self.embedding_cache is not None else None,
+            max_tokens_per_batch=self.max_tokens_per_batch,
+            num_processes=self.num_processes,
+            embedding_dtype=self.embedding_dtype,
         )
 
     @classmethod
@@ -128,16 +163,36 @@ class InstructorDocumentEmbedder:
         """
         Deserialize this component from a dictionary.
         """
+        init_params = data.get("init_parameters", {})
+        if init_params.get("embedding_cache") is not None:
+            embedding_cache_import.check()
+            init_params["embedding_cache"] = deserialize_embedding_cache(init_params["embedding_cache"])
         return default_from_dict(cls, data)
 
     def warm_up(self):
         """
-        Load the embedding backend.
+        Load the embedding backend, and its model or, if `num_processes` is greater than 1, its pool of processes.
         """
         if not hasattr(self, "embedding_backend"):
             self.embedding_backend = _InstructorEmbeddingBackendFactory.get_embedding_backend(
                 model_name_or_path=self.model_name_or_path, device=self.device, use_auth_token=self.use_auth_token
             )
+            self.embedding_backend.warm_up(self.num_processes)
+
+    def _embed(self, texts_to_embed: List[List[str]]) -> Union[List[List[float]], np.ndarray]:
+        return self.embedding_backend.embed(
+            texts_to_embed,
+            batch_size=self.batch_size,
+            show_progress_bar=self.progress_bar,
+            normalize_embeddings=self.normalize_embeddings,
+            max_tokens_per_batch=self.max_tokens_per_batch,
+            num_processes=self.num_processes,
+            dtype=self.embedding_dtype,
+        )
+
+    def _embed_rows(self, texts_to_embed: List[List[str]]) -> List[np.ndarray]:
+        # the cache keeps copies of the rows, as views would keep the whole matrix of each batch alive
+        return [row.copy() for row in self._embed(texts_to_embed)]
 
     @component.output_types(documents=List[Document])
     def run(self, documents: List[Document]):
@@ -168,12 +223,21 @@ class InstructorDocumentEmbedder:
             ]
             texts_to_embed.append(text_to_embed)
 
-        embeddings = self.embedding_backend.embed(
-            texts_to_embed,
-            batch_size=self.batch_size,
-            show_progress_bar=self.progress_bar,
-            normalize_embeddings=self.normalize_embeddings,
-        )
+        if self.embedding_cache is None:
+            embeddings = self._embed(texts_to_embed)
+        else:
+            keys = [
+                self.embedding_cache.key(
+                    self.model_name_or_path, instruction, self.normalize_embeddings, self.embedding_dtype, text
+                )
+                for instruction, text in texts_to_embed
+            ]
+            if self.embedding_dtype is None:
+                embeddings = self.embedding_cache.get_or_embed(keys, texts_to_embed, self._embed)
+            else:
+                embeddings = self.embedding_cache.get_or_embed(keys, texts_to_embed, self._embed_rows)
+                # the cached embeddings and the new ones are gathered in a single matrix
+                embeddings = np.asarray(embeddings, dtype=self.embedding_dtype)
 
         for doc, emb in zip(documents, embeddings):
             doc.embedding = emb
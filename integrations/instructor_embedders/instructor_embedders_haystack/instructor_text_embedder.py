@@ -106,6 +106,7 @@ class InstructorTextEmbedder:
             self.embedding_backend = _InstructorEmbeddingBackendFactory.get_embedding_backend(
                 model_name_or_path=self.model_name_or_path, device=self.device, use_auth_token=self.use_auth_token
             )
+            self.embedding_backend.warm_up()
 
     @component.output_types(embedding=List[float])
     def run(self, text: str):
@@ -1,5 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
+import numpy as np
+
 from instructor_embedders_haystack.embedding_backend.instructor_backend import _InstructorEmbeddingBackendFactory
 
 
@@ -22,9 +25,11 @@ def test_factory_behavior(mock_instructor):  # noqa: ARG001
 
 @patch("instructor_embedders_haystack.embedding_backend.instructor_backend.INSTRUCTOR")
 def test_model_initialization(mock_instructor):
-    _InstructorEmbeddingBackendFactory.get_embedding_backend(
+    embedding_backend = _InstructorEmbeddingBackendFactory.get_embedding_backend(
         model_name_or_path="hkunlp/instructor-base", device="cpu", use_auth_token="huggingface_auth_token"
     )
+    mock_instructor.assert_not_called()
+    embedding_backend.warm_up()
     mock_instructor.assert_called_once_with(
         model_name_or_path="hkunlp/instructor-base", device="cpu", use_auth_token="huggingface_auth_token"
     )
@@ -44,3 +49,99 @@ def test_embedding_function_with_kwargs(mock_instructor):  # noqa: ARG001
     embedding_backend.model.encode.assert_called_once_with(data, normalize_embeddings=True)
     # restore the factory state
     _InstructorEmbeddingBackendFactory._instances = {}
+
+
+def _mock_length_model(mock_instructor):
+    """
+    Make the mocked model tokenize each character as a token and embed each pair as the length of its text.
+    """
+    model = mock_instructor.return_value
+    model.max_seq_length = 512
+    model.tokenizer.side_effect = lambda texts: {"input_ids": [list(text) for text in texts]}
+    model.encode.side_effect = lambda data, **kwargs: np.array([[float(len(text))] for _, text in data])  # noqa: ARG005
+    return model
+
+
+@patch("instructor_embedders_haystack.embedding_backend.instructor_backend.INSTRUCTOR")
+def test_embedding_function_with_token_budget(mock_instructor):
+    model = _mock_length_model(mock_instructor)
+    embedding_backend = _InstructorEmbeddingBackendFactory.get_embedding_backend(
+        model_name_or_path="hkunlp/instructor-base"
+    )
+
+    texts = ["a" * 2, "b" * 8, "c" * 3, "d" * 7, "e" * 1]
+    data = [["", text] for text in texts]
+    embeddings = embedding_backend.embed(data=data, max_tokens_per_batch=16, batch_size=32, normalize_embeddings=True)
+
+    # the inputs are restored to their original order
+    assert embeddings == [[float(len(text))] for text in texts]
+    # the batches hold inputs of similar lengths, whose padded size fits in the budget
+    assert [[text for _, text in call.args[0]] for call in model.encode.call_args_list] == [
+        ["b" * 8, "d" * 7],
+        ["c" * 3, "a" * 2, "e" * 1],
+    ]
+    assert model.encode.call_args_list[0].kwargs == {
+        "batch_size": 2,
+        "show_progress_bar": False,
+        "normalize_embeddings": True,
+    }
+    # restore the factory state
+    _InstructorEmbeddingBackendFactory._instances = {}
+
+
+@patch("instructor_embedders_haystack.embedding_backend.instructor_backend.INSTRUCTOR")
+def test_embedding_function_with_process_pool(mock_instructor):
+    _mock_length_model(mock_instructor)
+    embedding_backend = _InstructorEmbeddingBackendFactory.get_embedding_backend(
+        model_name_or_path="hkunlp/instructor-base"
+    )
+
+    texts = [str(i) * (i % 7 + 1) for i in range(20)]
+    # threads stand in for the worker processes, which cannot load a mocked model
+    with patch(
+        "instructor_embedders_haystack.embedding_backend.instructor_backend.ProcessPoolExecutor",
+        side_effect=lambda max_workers, mp_context, initializer, initargs: ThreadPoolExecutor(  # noqa: ARG005
+            max_workers, initializer=initializer, initargs=initargs
+        ),
+    ), patch("torch.set_num_threads"), patch(
+        "instructor_embedders_haystack.embedding_backend.instructor_backend.atexit"
+    ) as mock_atexit:
+        embedding_backend.warm_up(num_processes=2)
+        embeddings = embedding_backend.embed(data=[["", text] for text in texts], num_processes=2, batch_size=4)
+        pool = embedding_backend._pool
+        same_pool_embeddings = embedding_backend.embed(data=[["", "x"]], num_processes=2)
+        # the pool is stopped on exit, as the cached backends outlive the components
+        mock_atexit.register.assert_called_once_with(embedding_backend.stop_pool)
+        embedding_backend.stop_pool()
+        mock_atexit.unregister.assert_called_once_with(embedding_backend.stop_pool)
+
+    assert embeddings == [[float(len(text))] for text in texts]
+    assert same_pool_embeddings == [[1.0]]
+    assert embedding_backend._pool is None
+    assert pool is not None
+    # only the workers load a replica of the model, the backend doesn't load its own
+    assert mock_instructor.call_count == 2
+    # restore the factory state
+    _InstructorEmbeddingBackendFactory._instances = {}
+
+
+@patch("instructor_embedders_haystack.embedding_backend.instructor_backend.INSTRUCTOR")
+def test_embedding_function_with_dtype(mock_instructor):
+    model = _mock_length_model(mock_instructor)
+    embedding_backend = _InstructorEmbeddingBackendFactory.get_embedding_backend(
+        model_name_or_path="hkunlp/instructor-base"
+    )
+    data = [["", "a" * 3], ["", "b" * 5], ["", "c"]]
+
+    embeddings = embedding_backend.embed(data=data, dtype="float16")
+    batched_embeddings = embedding_backend.embed(data=data, max_tokens_per_batch=8, dtype="float32")
+
+    model.encode.assert_any_call(data)
+    assert isinstance(embeddings, np.ndarray)
+    assert embeddings.dtype == np.float16
+    assert embeddings.tolist() == [[3.0], [5.0], [1.0]]
+    assert isinstance(batched_embeddings, np.ndarray)
+    assert batched_embeddings.dtype == np.float32
+    assert batched_embeddings.tolist() == [[3.0], [5.0], [1.0]]
+    # restore the factory state
+    _InstructorEmbeddingBackendFactory._instances = {}
@@ -2,6 +2,7 @@ from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
+from embedding_cache_haystack import InMemoryEmbeddingCache
 from haystack import Document
 
 from instructor_embedders_haystack.instructor_document_embedder import InstructorDocumentEmbedder
@@ -66,6 +67,10 @@ class TestInstructorDocumentEmbedder:
                 "normalize_embeddings": False,
                 "embedding_separator": "\n",
                 "meta_fields_to_embed": [],
+                "embedding_cache": None,
+                "max_tokens_per_batch": None,
+                "num_processes": None,
+                "embedding_dtype": None,
             },
         }
 
@@ -83,6 +88,9 @@ class TestInstructorDocumentEmbedder:
             normalize_embeddings=True,
             meta_fields_to_embed=["test_field"],
             embedding_separator=" | ",
+            max_tokens_per_batch=4096,
+            num_processes=4,
+            embedding_dtype="float16",
         )
         embedder_dict = embedder.to_dict()
         assert embedder_dict == {
@@ -97,6 +105,10 @@ class TestInstructorDocumentEmbedder:
                 "normalize_embeddings": True,
                 "meta_fields_to_embed": ["test_field"],
                 "embedding_separator": " | ",
+                "embedding_cache": None,
+                "max_tokens_per_batch": 4096,
+                "num_processes": 4,
+                "embedding_dtype": "float16",
             },
         }
 
@@ -169,6 +181,7 @@ class TestInstructorDocumentEmbedder:
         mocked_factory.get_embedding_backend.assert_called_once_with(
             model_name_or_path="hkunlp/instructor-base", device="cpu", use_auth_token=None
         )
+        mocked_factory.get_embedding_backend.return_value.warm_up.assert_called_once_with(None)
 
     @patch("instructor_embedders_haystack.instructor_document_embedder._InstructorEmbeddingBackendFactory")
     def test_warmup_does_not_reload(self, mocked_factory):
@@ -200,6 +213,66 @@ class TestInstructorDocumentEmbedder:
             assert isinstance(doc.embedding, list)
             assert isinstance(doc.embedding[0], float)
 
+    def test_run_with_embedding_cache(self):
+        """
+        Test for checking that only the documents whose embedding is not cached are embedded.
+        """
+        cache = InMemoryEmbeddingCache()
+        embedder = InstructorDocumentEmbedder(model_name_or_path="model", embedding_cache=cache)
+        embedder.embedding_backend = MagicMock()
+        embedder.embedding_backend.embed = MagicMock(
+            side_effect=lambda x, **kwargs: [[float(len(text))] * 16 for _, text in x]  # noqa: ARG005
+        )
+
+        embedder.run(documents=[Document(content=f"document {i}") for i in range(3)])
+        documents = [Document(content=f"document {i}") for i in range(5)]
+        result = embedder.run(documents=documents)
+
+        assert embedder.embedding_backend.embed.call_count == 2
+        assert embedder.embedding_backend.embed.call_args.args[0] == [
+            ["Represent the document", "document 3"],
+            ["Represent the document", "document 4"],
+        ]
+        assert all(doc.embedding == [10.0] * 16 for doc in result["documents"])
+        assert (cache.hits, cache.misses) == (3, 5)
+
+    def test_init_with_invalid_embedding_dtype(self):
+        with pytest.raises(ValueError, match="embedding_dtype"):
+            InstructorDocumentEmbedder(model_name_or_path="model", embedding_dtype="int8")
+
+    def test_run_with_embedding_dtype_and_cache(self):
+        """
+        Test for checking that cached and new embeddings are gathered in a matrix of the requested type,
+        while the cache keeps copies of the rows rather than views of the batch matrices.
+        """
+        cache = InMemoryEmbeddingCache()
+        embedder = InstructorDocumentEmbedder(
+            model_name_or_path="model", embedding_dtype="float16", embedding_cache=cache
+        )
+        embedder.embedding_backend = MagicMock()
+        embedder.embedding_backend.embed = lambda x, **kwargs: np.ones((len(x), 16), dtype=kwargs["dtype"])
+
+        embedder.run(documents=[Document(content="document 0")])
+        result = embedder.run(documents=[Document(content=f"document {i}") for i in range(3)])
+
+        embeddings = [doc.embedding for doc in result["documents"]]
+        assert all(isinstance(embedding, np.ndarray) and embedding.dtype == np.float16 for embedding in embeddings)
+        assert embeddings[0].base is embeddings[2].base
+        cached_embeddings = cache.get_many(
+            [
+                cache.key(
+                    embedder.model_name_or_path,
+                    embedder.instruction,
+                    embedder.normalize_embeddings,
+                    embedder.embedding_dtype,
+                    f"document {i}",
+                )
+                for i in range(3)
+            ]
+        )
+        assert all(embedding.base is None for embedding in cached_embeddings)
+        assert not any(np.shares_memory(embedding, embeddings[0]) for embedding in cached_embeddings)
+
     def test_embed_incorrect_input_format(self):
         """
         Test for checking incorrect input format when creating embedding.
@@ -243,6 +316,9 @@ class TestInstructorDocumentEmbedder:
             batch_size=32,
             show_progress_bar=True,
             normalize_embeddings=False,
+            max_tokens_per_batch=None,
+            num_processes=None,
+            dtype=None,
         )
 
     @pytest.mark.integration
@@ -1,15 +1,57 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import math
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
-from haystack import Document, component, default_to_dict
+from haystack import Document, component, default_from_dict, default_to_dict
+from haystack.lazy_imports import LazyImport
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 
+with LazyImport(message="Run 'pip install \"jina-haystack[embedding-cache]\"'") as embedding_cache_import:
+    from embedding_cache_haystack import EmbeddingCache, deserialize_embedding_cache
+
 JINA_API_URL: str = "https://api.jina.ai/v1/embeddings"
 
+# Status codes of the responses to a batch that is sent again, if retries are left
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Retries of a batch whose response has no Retry-After header wait RETRY_BACKOFF_FACTOR * 2 ** retry seconds
+RETRY_BACKOFF_FACTOR = 1.0
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    Approximates the number of tokens of a text as one token every 4 characters.
+    """
+    return max(1, math.ceil(len(text) / 4))
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """
+    Returns the seconds to wait according to the Retry-After header of a response, if it has a valid one.
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
 
 @component
 class JinaDocumentEmbedder:
@@ -43,6 +85,10 @@ class JinaDocumentEmbedder:
         progress_bar: bool = True,
         meta_fields_to_embed: Optional[List[str]] = None,
         embedding_separator: str = "\n",
+        embedding_cache: Optional["EmbeddingCache"] = None,
+        max_concurrency: int = 1,
+        max_retries: int = 0,
+        max_tokens_per_batch: Optional[int] = None,
     ):
         """
         Create a JinaDocumentEmbedder component.
@@ -56,6 +102,17 @@ class JinaDocumentEmbedder:
                              to keep the logs clean.
         :param meta_fields_to_embed: List of meta fields that should be embedded along with the Document text.
         :param embedding_separator: Separator used to concatenate the meta fields to the Document text.
+        :param embedding_cache: Cache of the embeddings, for example an `InMemoryEmbeddingCache` or a
+            `SQLiteEmbeddingCache` from the `embedding_cache_haystack` package.
+            Only the texts whose embedding is not cached for the same model are sent to Jina.
+            Defaults to `None`, meaning no cache.
+        :param max_concurrency: Maximum number of batches sent to Jina at the same time. The connection pool of the
+            session keeps this many connections open, so that they are reused across batches.
+        :param max_retries: Number of times a batch is sent again after a connection error or a response with status
+            429, 500, 502, 503 or 504. The retry waits as long as the Retry-After header of the response asks for,
+            or `1, 2, 4, ...` seconds if there is none.
+        :param max_tokens_per_batch: If set, batches are also closed before their texts exceed this number of tokens,
+            estimated as one token every 4 characters. A text longer than the budget is sent in a batch on its own.
         """
 
         api_key = api_key or os.environ.get("JINA_API_KEY")
@@ -74,7 +131,14 @@ class JinaDocumentEmbedder:
         self.progress_bar = progress_bar
         self.meta_fields_to_embed = meta_fields_to_embed or []
         self.embedding_separator = embedding_separator
+        self.embedding_cache = embedding_cache
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.max_tokens_per_batch = max_tokens_per_batch
         self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._session.headers.update(
             {
                 "Authorization": f"Bearer {api_key}",
@@ -103,8 +167,23 @@ class JinaDocumentEmbedder:
             progress_bar=self.progress_bar,
             meta_fields_to_embed=self.meta_fields_to_embed,
             embedding_separator=self.embedding_separator,
+            embedding_cache=self.embedding_cache.to_dict() if self.embedding_cache is not None else None,
+            max_concurrency=self.max_concurrency,
+            max_retries=self.max_retries,
+            max_tokens_per_batch=self.max_tokens_per_batch,
         )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JinaDocumentEmbedder":
+        """
+        Deserialize this component from a dictionary.
+        """
+        init_params = data.get("init_parameters", {})
+        if init_params.get("embedding_cache") is not None:
+            embedding_cache_import.check()
+            init_params["embedding_cache"] = deserialize_embedding_cache(init_params["embedding_cache"])
+        return default_from_dict(cls, data)
+
     def _prepare_texts_to_embed(self, documents: List[Document]) -> List[str]:
         """
         Prepare the texts to embed by concatenating the Document text with the metadata fields to embed.
@@ -121,32 +200,76 @@ class JinaDocumentEmbedder:
             texts_to_embed.append(text_to_embed)
         return texts_to_embed
 
+    def _batches(self, texts_to_embed: List[str], batch_size: int) -> List[List[str]]:
+        """
+        Split the texts into batches of at most `batch_size` texts and, if set, `max_tokens_per_batch` tokens.
+        """
+        if self.max_tokens_per_batch is None:
+            return [texts_to_embed[i : i + batch_size] for i in range(0, len(texts_to_embed), batch_size)]
+
+        batches: List[List[str]] = []
+        batch: List[str] = []
+        batch_tokens = 0
+        for text in texts_to_embed:
+            tokens = _estimate_tokens(text)
+            if batch and (len(batch) == batch_size or batch_tokens + tokens > self.max_tokens_per_batch):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _post_batch(self, batch: List[str]) -> Dict[str, Any]:
+        """
+        Send a batch to Jina, retrying it `max_retries` times on connection errors and retryable responses.
+        """
+        for retry in range(self.max_retries + 1):
+            delay = RETRY_BACKOFF_FACTOR * 2**retry
+            try:
+                response = self._session.post(JINA_API_URL, json={"input": batch, "model": self.model_name})
+            except requests.ConnectionError:
+                if retry == self.max_retries:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or retry == self.max_retries:
+                    break
+                retry_after = _retry_after(response)
+                if retry_after is not None:
+                    delay = retry_after
+            time.sleep(delay)
+
+        result = response.json()
+        if "data" not in result:
+            raise RuntimeError(result["detail"])
+        return result
+
     def _embed_batch(self, texts_to_embed: List[str], batch_size: int) -> Tuple[List[List[float]], Dict[str, Any]]:
         """
-        Embed a list of texts in batches.
+        Embed a list of texts in batches, sending up to `max_concurrency` batches at the same time.
         """
+        batches = self._batches(texts_to_embed, batch_size)
 
         all_embeddings = []
-        metadata = {}
-        for i in tqdm(
-            range(0, len(texts_to_embed), batch_size), disable=not self.progress_bar, desc="Calculating embeddings"
-        ):
-            batch = texts_to_embed[i : i + batch_size]
-            response = self._session.post(JINA_API_URL, json={"input": batch, "model": self.model_name}).json()
-            if "data" not in response:
-                raise RuntimeError(response["detail"])
-
-            # Sort resulting embeddings by index
-            sorted_embeddings = sorted(response["data"], key=lambda e: e["index"])
-            embeddings = [result["embedding"] for result in sorted_embeddings]
-            all_embeddings.extend(embeddings)
-            if "model" not in metadata:
-                metadata["model"] = response["model"]
-            if "usage" not in metadata:
-                metadata["usage"] = dict(response["usage"].items())
-            else:
-                metadata["usage"]["prompt_tokens"] += response["usage"]["prompt_tokens"]
-                metadata["usage"]["total_tokens"] += response["usage"]["total_tokens"]
+        metadata: Dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            # map yields the responses in the order of the batches
+            responses = executor.map(self._post_batch, batches)
+            for response in tqdm(
+                responses, total=len(batches), disable=not self.progress_bar, desc="Calculating embeddings"
+            ):
+                # Sort resulting embeddings by index
+                sorted_embeddings = sorted(response["data"], key=lambda e: e["index"])
+                embeddings = [result["embedding"] for result in sorted_embeddings]
+                all_embeddings.extend(embeddings)
+                if "model" not in metadata:
+                    metadata["model"] = response["model"]
+                if "usage" not in metadata:
+                    metadata["usage"] = dict(response["usage"].items())
+                else:
+                    metadata["usage"]["prompt_tokens"] += response["usage"]["prompt_tokens"]
+                    metadata["usage"]["total_tokens"] += response["usage"]["total_tokens"]
 
         return all_embeddings, metadata
 
@@ -167,7 +290,18 @@ class JinaDocumentEmbedder:
 
         texts_to_embed = self._prepare_texts_to_embed(documents=documents)
 
-        embeddings, metadata = self._embed_batch(texts_to_embed=texts_to_embed, batch_size=self.batch_size)
+        if self.embedding_cache is None:
+            embeddings, metadata = self._embed_batch(texts_to_embed=texts_to_embed, batch_size=self.batch_size)
+        else:
+            metadata = {}
+
+            def embed(texts: List[str]) -> List[List[float]]:
+                nonlocal metadata
+                new_embeddings, metadata = self._embed_batch(texts_to_embed=texts, batch_size=self.batch_size)
+                return new_embeddings
+
+            keys = [self.embedding_cache.key(self.model_name, text) for text in texts_to_embed]
+            embeddings = self.embedding_cache.get_or_embed(keys, texts_to_embed, embed)
 
         for doc, emb in zip(documents, embeddings):
             doc.embedding = emb
@@ -2,13 +2,17 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import json
+import threading
+import time
 from unittest.mock import patch
 
 import pytest
 import requests
+from embedding_cache_haystack import SQLiteEmbeddingCache
 from haystack import Document
 
 from jina_haystack import JinaDocumentEmbedder
+from jina_haystack.document_embedder import JINA_API_URL
 
 
 def mock_session_post_response(*args, **kwargs):  # noqa: ARG001
@@ -24,6 +28,35 @@ def mock_session_post_response(*args, **kwargs):  # noqa: ARG001
     return mock_response
 
 
+def mock_session_post_length_response(*args, **kwargs):  # noqa: ARG001
+    """
+    Embeds each text as its length, returning the results in reverse order like the API may do.
+    """
+    inputs = kwargs["json"]["input"]
+    mock_response = requests.Response()
+    mock_response.status_code = 200
+    data = [{"object": "embedding", "index": i, "embedding": [float(len(text))]} for i, text in enumerate(inputs)]
+    mock_response._content = json.dumps(
+        {
+            "model": kwargs["json"]["model"],
+            "object": "list",
+            "usage": {"total_tokens": 4, "prompt_tokens": 4},
+            "data": data[::-1],
+        }
+    ).encode()
+
+    return mock_response
+
+
+def mock_rate_limited_response():
+    mock_response = requests.Response()
+    mock_response.status_code = 429
+    mock_response.headers["Retry-After"] = "0"
+    mock_response._content = json.dumps({"detail": "Rate limit exceeded"}).encode()
+
+    return mock_response
+
+
 class TestJinaDocumentEmbedder:
     def test_init_default(self, monkeypatch):
         monkeypatch.setenv("JINA_API_KEY", "fake-api-key")
@@ -74,6 +107,10 @@ class TestJinaDocumentEmbedder:
                 "progress_bar": True,
                 "meta_fields_to_embed": [],
                 "embedding_separator": "\n",
+                "embedding_cache": None,
+                "max_concurrency": 1,
+                "max_retries": 0,
+                "max_tokens_per_batch": None,
             },
         }
 
@@ -87,6 +124,9 @@ class TestJinaDocumentEmbedder:
             progress_bar=False,
             meta_fields_to_embed=["test_field"],
             embedding_separator=" | ",
+            max_concurrency=4,
+            max_retries=3,
+            max_tokens_per_batch=8192,
         )
         data = component.to_dict()
         assert data == {
@@ -99,6 +139,10 @@ class TestJinaDocumentEmbedder:
                 "progress_bar": False,
                 "meta_fields_to_embed": ["test_field"],
                 "embedding_separator": " | ",
+                "embedding_cache": None,
+                "max_concurrency": 4,
+                "max_retries": 3,
+                "max_tokens_per_batch": 8192,
             },
         }
 
@@ -237,3 +281,88 @@ class TestJinaDocumentEmbedder:
 
         assert result["documents"] is not None
         assert not result["documents"]  # empty list
+
+    def test_run_with_embedding_cache(self, tmp_path):
+        cache = SQLiteEmbeddingCache(str(tmp_path / "embeddings.db"))
+        embedder = JinaDocumentEmbedder(api_key="fake-api-key", embedding_cache=cache, progress_bar=False)
+
+        with patch("requests.sessions.Session.post", side_effect=mock_session_post_response) as mock_post:
+            embedder.run([Document(content="a"), Document(content="b")])
+            result = embedder.run([Document(content="b"), Document(content="c")])
+
+        assert [call.kwargs["json"]["input"] for call in mock_post.call_args_list] == [["a", "b"], ["c"]]
+        assert [doc.embedding for doc in result["documents"]] == [[0.1, 0.2, 0.3]] * 2
+        assert result["meta"]["usage"] == {"prompt_tokens": 4, "total_tokens": 4}
+        assert (cache.hits, cache.misses) == (1, 3)
+
+        data = embedder.to_dict()
+        assert data["init_parameters"]["embedding_cache"] == {
+            "type": "embedding_cache_haystack.embedding_cache.SQLiteEmbeddingCache",
+            "init_parameters": {"path": str(tmp_path / "embeddings.db"), "max_entries": 1_000_000},
+        }
+
+    def test_run_concurrent_batches(self):
+        threads = set()
+
+        def post(*args, **kwargs):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.02)
+            return mock_session_post_length_response(*args, **kwargs)
+
+        embedder = JinaDocumentEmbedder(api_key="fake-api-key", batch_size=2, max_concurrency=4, progress_bar=False)
+        docs = [Document(content="x" * i) for i in range(1, 17)]
+
+        with patch("requests.sessions.Session.post", side_effect=post) as mock_post:
+            result = embedder.run(docs)
+
+        assert [doc.embedding for doc in result["documents"]] == [[float(i)] for i in range(1, 17)]
+        assert result["meta"]["usage"] == {"prompt_tokens": 32, "total_tokens": 32}
+        assert mock_post.call_count == 8
+        assert len(threads) > 1
+        # the session keeps a connection open for each batch in flight
+        assert embedder._session.get_adapter(JINA_API_URL)._pool_maxsize == 4
+
+    def test_run_retries_rate_limited_batches(self):
+        responses = [mock_rate_limited_response(), mock_rate_limited_response()]
+
+        def post(*args, **kwargs):
+            return responses.pop(0) if responses else mock_session_post_length_response(*args, **kwargs)
+
+        embedder = JinaDocumentEmbedder(api_key="fake-api-key", max_retries=2, progress_bar=False)
+        with patch("requests.sessions.Session.post", side_effect=post) as mock_post, patch(
+            "jina_haystack.document_embedder.time.sleep"
+        ) as mock_sleep:
+            result = embedder.run([Document(content="a"), Document(content="bb")])
+
+        assert [doc.embedding for doc in result["documents"]] == [[1.0], [2.0]]
+        assert mock_post.call_count == 3
+        # the Retry-After header of the responses takes precedence over the exponential backoff
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.0, 0.0]
+
+    def test_run_fails_when_retries_are_exhausted(self):
+        embedder = JinaDocumentEmbedder(api_key="fake-api-key", max_retries=1, progress_bar=False)
+
+        with patch(
+            "requests.sessions.Session.post", side_effect=lambda *_args, **_kwargs: mock_rate_limited_response()
+        ) as mock_post, pytest.raises(RuntimeError, match="Rate limit exceeded"):
+            embedder.run([Document(content="a")])
+
+        assert mock_post.call_count == 2
+
+    def test_run_token_aware_batches(self):
+        embedder = JinaDocumentEmbedder(
+            api_key="fake-api-key", batch_size=3, max_tokens_per_batch=3, progress_bar=False
+        )
+        texts = ["a" * 4, "b" * 4, "c" * 8, "d" * 20, "e", "f", "g", "h"]
+
+        with patch("requests.sessions.Session.post", side_effect=mock_session_post_length_response) as mock_post:
+            result = embedder.run([Document(content=text) for text in texts])
+
+        assert [call.kwargs["json"]["input"] for call in mock_post.call_args_list] == [
+            ["a" * 4, "b" * 4],
+            ["c" * 8],
+            ["d" * 20],
+            ["e", "f", "g"],
+            ["h"],
+        ]
+        assert [doc.embedding for doc in result["documents"]] == [[float(len(text))] for text in texts]
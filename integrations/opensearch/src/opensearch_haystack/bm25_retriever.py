@@ -105,3 +105,93 @@ class OpenSearchBM25Retriever:
             all_terms_must_match=all_terms_must_match,
         )
         return {"documents": docs}
+
+    async def run_async(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        all_terms_must_match: Optional[bool] = None,
+        top_k: Optional[int] = None,
+        fuzziness: Optional[str] = None,
+        scale_score: Optional[bool] = None,
+    ):
+        """
+        Asynchronously retrieve documents using BM25 retrieval.
+
+        :param query: The query string
+        :param filters: Optional filters to narrow down the search space.
+        :param all_terms_must_match: If True, all terms in the query string must be present in the retrieved documents.
+        :param top_k: Maximum number of Documents to return.
+        :param fuzziness: Fuzziness parameter for full-text queries.
+        :param scale_score: Whether to scale the score of retrieved documents between 0 and 1.
+        :return: A dictionary containing the retrieved documents.
+        """
+        if filters is None:
+            filters = self._filters
+        if all_terms_must_match is None:
+            all_terms_must_match = self._all_terms_must_match
+        if top_k is None:
+            top_k = self._top_k
+        if fuzziness is None:
+            fuzziness = self._fuzziness
+        if scale_score is None:
+            scale_score = self._scale_score
+
+        docs = await self._document_store._bm25_retrieval_async(
+            query=query,
+            filters=filters,
+            fuzziness=fuzziness,
+            top_k=top_k,
+            scale_score=scale_score,
+            all_terms_must_match=all_terms_must_match,
+        )
+        return {"documents": docs}
+
+    def run_batch(
+        self,
+        queries: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        all_terms_must_match: Optional[bool] = None,
+        top_k: Optional[int] = None,
+        fuzziness: Optional[str] = None,
+        scale_score: Optional[bool] = None,
+        batch_size: int = 100,
+        max_concurrency: int = 1,
+    ) -> Dict[str, List[List[Document]]]:
+        """
+        Retrieve documents for many queries at once using BM25 retrieval.
+
+        The searches are packed into `_msearch` requests, saving one round trip per query.
+
+        :param queries: The query strings
+        :param filters: Optional filters applied to the retrieved Documents of every query.
+        :param all_terms_must_match: If True, all terms in a query string must be present in the retrieved documents.
+        :param top_k: Maximum number of Documents to return for each query.
+        :param fuzziness: Fuzziness parameter for full-text queries.
+        :param scale_score: Whether to scale the score of retrieved documents between 0 and 1.
+        :param batch_size: Maximum number of queries sent in a single request, defaults to 100.
+        :param max_concurrency: Maximum number of requests in flight, defaults to 1.
+        :return: A dictionary containing one list of retrieved documents for each query, in the same order as `queries`.
+        """
+        if filters is None:
+            filters = self._filters
+        if all_terms_must_match is None:
+            all_terms_must_match = self._all_terms_must_match
+        if top_k is None:
+            top_k = self._top_k
+        if fuzziness is None:
+            fuzziness = self._fuzziness
+        if scale_score is None:
+            scale_score = self._scale_score
+
+        docs = self._document_store._bm25_retrieval_batch(
+            queries=queries,
+            filters=filters,
+            fuzziness=fuzziness,
+            top_k=top_k,
+            scale_score=scale_score,
+            all_terms_must_match=all_terms_must_match,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+        )
+        return {"documents": docs}
@@ -2,14 +2,17 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import logging
-from typing import Any, Dict, List, Mapping, Optional, Union
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Generator, List, Mapping, Optional, Union
 
 import numpy as np
 from haystack import default_from_dict, default_to_dict
 from haystack.dataclasses import Document
 from haystack.document_stores import DocumentStoreError, DuplicateDocumentError, DuplicatePolicy
 from haystack.utils.filters import convert
-from opensearchpy import OpenSearch
+from opensearchpy import AsyncOpenSearch, OpenSearch
 from opensearchpy.helpers import bulk
 
 from opensearch_haystack.filters import _normalize_filters
@@ -53,6 +56,8 @@ class OpenSearchDocumentStore:
         self._client = OpenSearch(hosts, **kwargs)
         self._index = index
         self._kwargs = kwargs
+        # The async client is created on first use, so that it's bound to the running event loop
+        self._async_client: Optional[AsyncOpenSearch] = None
 
         # Check client connection, this will raise if not connected
         self._client.info()
@@ -111,6 +116,28 @@ class OpenSearchDocumentStore:
         """
         return self._client.count(index=self._index)["count"]
 
+    async def count_documents_async(self) -> int:
+        """
+        Asynchronously returns how many documents are present in the document store.
+        """
+        return (await self._get_async_client().count(index=self._index))["count"]
+
+    def _get_async_client(self) -> AsyncOpenSearch:
+        """
+        Returns the `AsyncOpenSearch` client shared by all the async methods, creating it on first use.
+        """
+        if self._async_client is None:
+            self._async_client = AsyncOpenSearch(self._hosts, **self._kwargs)
+        return self._async_client
+
+    async def close_async(self) -> None:
+        """
+        Closes the connections of the async client, if it has been created.
+        """
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
     def _search_documents(self, **kwargs) -> List[Document]:
         """
         Calls the OpenSearch client's search method and handles pagination.
@@ -119,20 +146,155 @@ class OpenSearchDocumentStore:
             index=self._index,
             body=kwargs,
         )
-        documents: List[Document] = [self._deserialize_document(hit) for hit in res["hits"]["hits"]]
+        return self._deserialize_search_response(res)
+
+    async def _search_documents_async(self, **kwargs) -> List[Document]:
+        """
+        Calls the async OpenSearch client's search method.
+        """
+        res = await self._get_async_client().search(
+            index=self._index,
+            body=kwargs,
+        )
+        return self._deserialize_search_response(res)
+
+    def _deserialize_search_response(self, res: Dict[str, Any]) -> List[Document]:
+        """
+        Creates the Documents of the hits of a search response.
+        """
+        return [self._deserialize_document(hit) for hit in res["hits"]["hits"]]
+
+    def filter_documents(
+        self, filters: Optional[Dict[str, Any]] = None, max_documents: Optional[int] = None
+    ) -> List[Document]:
+        """
+        Returns all the Documents matching `filters`.
+
+        :param filters: Filters applied to the Documents. Defaults to None.
+        :param max_documents: Maximum number of Documents this call is allowed to load in memory.
+            Defaults to None, meaning no limit. Use `iter_documents` to go through larger results.
+        :raises DocumentStoreError: If more than `max_documents` Documents match `filters`.
+        :return: List of Documents matching `filters`.
+        """
+        documents: List[Document] = []
+        for document in self.iter_documents(filters):
+            if max_documents is not None and len(documents) >= max_documents:
+                msg = (
+                    f"More than {max_documents} documents match the filters. "
+                    "Use OpenSearchDocumentStore.iter_documents() to go through all of them."
+                )
+                raise DocumentStoreError(msg)
+            documents.append(document)
         return documents
 
-    def filter_documents(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def iter_documents(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        *,
+        batch_size: int = 1000,
+        slices: int = 1,
+        scroll: str = "1m",
+    ) -> Generator[Document, None, None]:
+        """
+        Iterates over all the Documents matching `filters` without loading them all in memory.
+
+        Pages are fetched with the scroll API, so there is no limit on the number of Documents returned.
+        Scroll contexts are cleared once the generator is exhausted or closed.
+
+        :param filters: Filters applied to the Documents, see `filter_documents`. Defaults to None.
+        :param batch_size: Number of Documents fetched with each request. Defaults to 1000.
+        :param slices: Number of slices of the scroll fetched in parallel, each one in its own thread.
+            Documents are not returned in a deterministic order when this is greater than 1. Defaults to 1.
+        :param scroll: How long OpenSearch keeps the scroll context alive between two requests. Defaults to "1m".
+        :raises ValueError: If `batch_size` or `slices` is not a positive integer.
+        :return: A generator of Documents.
+        """
+        if batch_size < 1 or slices < 1:
+            msg = "batch_size and slices must be positive integers"
+            raise ValueError(msg)
+
         if filters and "operator" not in filters and "conditions" not in filters:
             filters = convert(filters)
 
+        body: Dict[str, Any] = {"size": batch_size, "sort": ["_doc"]}
         if filters:
-            query = {"bool": {"filter": _normalize_filters(filters)}}
-            documents = self._search_documents(query=query, size=10_000)
+            body["query"] = {"bool": {"filter": _normalize_filters(filters)}}
+
+        if slices == 1:
+            pages = self._iter_scroll_pages(body, scroll=scroll)
         else:
-            documents = self._search_documents(size=10_000)
+            pages = self._iter_sliced_scroll_pages(body, scroll=scroll, slices=slices)
+        for hits in pages:
+            yield from (self._deserialize_document(hit) for hit in hits)
 
-        return documents
+    def _iter_scroll_pages(
+        self, body: Dict[str, Any], *, scroll: str, slice_: Optional[Dict[str, int]] = None
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Yields the hits of a scroll search one page at a time.
+        """
+        if slice_ is not None:
+            body = {**body, "slice": slice_}
+        res = self._client.search(index=self._index, body=body, scroll=scroll)
+        scroll_id = res.get("_scroll_id")
+        try:
+            while res["hits"]["hits"]:
+                yield res["hits"]["hits"]
+                res = self._client.scroll(scroll_id=scroll_id, scroll=scroll)
+                scroll_id = res.get("_scroll_id", scroll_id)
+        finally:
+            if scroll_id:
+                self._client.clear_scroll(scroll_id=scroll_id, params={"ignore": [404]})
+
+    def _iter_sliced_scroll_pages(
+        self, body: Dict[str, Any], *, scroll: str, slices: int
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Fetches each slice of a scroll search in its own thread and yields the pages as they arrive.
+
+        At most `slices` pages wait to be consumed at any time, the threads block until the caller catches up.
+        """
+        pages: "queue.Queue[Any]" = queue.Queue(maxsize=slices)  # noqa: UP037
+        stop = threading.Event()
+        slice_done = object()
+
+        def put(item: Any):
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def fetch_slice(slice_id: int):
+            try:
+                slice_pages = self._iter_scroll_pages(body, scroll=scroll, slice_={"id": slice_id, "max": slices})
+                try:
+                    for hits in slice_pages:
+                        if stop.is_set():
+                            return
+                        put(hits)
+                finally:
+                    slice_pages.close()
+                put(slice_done)
+            except Exception as e:
+                put(e)
+
+        with ThreadPoolExecutor(max_workers=slices) as executor:
+            for slice_id in range(slices):
+                executor.submit(fetch_slice, slice_id)
+            try:
+                finished = 0
+                while finished < slices:
+                    item = pages.get()
+                    if item is slice_done:
+                        finished += 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                stop.set()
 
     def write_documents(self, documents: List[Document], policy: DuplicatePolicy = DuplicatePolicy.NONE) -> int:
         """
@@ -248,6 +410,92 @@ class OpenSearchDocumentStore:
         :return: List of Document that match `query`
         """
 
+        body = self._bm25_query_body(
+            query, filters=filters, fuzziness=fuzziness, top_k=top_k, all_terms_must_match=all_terms_must_match
+        )
+        documents = self._search_documents(**body)
+
+        if scale_score:
+            self._scale_bm25_scores(documents)
+
+        return documents
+
+    async def _bm25_retrieval_async(
+        self,
+        query: str,
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        fuzziness: str = "AUTO",
+        top_k: int = 10,
+        scale_score: bool = False,
+        all_terms_must_match: bool = False,
+    ) -> List[Document]:
+        """
+        Async version of `_bm25_retrieval`, used by `OpenSearchBM25Retriever.run_async`.
+        """
+        body = self._bm25_query_body(
+            query, filters=filters, fuzziness=fuzziness, top_k=top_k, all_terms_must_match=all_terms_must_match
+        )
+        documents = await self._search_documents_async(**body)
+
+        if scale_score:
+            self._scale_bm25_scores(documents)
+
+        return documents
+
+    def _bm25_retrieval_batch(
+        self,
+        queries: List[str],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        fuzziness: str = "AUTO",
+        top_k: int = 10,
+        scale_score: bool = False,
+        all_terms_must_match: bool = False,
+        batch_size: int = 100,
+        max_concurrency: int = 1,
+    ) -> List[List[Document]]:
+        """
+        Runs `_bm25_retrieval` for many queries, packing them into `_msearch` requests.
+
+        This method is not mean to be part of the public interface of
+        `OpenSearchDocumentStore` nor called directly.
+        `OpenSearchBM25Retriever.run_batch` uses this method directly and is the public interface for it.
+
+        :param queries: Strings to search in saved Documents' text.
+        :param filters: Optional filters applied to the retrieved Documents of every query.
+        :param fuzziness: Fuzziness parameter passed to OpenSearch, defaults to "AUTO".
+        :param top_k: Maximum number of Documents to return for each query, defaults to 10
+        :param scale_score: If `True` scales the Document`s scores between 0 and 1, defaults to False
+        :param all_terms_must_match: If `True` all terms in a query must be present in the Document, defaults to False
+        :param batch_size: Maximum number of queries sent in a single `_msearch` request, defaults to 100
+        :param max_concurrency: Maximum number of `_msearch` requests in flight, defaults to 1
+        :raises ValueError: If any of `queries` is an empty string
+        :return: One list of Documents for each query, in the same order as `queries`
+        """
+        bodies = [
+            self._bm25_query_body(
+                query, filters=filters, fuzziness=fuzziness, top_k=top_k, all_terms_must_match=all_terms_must_match
+            )
+            for query in queries
+        ]
+        results = self._msearch_documents(bodies, batch_size=batch_size, max_concurrency=max_concurrency)
+
+        if scale_score:
+            for documents in results:
+                self._scale_bm25_scores(documents)
+
+        return results
+
+    def _bm25_query_body(
+        self,
+        query: str,
+        *,
+        filters: Optional[Dict[str, Any]],
+        fuzziness: str,
+        top_k: int,
+        all_terms_must_match: bool,
+    ) -> Dict[str, Any]:
         if not query:
             msg = "query must be a non empty string"
             raise ValueError(msg)
@@ -274,13 +522,11 @@ class OpenSearchDocumentStore:
         if filters:
             body["query"]["bool"]["filter"] = _normalize_filters(filters)
 
-        documents = self._search_documents(**body)
+        return body
 
-        if scale_score:
-            for doc in documents:
-                doc.score = float(1 / (1 + np.exp(-np.asarray(doc.score / BM25_SCALING_FACTOR))))
-
-        return documents
+    def _scale_bm25_scores(self, documents: List[Document]):
+        for doc in documents:
+            doc.score = float(1 / (1 + np.exp(-np.asarray(doc.score / BM25_SCALING_FACTOR))))
 
     def _embedding_retrieval(
         self,
@@ -309,6 +555,56 @@ class OpenSearchDocumentStore:
         :return: List of Document that are most similar to `query_embedding`
         """
 
+        body = self._embedding_query_body(query_embedding, filters=filters, top_k=top_k)
+        docs = self._search_documents(**body)
+        return docs
+
+    async def _embedding_retrieval_async(
+        self,
+        query_embedding: List[float],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+    ) -> List[Document]:
+        """
+        Async version of `_embedding_retrieval`, used by `OpenSearchEmbeddingRetriever.run_async`.
+        """
+        body = self._embedding_query_body(query_embedding, filters=filters, top_k=top_k)
+        return await self._search_documents_async(**body)
+
+    def _embedding_retrieval_batch(
+        self,
+        query_embeddings: List[List[float]],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        batch_size: int = 100,
+        max_concurrency: int = 1,
+    ) -> List[List[Document]]:
+        """
+        Runs `_embedding_retrieval` for many query embeddings, packing them into `_msearch` requests.
+
+        This method is not mean to be part of the public interface of
+        `OpenSearchDocumentStore` nor called directly.
+        `OpenSearchEmbeddingRetriever.run_batch` uses this method directly and is the public interface for it.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param filters: Filters applied to the retrieved Documents of every query. Defaults to None.
+        :param top_k: Maximum number of Documents to return for each query, defaults to 10
+        :param batch_size: Maximum number of queries sent in a single `_msearch` request, defaults to 100
+        :param max_concurrency: Maximum number of `_msearch` requests in flight, defaults to 1
+        :raises ValueError: If any of `query_embeddings` is an empty list
+        :return: One list of Documents for each query embedding, in the same order as `query_embeddings`
+        """
+        bodies = [
+            self._embedding_query_body(query_embedding, filters=filters, top_k=top_k)
+            for query_embedding in query_embeddings
+        ]
+        return self._msearch_documents(bodies, batch_size=batch_size, max_concurrency=max_concurrency)
+
+    def _embedding_query_body(
+        self, query_embedding: List[float], *, filters: Optional[Dict[str, Any]], top_k: int
+    ) -> Dict[str, Any]:
         if not query_embedding:
             msg = "query_embedding must be a non-empty list of floats"
             raise ValueError(msg)
@@ -334,5 +630,41 @@ class OpenSearchDocumentStore:
         if filters:
             body["query"]["bool"]["filter"] = _normalize_filters(filters)
 
-        docs = self._search_documents(**body)
-        return docs
+        return body
+
+    def _msearch_documents(
+        self, bodies: List[Dict[str, Any]], *, batch_size: int, max_concurrency: int
+    ) -> List[List[Document]]:
+        """
+        Sends the search `bodies` through `_msearch`, `batch_size` of them per request
+        and with up to `max_concurrency` requests in flight.
+
+        :raises DocumentStoreError: If any of the searches failed.
+        :return: The Documents found by each search, in the same order as `bodies`.
+        """
+        if batch_size < 1 or max_concurrency < 1:
+            msg = "batch_size and max_concurrency must be positive integers"
+            raise ValueError(msg)
+
+        def msearch(chunk: List[Dict[str, Any]]) -> List[List[Document]]:
+            searches: List[Dict[str, Any]] = []
+            for body in chunk:
+                searches.extend(({}, body))
+            res = self._client.msearch(index=self._index, body=searches)
+
+            results = []
+            for response in res["responses"]:
+                if "error" in response:
+                    msg = f"Failed to search documents in OpenSearch. Error:\n{response['error']}"
+                    raise DocumentStoreError(msg)
+                results.append(self._deserialize_search_response(response))
+            return results
+
+        chunks = [bodies[i : i + batch_size] for i in range(0, len(bodies), batch_size)]
+        if max_concurrency == 1 or len(chunks) <= 1:
+            chunk_results = [msearch(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                chunk_results = list(executor.map(msearch, chunks))
+
+        return [documents for chunk_result in chunk_results for documents in chunk_result]
@@ -5,6 +5,7 @@ import random
 from typing import List
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 from haystack.dataclasses.document import Document
 from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumentError
@@ -113,6 +114,47 @@ class TestDocumentStore(DocumentStoreBaseTests):
         assert document_store._hosts == "some hosts"
         assert document_store._index == "default"
 
+    @patch("opensearch_haystack.document_store.OpenSearch")
+    def test_iter_documents_scrolls_through_all_pages(self, mock_opensearch_client):
+        client = mock_opensearch_client.return_value
+        hits = [{"_source": {"id": str(i), "content": f"doc {i}"}, "_score": None} for i in range(5)]
+        client.search.return_value = {"_scroll_id": "scroll-1", "hits": {"hits": hits[:2]}}
+        client.scroll.side_effect = [
+            {"_scroll_id": "scroll-2", "hits": {"hits": hits[2:4]}},
+            {"_scroll_id": "scroll-2", "hits": {"hits": hits[4:]}},
+            {"_scroll_id": "scroll-2", "hits": {"hits": []}},
+        ]
+        document_store = OpenSearchDocumentStore(hosts="some hosts")
+
+        docs = list(document_store.iter_documents(batch_size=2))
+
+        assert [doc.id for doc in docs] == ["0", "1", "2", "3", "4"]
+        assert client.search.call_args.kwargs["body"] == {"size": 2, "sort": ["_doc"]}
+        assert client.scroll.call_args_list[1].kwargs["scroll_id"] == "scroll-2"
+        client.clear_scroll.assert_called_once_with(scroll_id="scroll-2", params={"ignore": [404]})
+
+    @patch("opensearch_haystack.document_store.OpenSearch")
+    def test_filter_documents_max_documents(self, mock_opensearch_client):
+        client = mock_opensearch_client.return_value
+        hits = [{"_source": {"id": str(i), "content": f"doc {i}"}, "_score": None} for i in range(3)]
+        client.search.return_value = {"_scroll_id": "scroll-1", "hits": {"hits": hits}}
+        client.scroll.return_value = {"_scroll_id": "scroll-1", "hits": {"hits": []}}
+        document_store = OpenSearchDocumentStore(hosts="some hosts")
+
+        assert len(document_store.filter_documents(max_documents=3)) == 3
+        with pytest.raises(DocumentStoreError):
+            document_store.filter_documents(max_documents=2)
+
+    def test_iter_documents(self, document_store: OpenSearchDocumentStore):
+        docs = [Document(content=f"Document {i}", meta={"number": i % 2}) for i in range(25)]
+        document_store.write_documents(docs)
+
+        assert len(list(document_store.iter_documents(batch_size=10))) == 25
+
+        filters = {"field": "meta.number", "operator": "==", "value": 1}
+        result = list(document_store.iter_documents(filters, batch_size=5, slices=2))
+        assert sorted(doc.content for doc in result) == sorted(doc.content for doc in docs if doc.meta["number"] == 1)
+
     def test_write_documents(self, document_store: OpenSearchDocumentStore):
         docs = [Document(id="1")]
         assert document_store.write_documents(docs) == 1
@@ -297,6 +339,65 @@ class TestDocumentStore(DocumentStoreBaseTests):
         )
         assert len(results) == 11
 
+    @patch("opensearch_haystack.document_store.OpenSearch")
+    def test_embedding_retrieval_batch_uses_msearch(self, mock_opensearch_client):
+        client = mock_opensearch_client.return_value
+
+        def msearch(body, **_kwargs):
+            bodies = body[1::2]
+            return {
+                "responses": [
+                    {
+                        "hits": {
+                            "hits": [
+                                {
+                                    "_source": {
+                                        "content": str(b["query"]["bool"]["must"][0]["knn"]["embedding"]["vector"])
+                                    },
+                                    "_score": 1.0,
+                                }
+                            ]
+                        }
+                    }
+                    for b in bodies
+                ]
+            }
+
+        client.msearch.side_effect = msearch
+        document_store = OpenSearchDocumentStore(hosts="some hosts")
+        query_embeddings = [[float(i), 0.0] for i in range(5)]
+
+        results = document_store._embedding_retrieval_batch(query_embeddings, top_k=3, batch_size=2, max_concurrency=2)
+
+        assert client.msearch.call_count == 3
+        assert [docs[0].content for docs in results] == [str(embedding) for embedding in query_embeddings]
+        assert client.msearch.call_args_list[0].kwargs["body"][1]["size"] == 3
+
+    @patch("opensearch_haystack.document_store.OpenSearch")
+    def test_bm25_retrieval_batch_raises_on_failed_search(self, mock_opensearch_client):
+        client = mock_opensearch_client.return_value
+        client.msearch.return_value = {"responses": [{"hits": {"hits": []}}, {"error": {"type": "some_error"}}]}
+        document_store = OpenSearchDocumentStore(hosts="some hosts")
+
+        with pytest.raises(DocumentStoreError):
+            document_store._bm25_retrieval_batch(["first query", "second query"])
+
+    def test_embedding_retrieval_batch(self, document_store_embedding_dim_4: OpenSearchDocumentStore):
+        docs = [
+            Document(content="Most similar document", embedding=[1.0, 1.0, 1.0, 1.0]),
+            Document(content="2nd best document", embedding=[0.8, 0.8, 0.8, 1.0]),
+            Document(content="Not very similar document", embedding=[0.0, 0.8, 0.3, 0.9]),
+        ]
+        document_store_embedding_dim_4.write_documents(docs)
+        results = document_store_embedding_dim_4._embedding_retrieval_batch(
+            query_embeddings=[[0.1, 0.1, 0.1, 0.1], [0.2, 0.2, 0.2, 0.2], [0.3, 0.3, 0.3, 0.3]],
+            top_k=2,
+            batch_size=2,
+        )
+        assert len(results) == 3
+        for documents in results:
+            assert [doc.content for doc in documents] == ["Most similar document", "2nd best document"]
+
     def test_embedding_retrieval_query_documents_different_embedding_sizes(
         self, document_store_embedding_dim_4: OpenSearchDocumentStore
     ):
@@ -322,3 +423,16 @@ class TestDocumentStore(DocumentStoreBaseTests):
 
         with pytest.raises(DocumentStoreError):
             document_store_embedding_dim_4.write_documents(docs)
+
+    def test_write_documents_with_numpy_embeddings(self, document_store_embedding_dim_4: OpenSearchDocumentStore):
+        """
+        Test that the rows of a NumPy matrix, as set by embedders with an embedding_dtype, are written as embeddings.
+        """
+        embeddings = np.array([[0.5, 1.0, 0.0, 0.0], [1.0, 0.5, 0.0, 0.0]], dtype=np.float16)
+        docs = [Document(id=str(i), content=f"doc {i}") for i in range(2)]
+        for doc, embedding in zip(docs, embeddings):
+            doc.embedding = embedding
+
+        assert document_store_embedding_dim_4.write_documents(docs) == 2
+        documents = sorted(document_store_embedding_dim_4.filter_documents(), key=lambda doc: doc.id)
+        assert [doc.embedding for doc in documents] == [[0.5, 1.0, 0.0, 0.0], [1.0, 0.5, 0.0, 0.0]]
@@ -70,3 +70,17 @@ class PineconeDenseRetriever:
             top_k=self.top_k,
         )
         return {"documents": docs}
+
+    async def run_async(self, query_embedding: List[float]):
+        """
+        Asynchronously retrieve documents from the PineconeDocumentStore, based on their dense embeddings.
+
+        :param query_embedding: Embedding of the query.
+        :return: List of Document similar to `query_embedding`.
+        """
+        docs = await self.document_store._embedding_retrieval_async(
+            query_embedding=query_embedding,
+            filters=self.filters,
+            top_k=self.top_k,
+        )
+        return {"documents": docs}
@@ -1,12 +1,15 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 import io
 import logging
 import os
 from copy import copy
+from functools import partial
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 import pinecone
 from haystack import default_to_dict
@@ -218,6 +221,31 @@ class PineconeDocumentStore:
 
         return self._convert_query_result_to_documents(result)
 
+    async def _embedding_retrieval_async(
+        self,
+        query_embedding: List[float],
+        *,
+        namespace: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+    ) -> List[Document]:
+        """
+        Async version of `_embedding_retrieval`, used by `PineconeDenseRetriever.run_async`.
+
+        The Pinecone client has no asyncio API, so the query runs in the default executor of the event loop
+        and shares the connection pool of the `pinecone.Index`.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(
+                self._embedding_retrieval,
+                query_embedding=query_embedding,
+                namespace=namespace,
+                filters=filters,
+                top_k=top_k,
+            ),
+        )
+
     def _convert_query_result_to_documents(self, query_result: Dict[str, Any]) -> List[Document]:
         pinecone_docs = query_result["matches"]
         documents = []
@@ -250,7 +278,11 @@ class PineconeDocumentStore:
     def _convert_documents_to_pinecone_format(self, documents: List[Document]) -> List[Dict[str, Any]]:
         documents_for_pinecone = []
         for document in documents:
-            embedding = copy(document.embedding)
+            if isinstance(document.embedding, np.ndarray):
+                # embedders may return NumPy rows, while Pinecone only accepts lists of floats
+                embedding = document.embedding.tolist()
+            else:
+                embedding = copy(document.embedding)
             if embedding is None:
                 logger.warning(
                     f"Document {document.id} has no embedding. Pinecone is a purely vector database. "
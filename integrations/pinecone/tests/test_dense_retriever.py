@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 from unittest.mock import Mock, patch
 
 from haystack.dataclasses import Document
@@ -98,3 +99,17 @@ def test_run():
     assert len(res["documents"]) == 1
     assert res["documents"][0].content == "Test doc"
     assert res["documents"][0].embedding == [0.1, 0.2]
+
+
+def test_run_async():
+    mock_store = Mock(spec=PineconeDocumentStore)
+    mock_store._embedding_retrieval_async.return_value = [Document(content="Test doc", embedding=[0.1, 0.2])]
+    retriever = PineconeDenseRetriever(document_store=mock_store)
+    res = asyncio.run(retriever.run_async(query_embedding=[0.5, 0.7]))
+    mock_store._embedding_retrieval_async.assert_awaited_once_with(
+        query_embedding=[0.5, 0.7],
+        filters={},
+        top_k=10,
+    )
+    assert len(res["documents"]) == 1
+    assert res["documents"][0].content == "Test doc"
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import patch
 
 import numpy as np
@@ -59,6 +60,44 @@ class TestDocumentStore(CountDocumentsTest, DeleteDocumentsTest, WriteDocumentsT
 
         mock_pinecone.init.assert_called_with(api_key="fake-api-key", environment="gcp-starter")
 
+    @patch("pinecone_haystack.document_store.pinecone")
+    def test_embedding_retrieval_async(self, mock_pinecone):
+        mock_pinecone.Index.return_value.describe_index_stats.return_value = {"dimension": 2}
+        mock_pinecone.Index.return_value.query.return_value = {
+            "matches": [{"id": "1", "metadata": {"content": "Test doc"}, "values": [0.1, 0.2], "score": 0.9}]
+        }
+        document_store = PineconeDocumentStore(api_key="fake-api-key", dimension=2)
+
+        docs = asyncio.run(document_store._embedding_retrieval_async(query_embedding=[0.5, 0.7], top_k=1))
+
+        mock_pinecone.Index.return_value.query.assert_called_once_with(
+            vector=[0.5, 0.7],
+            top_k=1,
+            namespace="default",
+            filter=None,
+            include_values=True,
+            include_metadata=True,
+        )
+        assert len(docs) == 1
+        assert docs[0].content == "Test doc"
+        assert docs[0].score == 0.9
+
+    @patch("pinecone_haystack.document_store.pinecone")
+    def test_write_documents_with_numpy_embeddings(self, mock_pinecone):
+        mock_pinecone.Index.return_value.describe_index_stats.return_value = {"dimension": 2}
+        mock_pinecone.Index.return_value.upsert.return_value = {"upserted_count": 2}
+        document_store = PineconeDocumentStore(api_key="fake-api-key", dimension=2)
+        # embedders with an embedding_dtype set the rows of a NumPy matrix as embeddings
+        embeddings = np.array([[0.5, 1.0], [1.0, 0.5]], dtype=np.float16)
+        docs = [Document(id=str(i), content=f"doc {i}") for i in range(2)]
+        for doc, embedding in zip(docs, embeddings):
+            doc.embedding = embedding
+
+        assert document_store.write_documents(docs) == 2
+        vectors = mock_pinecone.Index.return_value.upsert.call_args.kwargs["vectors"]
+        assert [vector["values"] for vector in vectors] == [[0.5, 1.0], [1.0, 0.5]]
+        assert all(type(vector["values"]) is list for vector in vectors)
+
     def test_init_fails_wo_api_key(self, monkeypatch):
         api_key = None
         monkeypatch.delenv("PINECONE_API_KEY", raising=False)
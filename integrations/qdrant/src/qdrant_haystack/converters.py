@@ -1,7 +1,11 @@
+import io
 import uuid
-from typing import List, Union
+from dataclasses import fields
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
-from haystack.dataclasses import Document
+import numpy as np
+import pandas as pd
+from haystack.dataclasses import ByteStream, Document
 from qdrant_client.http import models as rest
 
 
@@ -12,14 +16,32 @@ class HaystackToQdrant:
 
     def documents_to_batch(
         self,
-        documents: List[Document],
+        documents: Iterable[Document],
         *,
         embedding_field: str,
+        vector_name: Optional[str] = None,
+        named_vectors: Iterable[str] = (),
+        sparse_vectors: Iterable[str] = (),
     ) -> List[rest.PointStruct]:
+        """
+        Converts Documents to points.
+
+        With a `vector_name`, the embedding of each Document is stored in the dense vector of that name.
+        The values of the other named dense and sparse vectors are moved from the Document's meta, under
+        the name of the vector, to the point's vectors. Sparse values are dicts with "indices" and "values".
+        """
         points = []
         for document in documents:
             payload = document.to_dict(flatten=False)
-            vector = payload.pop(embedding_field) or {}
+            vector = payload.pop(embedding_field)
+            if isinstance(vector, np.ndarray):
+                # embedders may return NumPy rows, while points only accept lists of floats
+                vector = vector.tolist()
+            vector = vector or {}
+            if vector_name is not None:
+                vector = self._named_vectors(
+                    vector, payload["meta"], vector_name=vector_name, named=named_vectors, sparse=sparse_vectors
+                )
             _id = self.convert_id(payload.get("id"))
 
             point = rest.PointStruct(
@@ -30,6 +52,27 @@ class HaystackToQdrant:
             points.append(point)
         return points
 
+    @staticmethod
+    def _named_vectors(
+        embedding: List[float],
+        meta: Dict[str, Any],
+        *,
+        vector_name: str,
+        named: Iterable[str],
+        sparse: Iterable[str],
+    ) -> Dict[str, Any]:
+        vectors: Dict[str, Any] = {vector_name: embedding} if embedding else {}
+        for name in named:
+            if meta.get(name) is not None:
+                vectors[name] = meta.pop(name)
+        for name in sparse:
+            if meta.get(name) is not None:
+                sparse_embedding = meta.pop(name)
+                vectors[name] = rest.SparseVector(
+                    indices=sparse_embedding["indices"], values=sparse_embedding["values"]
+                )
+        return vectors
+
     def convert_id(self, _id: str) -> str:
         """
         Converts any string into a UUID-like format in a deterministic way.
@@ -44,13 +87,81 @@ QdrantPoint = Union[rest.ScoredPoint, rest.Record]
 
 
 class QdrantToHaystack:
-    def __init__(self, content_field: str, name_field: str, embedding_field: str):
+    def __init__(self, content_field: str, name_field: str, embedding_field: str, vector_name: Optional[str] = None):
         self.content_field = content_field
         self.name_field = name_field
         self.embedding_field = embedding_field
+        self.vector_name = vector_name
+
+    # Payloads written by HaystackToQdrant only have these keys
+    DOCUMENT_FIELDS = frozenset(field.name for field in fields(Document))
 
     def point_to_document(self, point: QdrantPoint) -> Document:
         payload = {**point.payload}
-        payload["embedding"] = point.vector if hasattr(point, "vector") else None
+        embedding, other_vectors = self._split_vectors(point.vector if hasattr(point, "vector") else None)
+        payload["embedding"] = embedding
         payload["score"] = point.score if hasattr(point, "score") else None
-        return Document.from_dict(payload)
+        document = Document.from_dict(payload)
+        document.meta.update(other_vectors)
+        return document
+
+    def _split_vectors(self, vector: Any) -> Tuple[Optional[List[float]], Dict[str, Any]]:
+        """
+        Separates the embedding of the Document from the other named vectors of a point,
+        which are returned in the format of the Document's meta.
+        """
+        if not isinstance(vector, dict):
+            return vector, {}
+        other_vectors = {
+            name: {"indices": value.indices, "values": value.values} if isinstance(value, rest.SparseVector) else value
+            for name, value in vector.items()
+            if name != self.vector_name
+        }
+        return vector.get(self.vector_name), other_vectors
+
+    def points_to_documents(
+        self,
+        points: Sequence[QdrantPoint],
+        *,
+        scores: Optional[Sequence[float]] = None,
+        return_embedding: bool = True,
+    ) -> List[Document]:
+        """
+        Converts many points at once.
+
+        :param points: the points to convert.
+        :param scores: the scores to set on the Documents, in place of the raw scores of the points.
+        :param return_embedding: whether to set the vectors of the points on the Documents.
+        """
+        if scores is None:
+            scores = [getattr(point, "score", None) for point in points]
+        documents = []
+        for point, score in zip(points, scores):
+            embedding, other_vectors = self._split_vectors(getattr(point, "vector", None) if return_embedding else None)
+            documents.append(
+                self._payload_to_document(
+                    point.payload or {}, embedding=embedding, score=score, extra_meta=other_vectors
+                )
+            )
+        return documents
+
+    def _payload_to_document(
+        self, payload: dict, *, embedding, score: Optional[float], extra_meta: Dict[str, Any]
+    ) -> Document:
+        if not self.DOCUMENT_FIELDS.issuperset(payload):
+            # Flattened metadata or legacy fields, let Document sort them out
+            document = Document.from_dict({**payload, "embedding": embedding, "score": score})
+            document.meta.update(extra_meta)
+            return document
+
+        dataframe = payload.get("dataframe")
+        blob = payload.get("blob")
+        return Document(
+            id=payload.get("id", ""),
+            content=payload.get("content"),
+            dataframe=pd.read_json(io.StringIO(dataframe)) if dataframe is not None else None,
+            blob=ByteStream(data=bytes(blob["data"]), mime_type=blob["mime_type"]) if blob else None,
+            meta={**(payload.get("meta") or {}), **extra_meta},
+            score=score,
+            embedding=embedding,
+        )
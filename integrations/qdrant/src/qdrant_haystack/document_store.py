@@ -1,7 +1,13 @@
+import asyncio
 import inspect
 import logging
+import threading
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from functools import partial
 from itertools import islice
-from typing import Any, ClassVar, Dict, Generator, List, Optional, Set, Union
+from typing import Any, ClassVar, Dict, Generator, Iterable, List, Optional, Set, Sized, Tuple, Union
 
 import numpy as np
 import qdrant_client
@@ -46,6 +52,7 @@ class QdrantDocumentStore:
         "dot_product": rest.Distance.DOT,
         "l2": rest.Distance.EUCLID,
     }
+    UNINDEXED_FILTER_POLICIES: ClassVar[Tuple[Optional[str], ...]] = (None, "warn", "create")
 
     def __init__(
         self,
@@ -83,9 +90,66 @@ class QdrantDocumentStore:
         metadata: Optional[dict] = None,
         write_batch_size: int = 100,
         scroll_size: int = 10_000,
+        write_concurrency: int = 1,
+        vector_name: Optional[str] = None,
+        named_vectors: Optional[Dict[str, int]] = None,
+        sparse_vectors: Optional[List[str]] = None,
+        on_disk: Optional[bool] = None,
+        search_params: Optional[dict] = None,
+        payload_indexes: Optional[Dict[str, str]] = None,
+        on_unindexed_filter: Optional[str] = None,
     ):
+        """
+        Creates a QdrantDocumentStore. Most of the parameters are passed as they are to the Qdrant client
+        or used to configure the collection, the named vector ones are:
+
+        :param vector_name: Name of the dense vector holding `Document.embedding`. By default the
+            collection has a single unnamed vector.
+        :param named_vectors: Additional named dense vectors, mapping their name to their dimension.
+            The vector of each Document is read from its meta under the same name.
+        :param sparse_vectors: Names of sparse vectors, whose values are read from the Document's meta
+            under the same name, as dicts with "indices" and "values" lists.
+            `vector_name` must be set to use `named_vectors` or `sparse_vectors`.
+
+        The search settings are:
+
+        :param on_disk: Whether to keep the dense vectors on disk rather than in RAM when the collection
+            is created. Usually combined with a `quantization_config`, so that only the quantized vectors
+            are kept in RAM and the original ones are read from disk for rescoring.
+        :param search_params: Default search parameters of the queries, as accepted by Qdrant's `SearchParams`,
+            for example `{"hnsw_ef": 128, "exact": False, "quantization": {"rescore": True, "oversampling": 2.0}}`.
+            They can be overridden on each query.
+
+        The payload index settings are:
+
+        :param payload_indexes: Payload fields to index, mapping the field, for example "meta.category",
+            to its index type: "keyword", "integer", "float", "bool", "geo" or "text".
+            Missing indexes are created when the collection is set up, existing ones are left untouched.
+        :param on_unindexed_filter: What to do when a filter uses a payload field that has no index,
+            which makes Qdrant scan the payloads. `None` does nothing, "warn" logs a warning once per field
+            and "create" creates an index whose type is guessed from the filter value.
+        """
         super().__init__()
 
+        if vector_name is None and (named_vectors or sparse_vectors):
+            msg = "vector_name must be set when the collection has named_vectors or sparse_vectors"
+            raise ValueError(msg)
+        self.vector_name = vector_name
+        self.named_vectors = named_vectors
+        self.sparse_vectors = sparse_vectors
+        self.on_disk = on_disk
+        self.search_params = search_params
+
+        if on_unindexed_filter not in self.UNINDEXED_FILTER_POLICIES:
+            msg = f"on_unindexed_filter must be one of {self.UNINDEXED_FILTER_POLICIES}"
+            raise ValueError(msg)
+        self.payload_indexes = payload_indexes
+        self.on_unindexed_filter = on_unindexed_filter
+        self._payload_index_types = {
+            field: rest.PayloadSchemaType(schema) for field, schema in (payload_indexes or {}).items()
+        }
+        self._indexed_fields: Set[str] = set()
+
         metadata = metadata or {}
         self.client = qdrant_client.QdrantClient(
             location=location,
@@ -147,10 +211,22 @@ class QdrantDocumentStore:
             content_field,
             name_field,
             embedding_field,
+            vector_name=vector_name,
         )
         self.write_batch_size = write_batch_size
         self.scroll_size = scroll_size
 
+        if write_concurrency < 1:
+            msg = "write_concurrency must be a positive integer"
+            raise ValueError(msg)
+        self.write_concurrency = write_concurrency
+        # Qdrant local keeps the collections in plain Python structures which are not safe
+        # to modify from multiple threads, so the upserts are serialized in that mode.
+        self._is_local = location == ":memory:" or path is not None
+        self._upsert_lock = threading.Lock() if self._is_local else nullcontext()
+        # The async client is created on first use, so that it's bound to the running event loop
+        self._async_client: Optional[qdrant_client.AsyncQdrantClient] = None
+
     def count_documents(self) -> int:
         try:
             response = self.client.count(
@@ -163,6 +239,51 @@ class QdrantDocumentStore:
             # we need to catch both.
             return 0
 
+    async def count_documents_async(self) -> int:
+        if self._is_local:
+            return await self._run_in_executor(self.count_documents)
+        try:
+            response = await self._get_async_client().count(
+                collection_name=self.index,
+            )
+            return response.count
+        except UnexpectedResponse:
+            return 0
+
+    def _get_async_client(self) -> qdrant_client.AsyncQdrantClient:
+        """
+        Returns the `AsyncQdrantClient` shared by all the async methods, creating it on first use.
+        """
+        if self._async_client is None:
+            self._async_client = qdrant_client.AsyncQdrantClient(
+                location=self.location,
+                url=self.url,
+                port=self.port,
+                grpc_port=self.grpc_port,
+                prefer_grpc=self.prefer_grpc,
+                https=self.https,
+                api_key=self.api_key,
+                prefix=self.prefix,
+                timeout=self.timeout,
+                host=self.host,
+                path=self.path,
+                metadata=self.metadata,
+            )
+        return self._async_client
+
+    async def close_async(self):
+        """
+        Closes the connections of the async client, if it has been created.
+        """
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    async def _run_in_executor(self, func, *args, **kwargs):
+        # Qdrant local keeps its data in the memory of the sync client, and an async client
+        # would open a separate storage. There is no network I/O to overlap in that mode anyway.
+        return await asyncio.get_running_loop().run_in_executor(None, partial(func, *args, **kwargs))
+
     def filter_documents(
         self,
         filters: Optional[Dict[str, Any]] = None,
@@ -181,41 +302,117 @@ class QdrantDocumentStore:
 
     def write_documents(
         self,
-        documents: List[Document],
+        documents: Iterable[Document],
         policy: DuplicatePolicy = DuplicatePolicy.FAIL,
     ):
-        for doc in documents:
-            if not isinstance(doc, Document):
-                msg = f"DocumentStore.write_documents() expects a list of Documents but got an element of {type(doc)}."
-                raise ValueError(msg)
+        """
+        Writes documents to the collection, `write_batch_size` at a time.
+
+        Any iterable is accepted, a generator is consumed lazily so that memory usage depends on
+        `write_batch_size` and `write_concurrency` rather than on the number of documents.
+        With the SKIP and FAIL policies, duplicates are looked up batch by batch, so a document repeated
+        in a batch that is still being written concurrently may not be detected.
+
+        :param documents: The documents to write.
+        :param policy: How to handle documents whose id already exists in the collection.
+        :return: The number of documents written.
+        """
         self._set_up_collection(self.index, self.embedding_dim, False, self.similarity)
 
-        if len(documents) == 0:
+        received = 0
+        written = 0
+
+        def batches() -> Generator[Tuple[Document, ...], None, None]:
+            nonlocal received, written
+            for input_batch in get_batches_from_generator(documents, self.write_batch_size):
+                for doc in input_batch:
+                    if not isinstance(doc, Document):
+                        msg = (
+                            "DocumentStore.write_documents() expects a list of Documents "
+                            f"but got an element of {type(doc)}."
+                        )
+                        raise ValueError(msg)
+                received += len(input_batch)
+                document_batch = tuple(
+                    self._handle_duplicate_documents(documents=list(input_batch), index=self.index, policy=policy)
+                )
+                if document_batch:
+                    written += len(document_batch)
+                    yield document_batch
+
+        total = len(documents) if isinstance(documents, Sized) else None
+        with tqdm(total=total, disable=not self.progress_bar) as progress_bar:
+            if self.write_concurrency > 1:
+                self._write_batches_concurrently(batches(), progress_bar)
+            else:
+                for document_batch in batches():
+                    self._upsert_points(self._documents_to_points(document_batch))
+                    progress_bar.update(len(document_batch))
+
+        if received == 0:
             logger.warning("Calling QdrantDocumentStore.write_documents() with empty list")
-            return
-
-        document_objects = self._handle_duplicate_documents(
-            documents=documents,
-            index=self.index,
-            policy=policy,
+        return written
+
+    def _documents_to_points(self, documents: Iterable[Document]) -> List[rest.PointStruct]:
+        return self.haystack_to_qdrant_converter.documents_to_batch(
+            documents,
+            embedding_field=self.embedding_field,
+            vector_name=self.vector_name,
+            named_vectors=self.named_vectors or {},
+            sparse_vectors=self.sparse_vectors or [],
         )
 
-        batched_documents = get_batches_from_generator(document_objects, self.write_batch_size)
-        with tqdm(total=len(document_objects), disable=not self.progress_bar) as progress_bar:
-            for document_batch in batched_documents:
-                batch = self.haystack_to_qdrant_converter.documents_to_batch(
-                    document_batch,
-                    embedding_field=self.embedding_field,
-                )
+    def _upsert_points(self, points: List[rest.PointStruct]):
+        with self._upsert_lock:
+            self.client.upsert(
+                collection_name=self.index,
+                points=points,
+                wait=self.wait_result_from_api,
+            )
 
-                self.client.upsert(
-                    collection_name=self.index,
-                    points=batch,
-                    wait=self.wait_result_from_api,
-                )
+    def _write_batches_concurrently(self, batched_documents: Iterable[Tuple[Document, ...]], progress_bar: tqdm):
+        """
+        Upserts the batches with up to `write_concurrency` requests in flight.
+
+        The next batch is converted in the calling thread while the previous ones are being sent.
+        Once `write_concurrency` upserts are pending, the conversion waits for one of them to finish,
+        so the number of converted batches held in memory stays bounded.
+        All the batches are attempted, and the failed ones are reported together at the end.
 
-                progress_bar.update(self.write_batch_size)
-        return len(document_objects)
+        :param batched_documents: An iterable of Document batches.
+        :param progress_bar: The progress bar to update after each successful upsert.
+        :raises QdrantStoreError: If any of the batches could not be written.
+        """
+        pending: Dict[Future, Tuple[int, Tuple[Document, ...]]] = {}
+        failed_batches: List[Tuple[int, Tuple[Document, ...], BaseException]] = []
+
+        def collect(done: Set[Future]):
+            for future in done:
+                batch_number, document_batch = pending.pop(future)
+                error = future.exception()
+                if error is not None:
+                    failed_batches.append((batch_number, document_batch, error))
+                else:
+                    progress_bar.update(len(document_batch))
+
+        with ThreadPoolExecutor(max_workers=self.write_concurrency) as executor:
+            for batch_number, document_batch in enumerate(batched_documents):
+                if len(pending) >= self.write_concurrency:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                points = self._documents_to_points(document_batch)
+                pending[executor.submit(self._upsert_points, points)] = (batch_number, document_batch)
+            done, _ = wait(pending)
+            collect(done)
+
+        if failed_batches:
+            failed_batches.sort(key=lambda failure: failure[0])
+            details = "\n".join(
+                f"batch {batch_number} ({len(document_batch)} documents, first id '{document_batch[0].id}'): {error!r}"
+                for batch_number, document_batch, error in failed_batches
+            )
+            msg = f"Failed to write {len(failed_batches)} batch(es) to Qdrant collection '{self.index}':\n{details}"
+            raise QdrantStoreError(msg) from failed_batches[0][2]
 
     def delete_documents(self, ids: List[str]):
         ids = [self.haystack_to_qdrant_converter.convert_id(_id) for _id in ids]
@@ -249,7 +446,7 @@ class QdrantDocumentStore:
         filters: Optional[Dict[str, Any]] = None,
     ) -> Generator[Document, None, None]:
         index = self.index
-        qdrant_filters = self.qdrant_filter_converter.convert(filters)
+        qdrant_filters = self._convert_filters(filters)
 
         next_offset = None
         stop_scrolling = False
@@ -266,8 +463,7 @@ class QdrantDocumentStore:
                 isinstance(next_offset, grpc.PointId) and next_offset.num == 0 and next_offset.uuid == ""
             )
 
-            for record in records:
-                yield self.qdrant_to_haystack.point_to_document(record)
+            yield from self.qdrant_to_haystack.points_to_documents(records)
 
     def get_documents_by_id(
         self,
@@ -276,8 +472,6 @@ class QdrantDocumentStore:
     ) -> List[Document]:
         index = index or self.index
 
-        documents: List[Document] = []
-
         ids = [self.haystack_to_qdrant_converter.convert_id(_id) for _id in ids]
         records = self.client.retrieve(
             collection_name=index,
@@ -286,9 +480,7 @@ class QdrantDocumentStore:
             with_vectors=True,
         )
 
-        for record in records:
-            documents.append(self.qdrant_to_haystack.point_to_document(record))
-        return documents
+        return self.qdrant_to_haystack.points_to_documents(records)
 
     def query_by_embedding(
         self,
@@ -297,27 +489,259 @@ class QdrantDocumentStore:
         top_k: int = 10,
         scale_score: bool = True,  # noqa: FBT001, FBT002
         return_embedding: bool = False,  # noqa: FBT001, FBT002
+        vector_name: Optional[str] = None,
+        search_params: Optional[dict] = None,
     ) -> List[Document]:
-        qdrant_filters = self.qdrant_filter_converter.convert(filters)
+        points = self.client.search(
+            **self._search_request(query_embedding, filters, top_k, return_embedding, vector_name, search_params)
+        )
+
+        return self._points_to_documents(points, scale_score=scale_score, return_embedding=return_embedding)
+
+    async def query_by_embedding_async(
+        self,
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = True,  # noqa: FBT001, FBT002
+        return_embedding: bool = False,  # noqa: FBT001, FBT002
+        vector_name: Optional[str] = None,
+        search_params: Optional[dict] = None,
+    ) -> List[Document]:
+        if self._is_local:
+            return await self._run_in_executor(
+                self.query_by_embedding,
+                query_embedding=query_embedding,
+                filters=filters,
+                top_k=top_k,
+                scale_score=scale_score,
+                return_embedding=return_embedding,
+                vector_name=vector_name,
+                search_params=search_params,
+            )
+
+        points = await self._get_async_client().search(
+            **self._search_request(query_embedding, filters, top_k, return_embedding, vector_name, search_params)
+        )
+
+        return self._points_to_documents(points, scale_score=scale_score, return_embedding=return_embedding)
+
+    def query_by_embedding_batch(
+        self,
+        query_embeddings: List[List[float]],
+        filters: Optional[Union[Dict[str, Any], List[Optional[Dict[str, Any]]]]] = None,
+        top_k: Union[int, List[int]] = 10,
+        scale_score: bool = True,  # noqa: FBT001, FBT002
+        return_embedding: bool = False,  # noqa: FBT001, FBT002
+        batch_size: int = 100,
+        search_params: Optional[dict] = None,
+    ) -> List[List[Document]]:
+        """
+        Runs `query_by_embedding` for many query embeddings, with one `search_batch` call
+        per `batch_size` queries instead of one call per query.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param filters: Filters applied to every query, or a list with the filters of each query.
+        :param top_k: Maximum number of Documents returned for every query, or a list with the value of each query.
+        :param scale_score: Whether to scale the scores of the retrieved documents or not.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents.
+        :param batch_size: Maximum number of queries sent in a single request.
+        :param search_params: Search parameters of all the queries, defaults to the ones of the store.
+        :return: One list of Documents for each query embedding, in the same order as `query_embeddings`.
+        """
+        if isinstance(filters, list):
+            if len(filters) != len(query_embeddings):
+                msg = "filters must have the same length as query_embeddings"
+                raise ValueError(msg)
+            qdrant_filters = [self._convert_filters(query_filters) for query_filters in filters]
+        else:
+            # The same filters apply to all the queries, so they're converted only once
+            qdrant_filters = [self._convert_filters(filters)] * len(query_embeddings)
+
+        if isinstance(top_k, list):
+            if len(top_k) != len(query_embeddings):
+                msg = "top_k must have the same length as query_embeddings"
+                raise ValueError(msg)
+            limits = top_k
+        else:
+            limits = [top_k] * len(query_embeddings)
+
+        qdrant_search_params = self._search_params(search_params)
+        requests = [
+            rest.SearchRequest(
+                vector=self._query_vector(query_embedding),
+                filter=query_filter,
+                params=qdrant_search_params,
+                limit=limit,
+                with_payload=True,
+                with_vector=return_embedding,
+            )
+            for query_embedding, query_filter, limit in zip(query_embeddings, qdrant_filters, limits)
+        ]
+
+        results: List[List[rest.ScoredPoint]] = []
+        for start in range(0, len(requests), batch_size):
+            results.extend(
+                self.client.search_batch(collection_name=self.index, requests=requests[start : start + batch_size])
+            )
+
+        # Convert the points of all the queries at once, so their scores are scaled together
+        documents = self._points_to_documents(
+            [point for points in results for point in points],
+            scale_score=scale_score,
+            return_embedding=return_embedding,
+        )
+        batched_documents = []
+        start = 0
+        for points in results:
+            batched_documents.append(documents[start : start + len(points)])
+            start += len(points)
+        return batched_documents
+
+    def query_by_sparse_embedding(
+        self,
+        query_sparse_embedding: Dict[str, List],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        return_embedding: bool = False,  # noqa: FBT001, FBT002
+        vector_name: Optional[str] = None,
+    ) -> List[Document]:
+        """
+        Searches a sparse vector of the collection.
+
+        :param query_sparse_embedding: The sparse embedding of the query, a dict with "indices" and "values" lists.
+        :param vector_name: The sparse vector to search, defaults to the first of `sparse_vectors`.
+        :return: The matching Documents, with the raw dot product as score.
+        """
+        qdrant_filters = self._convert_filters(filters)
 
         points = self.client.search(
             collection_name=self.index,
-            query_vector=query_embedding,
+            query_vector=self._sparse_query_vector(query_sparse_embedding, vector_name),
             query_filter=qdrant_filters,
             limit=top_k,
             with_vectors=return_embedding,
         )
 
-        results = [self.qdrant_to_haystack.point_to_document(point) for point in points]
+        return self._points_to_documents(points, scale_score=False, return_embedding=return_embedding)
+
+    def query_hybrid(
+        self,
+        query_embedding: List[float],
+        query_sparse_embedding: Dict[str, List],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        return_embedding: bool = False,  # noqa: FBT001, FBT002
+        sparse_vector_name: Optional[str] = None,
+        rrf_k: int = 60,
+        search_params: Optional[dict] = None,
+    ) -> List[Document]:
+        """
+        Runs a dense and a sparse search in a single `search_batch` request, and fuses their results
+        with reciprocal rank fusion: each Document scores the sum of `1 / (rrf_k + rank)` over the searches.
+
+        :param query_embedding: The dense embedding of the query.
+        :param query_sparse_embedding: The sparse embedding of the query, a dict with "indices" and "values" lists.
+        :param filters: Filters applied to both searches.
+        :param top_k: Number of Documents fetched from each search and returned after fusion.
+        :param sparse_vector_name: The sparse vector to search, defaults to the first of `sparse_vectors`.
+        :param rrf_k: The rank constant of the fusion, higher values flatten the differences between ranks.
+        :param search_params: Search parameters of the dense search, defaults to the ones of the store.
+        :return: The fused Documents, with their fusion score.
+        """
+        qdrant_filters = self._convert_filters(filters)
+        requests = [
+            rest.SearchRequest(
+                vector=query_vector,
+                filter=qdrant_filters,
+                params=params,
+                limit=top_k,
+                with_payload=True,
+                with_vector=return_embedding,
+            )
+            for query_vector, params in (
+                (self._query_vector(query_embedding), self._search_params(search_params)),
+                (self._sparse_query_vector(query_sparse_embedding, sparse_vector_name), None),
+            )
+        ]
+        dense_points, sparse_points = self.client.search_batch(collection_name=self.index, requests=requests)
+
+        fused_scores: Dict[Any, float] = {}
+        points_by_id: Dict[Any, rest.ScoredPoint] = {}
+        for points in (dense_points, sparse_points):
+            for rank, point in enumerate(points, start=1):
+                fused_scores[point.id] = fused_scores.get(point.id, 0.0) + 1 / (rrf_k + rank)
+                points_by_id.setdefault(point.id, point)
+
+        best_ids = sorted(fused_scores, key=fused_scores.__getitem__, reverse=True)[:top_k]
+        return self.qdrant_to_haystack.points_to_documents(
+            [points_by_id[point_id] for point_id in best_ids],
+            scores=[fused_scores[point_id] for point_id in best_ids],
+            return_embedding=return_embedding,
+        )
+
+    def _search_request(
+        self,
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]],
+        top_k: int,
+        return_embedding: bool,  # noqa: FBT001
+        vector_name: Optional[str],
+        search_params: Optional[dict],
+    ) -> Dict[str, Any]:
+        """
+        Builds the arguments of the `search` call shared by `query_by_embedding` and `query_by_embedding_async`.
+        """
+        return {
+            "collection_name": self.index,
+            "query_vector": self._query_vector(query_embedding, vector_name),
+            "query_filter": self._convert_filters(filters),
+            "search_params": self._search_params(search_params),
+            "limit": top_k,
+            "with_vectors": return_embedding,
+        }
+
+    def _search_params(self, search_params: Optional[dict] = None) -> Optional[rest.SearchParams]:
+        search_params = search_params if search_params is not None else self.search_params
+        return rest.SearchParams(**search_params) if search_params else None
+
+    def _query_vector(
+        self, query_embedding: List[float], vector_name: Optional[str] = None
+    ) -> Union[List[float], rest.NamedVector]:
+        vector_name = vector_name or self.vector_name
+        if vector_name is None:
+            return query_embedding
+        return rest.NamedVector(name=vector_name, vector=query_embedding)
+
+    def _sparse_query_vector(
+        self, query_sparse_embedding: Dict[str, List], vector_name: Optional[str] = None
+    ) -> rest.NamedSparseVector:
+        vector_name = vector_name or (self.sparse_vectors[0] if self.sparse_vectors else None)
+        if vector_name is None:
+            msg = f"Collection '{self.index}' has no sparse vectors, set sparse_vectors to search them"
+            raise QdrantStoreError(msg)
+        return rest.NamedSparseVector(
+            name=vector_name,
+            vector=rest.SparseVector(
+                indices=query_sparse_embedding["indices"], values=query_sparse_embedding["values"]
+            ),
+        )
+
+    def _points_to_documents(
+        self, points: List[rest.ScoredPoint], *, scale_score: bool, return_embedding: bool = True
+    ) -> List[Document]:
+        scores = None
         if scale_score:
-            for document in results:
-                score = document.score
-                if self.similarity == "cosine":
-                    score = (score + 1) / 2
-                else:
-                    score = float(1 / (1 + np.exp(-score / 100)))
-                document.score = score
-        return results
+            scores = self._scale_scores(np.fromiter((point.score for point in points), dtype=float)).tolist()
+        return self.qdrant_to_haystack.points_to_documents(points, scores=scores, return_embedding=return_embedding)
+
+    def _scale_scores(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Scales raw similarity scores to the [0, 1] range.
+        """
+        if self.similarity == "cosine":
+            return (scores + 1) / 2
+        return 1 / (1 + np.exp(-scores / 100))
 
     def _get_distance(self, similarity: str) -> rest.Distance:
         try:
@@ -343,6 +767,7 @@ class QdrantDocumentStore:
             # There is no need to verify the current configuration of that
             # collection. It might be just recreated again.
             self._recreate_collection(collection_name, distance, embedding_dim)
+            self._create_payload_indexes(collection_name, {})
             return
 
         try:
@@ -357,10 +782,25 @@ class QdrantDocumentStore:
             # with the remote server UnexpectedResponse / RpcError is raised.
             # Until that's unified, we need to catch both.
             self._recreate_collection(collection_name, distance, embedding_dim)
+            self._create_payload_indexes(collection_name, {})
             return
 
-        current_distance = collection_info.config.params.vectors.distance
-        current_vector_size = collection_info.config.params.vectors.size
+        current_vectors = collection_info.config.params.vectors
+        if isinstance(current_vectors, dict) != (self.vector_name is not None) or (
+            self.vector_name is not None and self.vector_name not in current_vectors
+        ):
+            msg = (
+                f"Collection '{collection_name}' already exists in Qdrant, "
+                f"but its vectors are not configured as expected by vector_name '{self.vector_name}'. "
+                f"If you want to use that collection, but with different vectors, "
+                f"please set `recreate_collection=True` argument."
+            )
+            raise ValueError(msg)
+        if self.vector_name is not None:
+            current_vectors = current_vectors[self.vector_name]
+
+        current_distance = current_vectors.distance
+        current_vector_size = current_vectors.size
 
         if current_distance != distance:
             msg = (
@@ -380,13 +820,103 @@ class QdrantDocumentStore:
             )
             raise ValueError(msg)
 
+        self._create_payload_indexes(collection_name, collection_info.payload_schema)
+
+    def _create_payload_indexes(self, collection_name: str, payload_schema: Dict[str, Any]):
+        """
+        Creates the configured payload indexes that the collection does not have yet.
+        """
+        self._indexed_fields.update(payload_schema)
+        for field, schema in self._payload_index_types.items():
+            if field not in self._indexed_fields:
+                self._create_payload_index(collection_name, field, schema)
+
+    def _create_payload_index(self, collection_name: str, field: str, schema: rest.PayloadSchemaType):
+        self.client.create_payload_index(
+            collection_name=collection_name,
+            field_name=field,
+            field_schema=schema,
+            wait=self.wait_result_from_api,
+        )
+        self._indexed_fields.add(field)
+
+    def _convert_filters(self, filters: Optional[Dict[str, Any]]) -> Optional[rest.Filter]:
+        """
+        Converts Haystack filters to a Qdrant filter, checking the payload indexes of the fields they use
+        according to `on_unindexed_filter`.
+        """
+        qdrant_filters = self.qdrant_filter_converter.convert(filters)
+        if self.on_unindexed_filter is None or qdrant_filters is None:
+            return qdrant_filters
+
+        for field, schema in self._filtered_fields(qdrant_filters).items():
+            if field in self._indexed_fields:
+                continue
+            if self.on_unindexed_filter == "create":
+                logger.info("Creating a '%s' payload index on field '%s'", schema.value, field)
+                self._create_payload_index(self.index, field, schema)
+            else:
+                logger.warning(
+                    "Filtering on field '%s', which has no payload index in collection '%s'. "
+                    "Consider adding it to `payload_indexes`.",
+                    field,
+                    self.index,
+                )
+                # Warn only once per field
+                self._indexed_fields.add(field)
+        return qdrant_filters
+
+    @classmethod
+    def _filtered_fields(cls, qdrant_filter: rest.Filter) -> Dict[str, rest.PayloadSchemaType]:
+        """
+        Collects the payload fields a Qdrant filter matches on, with the index type suited to the match.
+        """
+        fields: Dict[str, rest.PayloadSchemaType] = {}
+        for clause in (qdrant_filter.must, qdrant_filter.should, qdrant_filter.must_not):
+            conditions = clause if isinstance(clause, list) else [clause] if clause is not None else []
+            for condition in conditions:
+                if isinstance(condition, rest.Filter):
+                    fields.update(cls._filtered_fields(condition))
+                elif isinstance(condition, rest.FieldCondition):
+                    fields.setdefault(condition.key, cls._payload_schema_type(condition))
+        return fields
+
+    @staticmethod
+    def _payload_schema_type(condition: rest.FieldCondition) -> rest.PayloadSchemaType:
+        if isinstance(condition.match, rest.MatchText):
+            return rest.PayloadSchemaType.TEXT
+        if condition.range is not None:
+            return rest.PayloadSchemaType.FLOAT
+        if isinstance(condition.match, rest.MatchValue):
+            value = condition.match.value
+        elif isinstance(condition.match, rest.MatchAny) and condition.match.any:
+            value = condition.match.any[0]
+        else:
+            return rest.PayloadSchemaType.KEYWORD
+        if isinstance(value, bool):
+            return rest.PayloadSchemaType.BOOL
+        if isinstance(value, int):
+            return rest.PayloadSchemaType.INTEGER
+        return rest.PayloadSchemaType.KEYWORD
+
     def _recreate_collection(self, collection_name: str, distance, embedding_dim: int):
+        vectors_config: Union[rest.VectorParams, Dict[str, rest.VectorParams]] = rest.VectorParams(
+            size=embedding_dim,
+            distance=distance,
+            on_disk=self.on_disk,
+        )
+        if self.vector_name is not None:
+            vectors_config = {
+                self.vector_name: vectors_config,
+                **{
+                    name: rest.VectorParams(size=size, distance=distance, on_disk=self.on_disk)
+                    for name, size in (self.named_vectors or {}).items()
+                },
+            }
         self.client.recreate_collection(
             collection_name=collection_name,
-            vectors_config=rest.VectorParams(
-                size=embedding_dim,
-                distance=distance,
-            ),
+            vectors_config=vectors_config,
+            sparse_vectors_config={name: rest.SparseVectorParams() for name in self.sparse_vectors or []} or None,
             shard_number=self.shard_number,
             replication_factor=self.replication_factor,
             write_consistency_factor=self.write_consistency_factor,
@@ -397,6 +927,7 @@ class QdrantDocumentStore:
             quantization_config=self.quantization_config,
             init_from=self.init_from,
         )
+        self._indexed_fields.clear()
 
     def _handle_duplicate_documents(
         self,
@@ -422,17 +953,32 @@ class QdrantDocumentStore:
         index = index or self.index
         if policy in (DuplicatePolicy.SKIP, DuplicatePolicy.FAIL):
             documents = self._drop_duplicate_documents(documents, index)
-            documents_found = self.get_documents_by_id(ids=[doc.id for doc in documents], index=index)
-            ids_exist_in_db: List[str] = [doc.id for doc in documents_found]
+            ids_exist_in_db = self._existing_ids([doc.id for doc in documents], index)
 
             if len(ids_exist_in_db) > 0 and policy == DuplicatePolicy.FAIL:
                 msg = f"Document with ids '{', '.join(ids_exist_in_db)} already exists in index = '{index}'."
                 raise DuplicateDocumentError(msg)
 
-            documents = list(filter(lambda doc: doc.id not in ids_exist_in_db, documents))
+            documents = [doc for doc in documents if doc.id not in ids_exist_in_db]
 
         return documents
 
+    def _existing_ids(self, ids: List[str], index: str) -> List[str]:
+        """
+        Returns which of the given Document ids are already stored, without fetching their payloads or vectors.
+        """
+        if not ids:
+            return []
+        ids_by_point_id = {self.haystack_to_qdrant_converter.convert_id(_id): _id for _id in ids}
+        with self._upsert_lock:
+            records = self.client.retrieve(
+                collection_name=index,
+                ids=list(ids_by_point_id),
+                with_payload=False,
+                with_vectors=False,
+            )
+        return [ids_by_point_id[uuid.UUID(str(record.id)).hex] for record in records]
+
     def _drop_duplicate_documents(self, documents: List[Document], index: Optional[str] = None) -> List[Document]:
         """
         Drop duplicates documents based on same hash ID
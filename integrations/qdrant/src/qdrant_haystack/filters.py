@@ -1,5 +1,7 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Union
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Union
 
 from haystack.utils.filters import COMPARISON_OPERATORS, LOGICAL_OPERATORS, FilterError
 from qdrant_client.http import models
@@ -10,6 +12,20 @@ COMPARISON_OPERATORS = COMPARISON_OPERATORS.keys()
 LOGICAL_OPERATORS = LOGICAL_OPERATORS.keys()
 
 
+def _filter_key(value: Any) -> Hashable:
+    """
+    Builds a hashable key identifying a filter, independently of the order of its dict keys.
+    Types are part of the key, so that for example `1`, `1.0` and `True` or lists and tuples
+    are not mixed up. Raises TypeError if the filter holds unhashable values.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((key, _filter_key(item)) for key, item in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_filter_key(item) for item in value))
+    hash(value)
+    return (type(value), value)
+
+
 class BaseFilterConverter(ABC):
     """Converts Haystack filters to a format accepted by an external tool."""
 
@@ -21,13 +37,50 @@ class BaseFilterConverter(ABC):
 class QdrantFilterConverter(BaseFilterConverter):
     """Converts Haystack filters to the format used by Qdrant."""
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 256):
+        """
+        :param cache_size: Number of converted filters to keep, the least recently used ones are dropped first.
+            Pipelines usually send the same filters over and over, and building the Qdrant models is
+            much slower than looking them up. Set to 0 to disable the cache.
+        """
         self.haystack_to_qdrant_converter = HaystackToQdrant()
+        self.cache_size = cache_size
+        self._cache: OrderedDict[Hashable, Optional[models.Filter]] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def convert(
         self,
         filter_term: Optional[Union[List[dict], dict]] = None,
     ) -> Optional[models.Filter]:
+        """
+        Converts Haystack filters to a Qdrant filter.
+
+        Converted filters are cached, so the returned filter may be shared between calls and must not be modified.
+        """
+        if not filter_term:
+            return None
+        if self.cache_size <= 0:
+            return self._convert(filter_term)
+
+        try:
+            key = _filter_key(filter_term)
+        except TypeError:
+            # Values like DataFrames can't be hashed
+            return self._convert(filter_term)
+
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        qdrant_filter = self._convert(filter_term)
+        with self._cache_lock:
+            self._cache[key] = qdrant_filter
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return qdrant_filter
+
+    def _convert(self, filter_term: Union[List[dict], dict]) -> Optional[models.Filter]:
         if not filter_term:
             return None
 
@@ -47,11 +100,11 @@ class QdrantFilterConverter(BaseFilterConverter):
                 raise FilterError(msg)
 
             if operator == "AND":
-                must_clauses.append(self.convert(item.get("conditions", [])))
+                must_clauses.append(self._convert(item.get("conditions", [])))
             elif operator == "OR":
-                should_clauses.append(self.convert(item.get("conditions", [])))
+                should_clauses.append(self._convert(item.get("conditions", [])))
             elif operator == "NOT":
-                must_not_clauses.append(self.convert(item.get("conditions", [])))
+                must_not_clauses.append(self._convert(item.get("conditions", [])))
             elif operator in COMPARISON_OPERATORS:
                 field = item.get("field")
                 value = item.get("value")
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from haystack import Document, component, default_from_dict, default_to_dict
 
@@ -18,6 +18,7 @@ class QdrantEmbeddingRetriever:
         top_k: int = 10,
         scale_score: bool = True,  # noqa: FBT001, FBT002
         return_embedding: bool = False,  # noqa: FBT001, FBT002
+        search_params: Optional[Dict[str, Any]] = None,
     ):
         """
         Create a QdrantEmbeddingRetriever component.
@@ -27,6 +28,8 @@ class QdrantEmbeddingRetriever:
         :param top_k: The maximum number of documents to retrieve. Default is 10.
         :param scale_score: Whether to scale the scores of the retrieved documents or not. Default is True.
         :param return_embedding: Whether to return the embedding of the retrieved Documents. Default is False.
+        :param search_params: Qdrant search parameters, such as `hnsw_ef`, `exact` or the `quantization`
+            `rescore` and `oversampling` settings. Defaults to the search parameters of the document store.
 
         :raises ValueError: If 'document_store' is not an instance of QdrantDocumentStore.
         """
@@ -41,6 +44,7 @@ class QdrantEmbeddingRetriever:
         self._top_k = top_k
         self._scale_score = scale_score
         self._return_embedding = return_embedding
+        self._search_params = search_params
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -53,6 +57,7 @@ class QdrantEmbeddingRetriever:
             top_k=self._top_k,
             scale_score=self._scale_score,
             return_embedding=self._return_embedding,
+            search_params=self._search_params,
         )
         d["init_parameters"]["document_store"] = self._document_store.to_dict()
 
@@ -75,6 +80,7 @@ class QdrantEmbeddingRetriever:
         top_k: Optional[int] = None,
         scale_score: Optional[bool] = None,
         return_embedding: Optional[bool] = None,
+        search_params: Optional[Dict[str, Any]] = None,
     ):
         """
         Run the Embedding Retriever on the given input data.
@@ -84,6 +90,7 @@ class QdrantEmbeddingRetriever:
         :param top_k: The maximum number of documents to return.
         :param scale_score: Whether to scale the scores of the retrieved documents or not.
         :param return_embedding: Whether to return the embedding of the retrieved Documents.
+        :param search_params: Qdrant search parameters, overriding the ones of the retriever.
         :return: The retrieved documents.
 
         """
@@ -93,6 +100,177 @@ class QdrantEmbeddingRetriever:
             top_k=top_k or self._top_k,
             scale_score=scale_score or self._scale_score,
             return_embedding=return_embedding or self._return_embedding,
+            search_params=search_params or self._search_params,
+        )
+
+        return {"documents": docs}
+
+    def run_batch(
+        self,
+        query_embeddings: List[List[float]],
+        filters: Optional[Union[Dict[str, Any], List[Optional[Dict[str, Any]]]]] = None,
+        top_k: Optional[Union[int, List[int]]] = None,
+        scale_score: Optional[bool] = None,
+        return_embedding: Optional[bool] = None,
+        search_params: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+    ) -> Dict[str, List[List[Document]]]:
+        """
+        Retrieve documents for many query embeddings at once.
+
+        The queries are sent with Qdrant's `search_batch`, saving one round trip per query.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param filters: Filters applied to every query, or a list with the filters of each query.
+        :param top_k: Maximum number of Documents returned for every query, or a list with the value of each query.
+        :param scale_score: Whether to scale the scores of the retrieved documents or not.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents.
+        :param search_params: Qdrant search parameters, overriding the ones of the retriever.
+        :param batch_size: Maximum number of queries sent in a single request, defaults to 100.
+        :return: One list of Documents for each query embedding, in the same order as `query_embeddings`.
+        """
+        docs = self._document_store.query_by_embedding_batch(
+            query_embeddings=query_embeddings,
+            filters=filters or self._filters,
+            top_k=top_k or self._top_k,
+            scale_score=scale_score or self._scale_score,
+            return_embedding=return_embedding or self._return_embedding,
+            search_params=search_params or self._search_params,
+            batch_size=batch_size,
+        )
+
+        return {"documents": docs}
+
+    async def run_async(
+        self,
+        query_embedding: List[float],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        scale_score: Optional[bool] = None,
+        return_embedding: Optional[bool] = None,
+        search_params: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Asynchronously run the Embedding Retriever on the given input data.
+
+        :param query_embedding: Embedding of the query.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The maximum number of documents to return.
+        :param scale_score: Whether to scale the scores of the retrieved documents or not.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents.
+        :param search_params: Qdrant search parameters, overriding the ones of the retriever.
+        :return: The retrieved documents.
+
+        """
+        docs = await self._document_store.query_by_embedding_async(
+            query_embedding=query_embedding,
+            filters=filters or self._filters,
+            top_k=top_k or self._top_k,
+            scale_score=scale_score or self._scale_score,
+            return_embedding=return_embedding or self._return_embedding,
+            search_params=search_params or self._search_params,
+        )
+
+        return {"documents": docs}
+
+
+@component
+class QdrantHybridRetriever:
+    """
+    A component for retrieving documents from a QdrantDocumentStore with both a dense and a sparse
+    query embedding, fusing the results of the two searches with reciprocal rank fusion.
+
+    The document store must be configured with a `vector_name` and at least one of `sparse_vectors`.
+    """
+
+    def __init__(
+        self,
+        document_store: QdrantDocumentStore,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        return_embedding: bool = False,  # noqa: FBT001, FBT002
+        sparse_vector_name: Optional[str] = None,
+        rrf_k: int = 60,
+    ):
+        """
+        Create a QdrantHybridRetriever component.
+
+        :param document_store: An instance of QdrantDocumentStore.
+        :param filters: A dictionary with filters to narrow down the search space. Default is None.
+        :param top_k: The maximum number of documents to retrieve. Default is 10.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents. Default is False.
+        :param sparse_vector_name: The sparse vector to search. Defaults to the first sparse vector of the store.
+        :param rrf_k: The rank constant of the reciprocal rank fusion. Default is 60.
+
+        :raises ValueError: If 'document_store' is not an instance of QdrantDocumentStore.
+        """
+
+        if not isinstance(document_store, QdrantDocumentStore):
+            msg = "document_store must be an instance of QdrantDocumentStore"
+            raise ValueError(msg)
+
+        self._document_store = document_store
+
+        self._filters = filters
+        self._top_k = top_k
+        self._return_embedding = return_embedding
+        self._sparse_vector_name = sparse_vector_name
+        self._rrf_k = rrf_k
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize this component to a dictionary.
+        """
+        d = default_to_dict(
+            self,
+            document_store=self._document_store,
+            filters=self._filters,
+            top_k=self._top_k,
+            return_embedding=self._return_embedding,
+            sparse_vector_name=self._sparse_vector_name,
+            rrf_k=self._rrf_k,
+        )
+        d["init_parameters"]["document_store"] = self._document_store.to_dict()
+
+        return d
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QdrantHybridRetriever":
+        """
+        Deserialize this component from a dictionary.
+        """
+        document_store = QdrantDocumentStore.from_dict(data["init_parameters"]["document_store"])
+        data["init_parameters"]["document_store"] = document_store
+        return default_from_dict(cls, data)
+
+    @component.output_types(documents=List[Document])
+    def run(
+        self,
+        query_embedding: List[float],
+        query_sparse_embedding: Dict[str, List],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        return_embedding: Optional[bool] = None,
+    ):
+        """
+        Run the Hybrid Retriever on the given input data.
+
+        :param query_embedding: Dense embedding of the query.
+        :param query_sparse_embedding: Sparse embedding of the query, a dict with "indices" and "values" lists.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The maximum number of documents to return.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents.
+        :return: The retrieved documents, scored by reciprocal rank fusion.
+
+        """
+        docs = self._document_store.query_hybrid(
+            query_embedding=query_embedding,
+            query_sparse_embedding=query_sparse_embedding,
+            filters=filters or self._filters,
+            top_k=top_k or self._top_k,
+            return_embedding=return_embedding or self._return_embedding,
+            sparse_vector_name=self._sparse_vector_name,
+            rrf_k=self._rrf_k,
         )
 
         return {"documents": docs}
@@ -51,3 +51,36 @@ def test_point_to_document_reverts_proper_structure_from_record(
     assert "text" == document.content_type
     assert {"test_field": 1} == document.meta
     assert 0.0 == np.sum(np.array([1.0, 0.0, 0.0, 0.0]) - document.embedding)
+
+
+def test_points_to_documents(qdrant_to_haystack: QdrantToHaystack):
+    points = [
+        rest.ScoredPoint(
+            id="c7c62e8e-02b9-4ec6-9f88-46bd97b628b7",
+            version=1,
+            score=0.5,
+            payload={"id": "my-id", "content": "Lorem ipsum", "dataframe": None, "blob": None, "meta": {"a": 1}},
+            vector=[1.0, 0.0],
+        ),
+        rest.ScoredPoint(
+            id="0f3c8c4e-02b9-4ec6-9f88-46bd97b628b7",
+            version=1,
+            score=0.25,
+            payload={"id": "legacy-id", "content": "Dolor", "content_type": "text", "meta": {"b": 2}},
+            vector=[0.0, 1.0],
+        ),
+    ]
+
+    documents = qdrant_to_haystack.points_to_documents(points)
+
+    assert [doc.id for doc in documents] == ["my-id", "legacy-id"]
+    assert [doc.content for doc in documents] == ["Lorem ipsum", "Dolor"]
+    assert [doc.meta for doc in documents] == [{"a": 1}, {"b": 2}]
+    assert [doc.score for doc in documents] == [0.5, 0.25]
+    assert [doc.embedding for doc in documents] == [[1.0, 0.0], [0.0, 1.0]]
+    assert documents[0] == qdrant_to_haystack.point_to_document(points[0])
+
+    documents = qdrant_to_haystack.points_to_documents(points, scores=[1.0, 0.0], return_embedding=False)
+
+    assert [doc.score for doc in documents] == [1.0, 0.0]
+    assert all(doc.embedding is None for doc in documents)
@@ -41,6 +41,14 @@ def test_to_dict():
             "metadata": {},
             "write_batch_size": 100,
             "scroll_size": 10000,
+            "write_concurrency": 1,
+            "vector_name": None,
+            "named_vectors": None,
+            "sparse_vectors": None,
+            "on_disk": None,
+            "search_params": None,
+            "payload_indexes": None,
+            "on_unindexed_filter": None,
         },
     }
 
@@ -70,6 +78,7 @@ def test_from_dict():
                 "metadata": {},
                 "write_batch_size": 1000,
                 "scroll_size": 10000,
+                "write_concurrency": 4,
             },
         }
     )
@@ -98,5 +107,6 @@ def test_from_dict():
             document_store.metadata == {},
             document_store.write_batch_size == 1000,
             document_store.scroll_size == 10000,
+            document_store.write_concurrency == 4,
         ]
     )
@@ -1,5 +1,8 @@
+import asyncio
 from typing import List
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 from haystack import Document
 from haystack.document_stores import DuplicatePolicy
@@ -9,8 +12,10 @@ from haystack.testing.document_store import (
     DeleteDocumentsTest,
     WriteDocumentsTest,
 )
+from qdrant_client.http import models as rest
 
 from qdrant_haystack import QdrantDocumentStore
+from qdrant_haystack.document_store import QdrantStoreError
 
 
 class TestQdrantStoreBaseTests(CountDocumentsTest, WriteDocumentsTest, DeleteDocumentsTest):
@@ -40,3 +45,236 @@ class TestQdrantStoreBaseTests(CountDocumentsTest, WriteDocumentsTest, DeleteDoc
         assert document_store.write_documents(docs) == 1
         with pytest.raises(DuplicateDocumentError):
             document_store.write_documents(docs, DuplicatePolicy.FAIL)
+
+    def test_write_documents_concurrently(self):
+        document_store = QdrantDocumentStore(
+            ":memory:",
+            recreate_index=True,
+            embedding_dim=4,
+            write_batch_size=10,
+            write_concurrency=4,
+        )
+        docs = [Document(id=str(i), content=f"doc {i}", embedding=[0.1, 0.2, 0.3, float(i)]) for i in range(95)]
+        assert document_store.write_documents(docs) == 95
+        assert document_store.count_documents() == 95
+
+    @pytest.mark.parametrize("vector_name", [None, "dense"])
+    def test_write_documents_with_numpy_embeddings(self, vector_name):
+        document_store = QdrantDocumentStore(":memory:", embedding_dim=3, vector_name=vector_name)
+        # embedders with an embedding_dtype set the rows of a NumPy matrix as embeddings
+        embeddings = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype="float16")
+        docs = [Document(id=str(i), content=f"doc {i}") for i in range(2)]
+        for doc, embedding in zip(docs, embeddings):
+            doc.embedding = embedding
+
+        assert document_store.write_documents(docs) == 2
+        assert document_store.query_by_embedding([0.0, 1.0, 0.0], top_k=1)[0].id == "1"
+
+    def test_write_documents_concurrently_reports_failed_batches(self, monkeypatch):
+        document_store = QdrantDocumentStore(
+            ":memory:",
+            recreate_index=True,
+            embedding_dim=4,
+            write_batch_size=10,
+            write_concurrency=2,
+        )
+        upsert = document_store.client.upsert
+
+        def failing_upsert(collection_name, points, **kwargs):
+            if any(point.payload["id"] == "42" for point in points):
+                msg = "upsert failed"
+                raise RuntimeError(msg)
+            return upsert(collection_name=collection_name, points=points, **kwargs)
+
+        monkeypatch.setattr(document_store.client, "upsert", failing_upsert)
+        docs = [Document(id=str(i), content=f"doc {i}", embedding=[0.1, 0.2, 0.3, float(i)]) for i in range(50)]
+        with pytest.raises(QdrantStoreError, match=r"batch 4 .*first id '40'"):
+            document_store.write_documents(docs)
+        assert document_store.count_documents() == 40
+
+    def test_write_concurrency_must_be_positive(self):
+        with pytest.raises(ValueError):
+            QdrantDocumentStore(":memory:", write_concurrency=0)
+
+    def test_count_documents_async(self, document_store: QdrantDocumentStore):
+        document_store.write_documents([Document(content="test doc 1"), Document(content="test doc 2")])
+        assert asyncio.run(document_store.count_documents_async()) == 2
+
+    def test_query_by_embedding_batch(self):
+        document_store = QdrantDocumentStore(":memory:", embedding_dim=4, similarity="dot_product")
+        document_store.write_documents(
+            [
+                Document(content=f"doc {i}", embedding=[float(i), 1.0, 0.0, 0.0], meta={"even": i % 2 == 0})
+                for i in range(10)
+            ]
+        )
+        queries = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [-1.0, 0.0, 0.0, 0.0]]
+
+        results = document_store.query_by_embedding_batch(queries, top_k=3, batch_size=2)
+
+        assert len(results) == 3
+        for query, documents in zip(queries, results):
+            expected = document_store.query_by_embedding(query, top_k=3)
+            assert [doc.id for doc in documents] == [doc.id for doc in expected]
+            assert [doc.score for doc in documents] == pytest.approx([doc.score for doc in expected])
+
+    def test_query_by_embedding_batch_per_query_parameters(self):
+        document_store = QdrantDocumentStore(":memory:", embedding_dim=4)
+        document_store.write_documents(
+            [
+                Document(content=f"doc {i}", embedding=[float(i), 1.0, 0.0, 0.0], meta={"even": i % 2 == 0})
+                for i in range(10)
+            ]
+        )
+        filters = [
+            {"field": "meta.even", "operator": "==", "value": True},
+            None,
+        ]
+
+        results = document_store.query_by_embedding_batch(
+            [[1.0, 0.0, 0.0, 0.0]] * 2, filters=filters, top_k=[2, 7], return_embedding=True
+        )
+
+        assert len(results[0]) == 2
+        assert all(doc.meta["even"] for doc in results[0])
+        assert len(results[1]) == 7
+        assert all(doc.embedding is not None for doc in results[1])
+
+        with pytest.raises(ValueError):
+            document_store.query_by_embedding_batch([[1.0, 0.0, 0.0, 0.0]], top_k=[1, 2])
+
+    def test_write_documents_from_generator(self, document_store: QdrantDocumentStore):
+        document_store.write_batch_size = 10
+        document_store.write_documents([Document(id=str(i), content=f"doc {i}") for i in range(0, 30, 2)])
+        retrieve = document_store.client.retrieve
+        retrieved_batches = []
+
+        def spy(*args, **kwargs):
+            retrieved_batches.append(kwargs)
+            return retrieve(*args, **kwargs)
+
+        document_store.client.retrieve = spy
+        documents = (Document(id=str(i), content=f"doc {i}") for i in range(30))
+
+        assert document_store.write_documents(documents, policy=DuplicatePolicy.SKIP) == 15
+        assert document_store.count_documents() == 30
+        assert [len(kwargs["ids"]) for kwargs in retrieved_batches] == [10, 10, 10]
+        assert all(not kwargs["with_payload"] and not kwargs["with_vectors"] for kwargs in retrieved_batches)
+
+    def test_write_documents_from_generator_fail_on_duplicate(self, document_store: QdrantDocumentStore):
+        document_store.write_documents([Document(id="5", content="doc 5")])
+
+        with pytest.raises(DuplicateDocumentError):
+            document_store.write_documents(
+                (Document(id=str(i), content=f"doc {i}") for i in range(10)), policy=DuplicatePolicy.FAIL
+            )
+
+    def test_named_and_sparse_vectors(self):
+        document_store = QdrantDocumentStore(
+            ":memory:",
+            embedding_dim=2,
+            vector_name="dense",
+            named_vectors={"title": 3},
+            sparse_vectors=["keywords"],
+            return_embedding=True,
+        )
+        document_store.write_documents(
+            [
+                Document(
+                    id=str(i),
+                    content=f"doc {i}",
+                    embedding=[1.0, float(i)],
+                    meta={"title": [float(i), 0.0, 1.0], "keywords": {"indices": [i], "values": [1.0]}, "n": i},
+                )
+                for i in range(5)
+            ]
+        )
+
+        document = document_store.query_by_embedding([1.0, 4.0], top_k=1, return_embedding=True)[0]
+        assert document.embedding == pytest.approx([0.24253562, 0.9701425])
+        assert document.meta["n"] == 4
+        assert document.meta["title"] == pytest.approx([0.9701425, 0.0, 0.24253562])
+        assert document.meta["keywords"] == {"indices": [4], "values": [1.0]}
+
+        assert document_store.query_by_embedding([3.0, 0.0, 1.0], top_k=1, vector_name="title")[0].id == "3"
+        async_results = asyncio.run(
+            document_store.query_by_embedding_async([3.0, 0.0, 1.0], top_k=1, vector_name="title")
+        )
+        assert async_results[0].id == "3"
+        sparse_results = document_store.query_by_sparse_embedding({"indices": [2], "values": [0.5]}, top_k=3)
+        assert [doc.id for doc in sparse_results] == ["2"]
+        assert sparse_results[0].score == 0.5
+
+    def test_query_hybrid(self):
+        document_store = QdrantDocumentStore(
+            ":memory:", embedding_dim=2, vector_name="dense", sparse_vectors=["keywords"]
+        )
+        document_store.write_documents(
+            [
+                Document(
+                    id="dense", content="a", embedding=[1.0, 0.0], meta={"keywords": {"indices": [9], "values": [1.0]}}
+                ),
+                Document(
+                    id="both", content="b", embedding=[0.9, 0.1], meta={"keywords": {"indices": [1], "values": [0.5]}}
+                ),
+                Document(
+                    id="sparse", content="c", embedding=[0.0, 1.0], meta={"keywords": {"indices": [1], "values": [1.0]}}
+                ),
+            ]
+        )
+
+        documents = document_store.query_hybrid([1.0, 0.0], {"indices": [1], "values": [1.0]}, top_k=2, rrf_k=1)
+
+        assert [doc.id for doc in documents] == ["both", "dense"]
+        assert documents[0].score == pytest.approx(1 / 3 + 1 / 3)
+        assert documents[1].score == pytest.approx(1 / 2)
+
+    def test_named_vectors_require_vector_name(self):
+        with pytest.raises(ValueError):
+            QdrantDocumentStore(":memory:", sparse_vectors=["keywords"])
+
+    def test_payload_indexes_created_once(self):
+        document_store = QdrantDocumentStore(":memory:", payload_indexes={"meta.category": "keyword"})
+
+        with patch.object(document_store.client, "create_payload_index") as create_payload_index:
+            document_store._set_up_collection("Document", 768, False, "cosine")
+            document_store._set_up_collection("Document", 768, True, "cosine")
+
+        create_payload_index.assert_called_once_with(
+            collection_name="Document",
+            field_name="meta.category",
+            field_schema=rest.PayloadSchemaType.KEYWORD,
+            wait=True,
+        )
+
+    def test_unindexed_filter_policy(self, caplog):
+        document_store = QdrantDocumentStore(
+            ":memory:", payload_indexes={"meta.category": "keyword"}, on_unindexed_filter="create"
+        )
+        filters = {
+            "operator": "AND",
+            "conditions": [
+                {"field": "meta.category", "operator": "==", "value": "news"},
+                {"field": "meta.year", "operator": ">", "value": 2000},
+                {"field": "meta.published", "operator": "in", "value": [True]},
+            ],
+        }
+
+        with patch.object(document_store.client, "create_payload_index") as create_payload_index:
+            document_store.filter_documents(filters)
+            document_store.filter_documents(filters)
+        assert {(c.kwargs["field_name"], c.kwargs["field_schema"]) for c in create_payload_index.call_args_list} == {
+            ("meta.year", rest.PayloadSchemaType.FLOAT),
+            ("meta.published", rest.PayloadSchemaType.BOOL),
+        }
+
+        document_store.on_unindexed_filter = "warn"
+        document_store.filter_documents({"field": "meta.author", "operator": "==", "value": "x"})
+        document_store.filter_documents({"field": "meta.author", "operator": "==", "value": "y"})
+        assert sum("meta.author" in record.message for record in caplog.records) == 1
+
+    def test_invalid_payload_index_config(self):
+        with pytest.raises(ValueError):
+            QdrantDocumentStore(":memory:", on_unindexed_filter="fail")
+        with pytest.raises(ValueError):
+            QdrantDocumentStore(":memory:", payload_indexes={"meta.category": "unknown"})
@@ -6,6 +6,7 @@ from haystack.testing.document_store import FilterDocumentsTest
 from haystack.utils.filters import FilterError
 
 from qdrant_haystack import QdrantDocumentStore
+from qdrant_haystack.filters import QdrantFilterConverter
 
 
 class TestQdrantStoreBaseTests(FilterDocumentsTest):
@@ -113,3 +114,36 @@ class TestQdrantStoreBaseTests(FilterDocumentsTest):
     @pytest.mark.skip(reason="Cannot distinguish errors yet")
     def test_missing_top_level_operator_key(self, document_store, filterable_docs):
         ...
+
+
+class TestQdrantFilterConverterCache:
+    def test_convert_reuses_cached_filters(self):
+        converter = QdrantFilterConverter()
+        filters = {
+            "operator": "AND",
+            "conditions": [
+                {"field": "meta.number", "operator": "==", "value": 1},
+                {"field": "meta.name", "operator": "==", "value": "name_0"},
+            ],
+        }
+        reordered = {"conditions": filters["conditions"], "operator": "AND"}
+
+        assert converter.convert(filters) is converter.convert(reordered)
+        assert converter.convert(filters) is not converter.convert(
+            {"operator": "AND", "conditions": [{"field": "meta.number", "operator": "==", "value": True}]}
+        )
+
+    def test_convert_does_not_mix_up_value_types(self):
+        converter = QdrantFilterConverter()
+        converter.convert({"field": "meta.number", "operator": "in", "value": [1, 2]})
+
+        with pytest.raises(FilterError):
+            converter.convert({"field": "meta.number", "operator": "in", "value": (1, 2)})
+
+    def test_cache_size(self):
+        converter = QdrantFilterConverter(cache_size=2)
+        for number in range(3):
+            converter.convert({"field": "meta.number", "operator": "==", "value": number})
+
+        assert len(converter._cache) == 2
+        assert QdrantFilterConverter(cache_size=0).convert({"field": "meta.number", "operator": "==", "value": 1})
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List
 
 from haystack.dataclasses import Document
@@ -7,7 +8,7 @@ from haystack.testing.document_store import (
 )
 
 from qdrant_haystack import QdrantDocumentStore
-from qdrant_haystack.retriever import QdrantEmbeddingRetriever
+from qdrant_haystack.retriever import QdrantEmbeddingRetriever, QdrantHybridRetriever
 
 
 class TestQdrantRetriever(FilterableDocsFixtureMixin):
@@ -63,12 +64,21 @@ class TestQdrantRetriever(FilterableDocsFixtureMixin):
                         "metadata": {},
                         "write_batch_size": 100,
                         "scroll_size": 10000,
+                        "write_concurrency": 1,
+                        "vector_name": None,
+                        "named_vectors": None,
+                        "sparse_vectors": None,
+                        "on_disk": None,
+                        "search_params": None,
+                        "payload_indexes": None,
+                        "on_unindexed_filter": None,
                     },
                 },
                 "filters": None,
                 "top_k": 10,
                 "scale_score": True,
                 "return_embedding": False,
+                "search_params": None,
             },
         }
 
@@ -111,3 +121,105 @@ class TestQdrantRetriever(FilterableDocsFixtureMixin):
 
         for document in results["documents"]:  # type: ignore
             assert document.embedding is None
+
+    def test_run_batch(self, filterable_docs: List[Document]):
+        document_store = QdrantDocumentStore(location=":memory:", index="Boi")
+
+        document_store.write_documents(filterable_docs)
+
+        retriever = QdrantEmbeddingRetriever(document_store=document_store)
+
+        results = retriever.run_batch(
+            query_embeddings=[_random_embeddings(768), _random_embeddings(768)], top_k=[10, 5]
+        )
+
+        assert [len(documents) for documents in results["documents"]] == [10, 5]
+        for documents in results["documents"]:
+            assert all(0 <= document.score <= 1 for document in documents)
+
+    def test_run_with_search_params(self, filterable_docs: List[Document]):
+        document_store = QdrantDocumentStore(
+            location=":memory:",
+            index="Boi",
+            on_disk=True,
+            quantization_config={"scalar": {"type": "int8", "always_ram": True}},
+            search_params={"hnsw_ef": 32},
+        )
+        document_store.write_documents(filterable_docs)
+        search = document_store.client.search
+        search_params = []
+
+        def spy(*args, **kwargs):
+            search_params.append(kwargs["search_params"])
+            return search(*args, **kwargs)
+
+        document_store.client.search = spy
+        retriever = QdrantEmbeddingRetriever(
+            document_store=document_store, search_params={"quantization": {"rescore": True, "oversampling": 2.0}}
+        )
+
+        results = retriever.run(query_embedding=_random_embeddings(768))
+        retriever.run(query_embedding=_random_embeddings(768), search_params={"exact": True})
+        QdrantEmbeddingRetriever(document_store=document_store).run(query_embedding=_random_embeddings(768))
+
+        assert len(results["documents"]) == 10
+        assert search_params[0].quantization.rescore is True
+        assert search_params[0].quantization.oversampling == 2.0
+        assert search_params[1].exact is True
+        assert search_params[2].hnsw_ef == 32
+        assert document_store.client.get_collection("Boi").config.params.vectors.on_disk is True
+
+    def test_run_async(self, filterable_docs: List[Document]):
+        document_store = QdrantDocumentStore(location=":memory:", index="Boi")
+
+        document_store.write_documents(filterable_docs)
+
+        retriever = QdrantEmbeddingRetriever(document_store=document_store)
+
+        async def retrieve():
+            return await asyncio.gather(
+                retriever.run_async(query_embedding=_random_embeddings(768)),
+                retriever.run_async(query_embedding=_random_embeddings(768), top_k=5),
+            )
+
+        first, second = asyncio.run(retrieve())
+
+        assert len(first["documents"]) == 10
+        assert len(second["documents"]) == 5
+
+
+class TestQdrantHybridRetriever:
+    def test_run(self):
+        document_store = QdrantDocumentStore(
+            location=":memory:", index="Boi", embedding_dim=2, vector_name="dense", sparse_vectors=["keywords"]
+        )
+        document_store.write_documents(
+            [
+                Document(
+                    content=f"doc {i}", embedding=[1.0, float(i)], meta={"keywords": {"indices": [i], "values": [1.0]}}
+                )
+                for i in range(20)
+            ]
+        )
+
+        retriever = QdrantHybridRetriever(document_store=document_store, top_k=5)
+        results = retriever.run(query_embedding=[1.0, 0.0], query_sparse_embedding={"indices": [3], "values": [1.0]})
+
+        assert len(results["documents"]) == 5
+        assert "doc 3" in [doc.content for doc in results["documents"]]
+        assert all(doc.embedding is None for doc in results["documents"])
+
+    def test_to_dict_from_dict(self):
+        document_store = QdrantDocumentStore(
+            location=":memory:", index="test", vector_name="dense", sparse_vectors=["kw"]
+        )
+        retriever = QdrantHybridRetriever(document_store=document_store, top_k=5, rrf_k=10)
+
+        data = retriever.to_dict()
+
+        assert data["type"] == "qdrant_haystack.retriever.QdrantHybridRetriever"
+        assert data["init_parameters"]["rrf_k"] == 10
+        assert data["init_parameters"]["document_store"]["init_parameters"]["sparse_vectors"] == ["kw"]
+        retriever = QdrantHybridRetriever.from_dict(data)
+        assert retriever._top_k == 5
+        assert retriever._document_store.vector_name == "dense"
@@ -1,26 +1,142 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import hashlib
+import json
 import logging
 import os
-from collections import defaultdict
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, Generator, List, Literal, Optional, Tuple, Union
 
 from haystack import Document, component, default_to_dict
 from tqdm import tqdm
 from unstructured.documents.elements import Element  # type: ignore[import]
 from unstructured.partition.api import partition_via_api  # type: ignore[import]
+from unstructured.staging.base import convert_to_dict, elements_from_json  # type: ignore[import]
 
 logger = logging.getLogger(__name__)
 
 UNSTRUCTURED_HOSTED_API_URL = "https://api.unstructured.io/general/v0/general"
 
 
+class _RateLimiter:
+    """
+    Spaces calls evenly so that at most `rate` of them start per second, across threads.
+    """
+
+    def __init__(self, rate: Optional[float]):
+        self.interval = 1 / rate if rate else 0.0
+        self._next_call = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            call_at = max(now, self._next_call)
+            self._next_call = call_at + self.interval
+        time.sleep(call_at - now)
+
+
+class _ConversionCache:
+    """
+    Stores the elements of converted files as JSON files in a directory, keyed by a hash of the file.
+
+    When the directory grows over `max_size` bytes, the least recently used entries are removed
+    until it is back under 90% of `max_size`.
+    """
+
+    def __init__(self, cache_dir: Union[str, os.PathLike], max_size: Optional[int], salt: str):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.salt = salt.encode()
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def key(self, filepath: Path) -> str:
+        """
+        Hashes the content and the path of the file, with the salt.
+        The path is part of the key because Unstructured puts it in the metadata of the elements.
+        """
+        digest = hashlib.sha256(self.salt)
+        digest.update(str(filepath).encode())
+        with open(filepath, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[Element]]:
+        entry = self.cache_dir / f"{key}.json"
+        try:
+            elements = elements_from_json(filename=str(entry))
+            # Refresh the access time used for the eviction
+            os.utime(entry)
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable conversion cache entry {entry}. Error: {e}")
+            return None
+        return elements
+
+    def put(self, key: str, elements: List[Element]):
+        entry = self.cache_dir / f"{key}.json"
+        tmp_entry = self.cache_dir / f"{key}.{threading.get_ident()}.tmp"
+        tmp_entry.write_text(json.dumps(convert_to_dict(elements)), encoding="utf-8")
+        size = tmp_entry.stat().st_size
+        os.replace(tmp_entry, entry)
+        if self.max_size is None:
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(path.stat().st_size for path in self.cache_dir.glob("*.json"))
+            else:
+                self._size += size
+            if self._size > self.max_size:
+                self._evict()
+
+    def _evict(self):
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        self._size = sum(size for _, size, _ in entries)
+        target = 0.9 * self.max_size
+        for _, size, path in entries:
+            if self._size <= target:
+                break
+            path.unlink(missing_ok=True)
+            self._size -= size
+
+
+def _partition_locally(filepath: str, unstructured_kwargs: Dict[str, Any]) -> List[Element]:
+    """
+    Partitions a file with the `unstructured` library. Runs in the worker processes of the "local" backend.
+    """
+    # Importing all the partitioners is slow, only the worker processes need them
+    from unstructured.partition.auto import partition  # type: ignore[import]
+
+    return partition(filename=filepath, **unstructured_kwargs)
+
+
 @component
 class UnstructuredFileConverter:
     """
-    Convert files to Haystack Documents using the Unstructured API (hosted or running locally).
+    Convert files to Haystack Documents using the Unstructured API (hosted or running locally),
+    or using the `unstructured` library in local processes.
     """
 
     def __init__(
@@ -33,6 +149,13 @@ class UnstructuredFileConverter:
         separator: str = "\n\n",
         unstructured_kwargs: Optional[Dict[str, Any]] = None,
         progress_bar: bool = True,  # noqa: FBT001, FBT002
+        concurrency: int = 1,
+        max_retries: int = 0,
+        backoff_factor: float = 1.0,
+        requests_per_second: Optional[float] = None,
+        cache_dir: Optional[str] = None,
+        cache_max_size: Optional[int] = None,
+        backend: Literal["api", "local"] = "api",
     ):
         """
         :param api_url: URL of the Unstructured API. Defaults to the hosted version.
@@ -51,15 +174,55 @@ class UnstructuredFileConverter:
         :param unstructured_kwargs: Additional keyword arguments that are passed to the Unstructured API.
             See https://unstructured-io.github.io/unstructured/api.html.
         :param progress_bar: Show a progress bar for the conversion. Defaults to True.
+        :param concurrency: Number of files sent to the Unstructured API at the same time. Defaults to 1.
+            Increase it to make use of a self-hosted API with several workers.
+        :param max_retries: Number of times the request for a file is retried when it fails. Defaults to 0.
+        :param backoff_factor: Retries wait `backoff_factor * 2 ** (retry - 1)` seconds. Defaults to 1.0.
+        :param requests_per_second: Maximum number of requests per second sent to the API, retries included.
+            Unlimited by default.
+        :param cache_dir: Directory where the elements of converted files are cached.
+            A file is converted again only if its content, its path or `unstructured_kwargs` changed.
+            By default, nothing is cached.
+        :param cache_max_size: Maximum size of the cache in bytes. When it is exceeded,
+            the least recently used entries are removed. Unlimited by default.
+        :param backend: Where files are partitioned.
+            - "api": The files are sent to the Unstructured API at `api_url`.
+            - "local": The files are partitioned by `unstructured.partition.auto.partition` in a pool of
+              `concurrency` processes, with `unstructured_kwargs` as keyword arguments. The `unstructured` extras
+              needed by the file types must be installed. `api_url`, `api_key`, the retries and the rate limit
+              are not used.
         """
+        if concurrency < 1:
+            msg = "concurrency must be a positive integer"
+            raise ValueError(msg)
+        if backend not in ("api", "local"):
+            msg = f"Unknown backend '{backend}', use 'api' or 'local'"
+            raise ValueError(msg)
 
         self.api_url = api_url
         self.document_creation_mode = document_creation_mode
         self.unstructured_kwargs = unstructured_kwargs or {}
         self.separator = separator
         self.progress_bar = progress_bar
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.requests_per_second = requests_per_second
+        self._rate_limiter = _RateLimiter(requests_per_second)
+        self.cache_dir = cache_dir
+        self.cache_max_size = cache_max_size
+        self.backend = backend
+        self._cache = (
+            _ConversionCache(
+                cache_dir,
+                cache_max_size,
+                salt=json.dumps([backend, self.unstructured_kwargs], sort_keys=True, default=str),
+            )
+            if cache_dir
+            else None
+        )
 
-        is_hosted_api = api_url == UNSTRUCTURED_HOSTED_API_URL
+        is_hosted_api = backend == "api" and api_url == UNSTRUCTURED_HOSTED_API_URL
 
         api_key = api_key or os.environ.get("UNSTRUCTURED_API_KEY")
         # we check whether api_key is None or an empty string
@@ -85,41 +248,99 @@ class UnstructuredFileConverter:
             separator=self.separator,
             unstructured_kwargs=self.unstructured_kwargs,
             progress_bar=self.progress_bar,
+            concurrency=self.concurrency,
+            max_retries=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            requests_per_second=self.requests_per_second,
+            cache_dir=self.cache_dir,
+            cache_max_size=self.cache_max_size,
+            backend=self.backend,
         )
 
-    @component.output_types(documents=List[Document])
+    @component.output_types(documents=List[Document], failed_paths=List[str])
     def run(self, paths: Union[List[str], List[os.PathLike]]):
         """
         Convert files to Haystack Documents using the Unstructured API (hosted or running locally).
 
         :param paths: List of paths to convert. Paths can be files or directories.
             If a path is a directory, all files in the directory are converted. Subdirectories are ignored.
+        :return: A dictionary with the following keys:
+            - "documents": The Documents, in the order of the sorted file paths.
+            - "failed_paths": The files that Unstructured could not process, even after retrying.
+              They are logged and still converted, as files without any element.
+        """
+
+        documents = []
+        failed_paths = []
+        for filepath, docs_for_file, failed in self._convert_files(paths):
+            if failed:
+                failed_paths.append(str(filepath))
+            documents.extend(docs_for_file)
+
+        if failed_paths:
+            logger.warning(f"Unstructured could not process {len(failed_paths)} files.")
+
+        return {"documents": documents, "failed_paths": failed_paths}
+
+    def stream(self, paths: Union[List[str], List[os.PathLike]]) -> Generator[Document, None, None]:
         """
+        Convert files to Haystack Documents like `run`, but yield the Documents of each file as soon as
+        it is converted instead of returning all of them at the end.
+
+        Only a few files are converted ahead of the consumer, so memory usage doesn't grow with the number of files.
+        Files that could not be converted are logged.
 
+        :param paths: List of paths to convert. Paths can be files or directories.
+            If a path is a directory, all files in the directory are converted. Subdirectories are ignored.
+        """
+        for _, docs_for_file, _ in self._convert_files(paths):
+            yield from docs_for_file
+
+    def _convert_files(
+        self, paths: Union[List[str], List[os.PathLike]]
+    ) -> Generator[Tuple[Path, List[Document], bool], None, None]:
+        """
+        Converts the files in the order of their sorted paths, `concurrency` at a time.
+
+        :return: For each file, its path, its Documents and whether Unstructured failed to process it.
+        """
         unique_paths = {Path(path) for path in paths}
         filepaths = {path for path in unique_paths if path.is_file()}
         filepaths_in_directories = {
             filepath for path in unique_paths if path.is_dir() for filepath in path.glob("*.*") if filepath.is_file()
         }
 
-        all_filepaths = filepaths.union(filepaths_in_directories)
+        all_filepaths = sorted(filepaths.union(filepaths_in_directories))
+        remaining_filepaths = iter(all_filepaths)
 
-        # currently, the files are converted sequentially to gently handle API failures
-        documents = []
+        # With the local backend, threads look up the cache and hand the files over to the processes
+        process_pool = ProcessPoolExecutor(max_workers=self.concurrency) if self.backend == "local" else None
+        with process_pool or nullcontext(), ThreadPoolExecutor(max_workers=self.concurrency) as executor, tqdm(
+            total=len(all_filepaths), desc="Converting files to Haystack Documents", disable=not self.progress_bar
+        ) as progress_bar:
+            partition_file = partial(self._partition_file_into_elements, process_pool=process_pool)
+            # Keep a bounded number of files in flight and collect them in order, whichever finishes first
+            pending = deque()
+            for filepath in remaining_filepaths:
+                pending.append((filepath, executor.submit(partition_file, filepath)))
+                if len(pending) >= 2 * self.concurrency:
+                    break
 
-        for filepath in tqdm(
-            all_filepaths, desc="Converting files to Haystack Documents", disable=not self.progress_bar
-        ):
-            elements = self._partition_file_into_elements(filepath=filepath)
-            docs_for_file = self._create_documents(
-                filepath=filepath,
-                elements=elements,
-                document_creation_mode=self.document_creation_mode,
-                separator=self.separator,
-            )
-            documents.extend(docs_for_file)
+            while pending:
+                filepath, future = pending.popleft()
+                elements, failed = future.result()
+                next_filepath = next(remaining_filepaths, None)
+                if next_filepath is not None:
+                    pending.append((next_filepath, executor.submit(partition_file, next_filepath)))
 
-        return {"documents": documents}
+                progress_bar.update()
+                docs_for_file = self._create_documents(
+                    filepath=filepath,
+                    elements=elements,
+                    document_creation_mode=self.document_creation_mode,
+                    separator=self.separator,
+                )
+                yield filepath, docs_for_file, failed
 
     def _create_documents(
         self,
@@ -163,15 +384,47 @@ class UnstructuredFileConverter:
 
         return docs
 
-    def _partition_file_into_elements(self, filepath: Path) -> List[Element]:
+    def _partition_file_into_elements(
+        self, filepath: Path, process_pool: Optional[Executor] = None
+    ) -> Tuple[List[Element], bool]:
         """
-        Partition a file into elements using the Unstructured API.
+        Partition a file into elements using the Unstructured API, retrying with exponential backoff,
+        or using `process_pool` with the local backend.
+
+        :return: The elements and whether the file failed.
         """
-        elements = []
-        try:
-            elements = partition_via_api(
-                filename=str(filepath), api_url=self.api_url, api_key=self.api_key, **self.unstructured_kwargs
-            )
-        except Exception as e:
-            logger.warning(f"Unstructured could not process file {filepath}. Error: {e}")
-        return elements
+        cache_key = None
+        if self._cache is not None:
+            cache_key = self._cache.key(filepath)
+            cached_elements = self._cache.get(cache_key)
+            if cached_elements is not None:
+                return cached_elements, False
+
+        if process_pool is not None:
+            try:
+                elements = process_pool.submit(_partition_locally, str(filepath), self.unstructured_kwargs).result()
+            except Exception as e:
+                logger.warning(f"Unstructured could not process file {filepath}. Error: {e}")
+                return [], True
+            if self._cache is not None and cache_key is not None:
+                self._cache.put(cache_key, elements)
+            return elements, False
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.backoff_factor * 2 ** (attempt - 1))
+            self._rate_limiter.wait()
+            try:
+                elements = partition_via_api(
+                    filename=str(filepath), api_url=self.api_url, api_key=self.api_key, **self.unstructured_kwargs
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Unstructured could not process file {filepath} (attempt {attempt + 1}/{self.max_retries + 1}). "
+                    f"Error: {e}"
+                )
+            else:
+                if self._cache is not None and cache_key is not None:
+                    self._cache.put(cache_key, elements)
+                return elements, False
+        return [], True
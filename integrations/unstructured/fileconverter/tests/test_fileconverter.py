@@ -1,9 +1,15 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import json
+import threading
+import time
 from pathlib import Path
+from typing import Dict, List
+from unittest.mock import MagicMock
 
 import pytest
+from unstructured.documents.elements import NarrativeText
 
 from unstructured_fileconverter_haystack import UnstructuredFileConverter
 
@@ -13,6 +19,46 @@ def samples_path():
     return Path(__file__).parent / "samples"
 
 
+API_URL = "http://localhost:8000/general/v0/general"
+
+
+@pytest.fixture
+def mock_partition(monkeypatch):
+    """
+    Replaces the Unstructured API call, answering every file with a single element holding the file name.
+    The first `failures[name]` calls for a file raise an error.
+    """
+    failures: Dict[str, int] = {}
+    threads = set()
+
+    def partition(filename, **kwargs):  # noqa: ARG001
+        threads.add(threading.current_thread().name)
+        time.sleep(0.02)
+        name = Path(filename).name
+        if failures.get(name, 0) > 0:
+            failures[name] -= 1
+            msg = "overloaded"
+            raise ValueError(msg)
+        return [NarrativeText(text=name, element_id=filename)]
+
+    mock = MagicMock(side_effect=partition)
+    mock.failures = failures
+    mock.threads = threads
+    monkeypatch.setattr("unstructured_fileconverter_haystack.fileconverter.partition_via_api", mock)
+    return mock
+
+
+def _requested(mock_partition) -> List[str]:
+    return [call.kwargs["filename"] for call in mock_partition.call_args_list]
+
+
+@pytest.fixture
+def text_files(tmp_path):
+    for i in range(8):
+        (tmp_path / f"file_{i}.txt").write_text(f"text {i}")
+    return tmp_path
+
+
 class TestUnstructuredFileConverter:
     def test_init_default(self):
         converter = UnstructuredFileConverter(api_key="test-api-key")
@@ -50,9 +96,124 @@ class TestUnstructuredFileConverter:
                 "separator": "\n\n",
                 "unstructured_kwargs": {},
                 "progress_bar": True,
+                "concurrency": 1,
+                "max_retries": 0,
+                "backoff_factor": 1.0,
+                "requests_per_second": None,
+                "cache_dir": None,
+                "cache_max_size": None,
+                "backend": "api",
             },
         }
 
+    def test_run_concurrently_keeps_order(self, mock_partition, text_files):
+        converter = UnstructuredFileConverter(api_url=API_URL, concurrency=4, progress_bar=False)
+
+        result = converter.run([text_files])
+
+        assert [doc.content for doc in result["documents"]] == [f"file_{i}.txt" for i in range(8)]
+        assert result["failed_paths"] == []
+        assert len(mock_partition.threads) > 1
+
+    def test_run_retries_and_reports_failures(self, mock_partition, text_files):
+        mock_partition.failures.update({"file_1.txt": 1, "file_2.txt": 5})
+        converter = UnstructuredFileConverter(
+            api_url=API_URL, concurrency=2, max_retries=2, backoff_factor=0.01, progress_bar=False
+        )
+
+        result = converter.run([text_files])
+
+        assert result["failed_paths"] == [str(text_files / "file_2.txt")]
+        assert [doc.content for doc in result["documents"]][:3] == ["file_0.txt", "file_1.txt", ""]
+        assert _requested(mock_partition).count(str(text_files / "file_1.txt")) == 2
+        assert _requested(mock_partition).count(str(text_files / "file_2.txt")) == 3
+
+    @pytest.mark.usefixtures("mock_partition")
+    def test_run_rate_limited(self, text_files):
+        converter = UnstructuredFileConverter(
+            api_url=API_URL, concurrency=8, requests_per_second=40, progress_bar=False
+        )
+
+        start = time.monotonic()
+        converter.run([text_files])
+
+        # 8 requests spaced by 1/40 s
+        assert time.monotonic() - start >= 7 / 40
+
+    def test_stream(self, mock_partition, text_files):
+        converter = UnstructuredFileConverter(api_url=API_URL, concurrency=2, progress_bar=False)
+
+        stream = converter.stream([text_files])
+        assert next(stream).content == "file_0.txt"
+        # Only a few files are converted ahead of the consumer
+        assert mock_partition.call_count <= 5
+        assert [doc.content for doc in stream] == [f"file_{i}.txt" for i in range(1, 8)]
+
+    def test_run_with_cache(self, mock_partition, text_files, tmp_path):
+        converter = UnstructuredFileConverter(api_url=API_URL, cache_dir=str(tmp_path / "cache"), progress_bar=False)
+        first = converter.run([text_files])["documents"]
+        assert mock_partition.call_count == 8
+
+        (text_files / "file_3.txt").write_text("changed")
+        second = converter.run([text_files])["documents"]
+
+        assert _requested(mock_partition)[8:] == [str(text_files / "file_3.txt")]
+        assert [doc.content for doc in second] == [doc.content for doc in first]
+        assert second[0].meta == first[0].meta
+
+        converter = UnstructuredFileConverter(
+            api_url=API_URL,
+            cache_dir=str(tmp_path / "cache"),
+            unstructured_kwargs={"strategy": "fast"},
+            progress_bar=False,
+        )
+        converter.run([text_files / "file_0.txt"])
+        assert mock_partition.call_count == 10
+
+    @pytest.mark.usefixtures("mock_partition")
+    def test_cache_eviction(self, text_files, tmp_path):
+        cache_dir = tmp_path / "cache"
+        converter = UnstructuredFileConverter(
+            api_url=API_URL, cache_dir=str(cache_dir), cache_max_size=1000, progress_bar=False
+        )
+
+        converter.run([text_files])
+
+        sizes = [path.stat().st_size for path in cache_dir.glob("*.json")]
+        assert 0 < len(sizes) < 8
+        assert sum(sizes) <= 1000
+
+    def test_run_local_backend(self, tmp_path):
+        # Unstructured partitions JSON files holding serialized elements without any extra dependency
+        for i in range(4):
+            elements = [
+                {"type": "Title", "element_id": f"{i}-0", "text": f"title {i}", "metadata": {"page_number": 1}},
+                {"type": "NarrativeText", "element_id": f"{i}-1", "text": f"text {i}", "metadata": {"page_number": 2}},
+            ]
+            (tmp_path / f"file_{i}.json").write_text(json.dumps(elements))
+        (tmp_path / "broken.json").write_text("not json")
+
+        converter = UnstructuredFileConverter(
+            backend="local", document_creation_mode="one-doc-per-page", concurrency=2, progress_bar=False
+        )
+        result = converter.run([tmp_path])
+
+        assert result["failed_paths"] == [str(tmp_path / "broken.json")]
+        documents = [doc for doc in result["documents"] if doc.content]
+        assert [doc.content for doc in documents] == [f"{kind} {i}\n\n" for i in range(4) for kind in ("title", "text")]
+        assert [doc.meta["page_number"] for doc in documents] == [1, 2] * 4
+
+    def test_init_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            UnstructuredFileConverter(api_url="http://localhost:8000/general/v0/general", concurrency=0)
+
+    def test_init_local_backend_without_api_key(self, monkeypatch):
+        monkeypatch.delenv("UNSTRUCTURED_API_KEY", raising=False)
+        with pytest.raises(ValueError):
+            UnstructuredFileConverter()
+
+        assert UnstructuredFileConverter(backend="local").backend == "local"
+
     @pytest.mark.integration
     def test_run_one_doc_per_file(self, samples_path):
         pdf_path = samples_path / "sample_pdf.pdf"